@@ -0,0 +1,132 @@
+"""
+Offline Data Acquisition Benchmark
+----------------------------------
+
+Runs run_data_acquisition end to end against the stand-in API
+(benchmarks/stub_api.py) in a temporary working directory and
+reports wall time, the rows written per raw file, the server's
+response counts and the fetch scheduler's per-host stats, so fetch,
+retry and parse behaviour can be measured at any scale, fault rate
+and rate limit without touching the live APIs.
+
+Run from the project root:
+
+    python -m benchmarks.bench_fetch --scale 10
+    python -m benchmarks.bench_fetch --scale 100 --latency-ms 50 \\
+        --rate-limit-rate 0.05 --error-rate 0.02
+    python -m benchmarks.bench_fetch --host-rate 20 --host-concurrency 8 --workers 8
+"""
+
+import argparse
+import contextlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+from src.data_fetcher import run_data_acquisition
+from src.fetch_scheduler import FetchScheduler, HostConfig, set_scheduler
+
+from benchmarks.stub_api import StubAPIServer
+
+
+@contextlib.contextmanager
+def _working_directory(path: Path):
+    previous = Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def run_fetch_benchmark(
+    host_rate: float = 50.0,
+    host_concurrency: int = 4,
+    workers: int = 4,
+    backoff: float = 0.05,
+    **server_options,
+) -> Dict:
+    """
+    Time one full acquisition against a fresh stub server, with a
+    fresh fetch scheduler limited to host_rate requests / second and
+    host_concurrency in-flight requests for the stub host.
+
+    Returns:
+        Dict with seconds, rows per raw file, server counts and the
+        scheduler's per-host stats.
+    """
+    scheduler = FetchScheduler(
+        n_workers=max(workers, host_concurrency),
+        default_config=HostConfig(rate=host_rate, burst=host_rate, max_concurrency=host_concurrency),
+        backoff=backoff,
+    )
+    set_scheduler(scheduler)
+    try:
+        with tempfile.TemporaryDirectory() as tmp, StubAPIServer(**server_options) as server:
+            server.install()
+            with _working_directory(Path(tmp)):
+                start = time.perf_counter()
+                run_data_acquisition(max_workers=workers)
+                elapsed = time.perf_counter() - start
+
+                rows = {
+                    path.stem: sum(1 for _ in open(path)) - 1
+                    for path in sorted(Path("data/raw").glob("*.csv"))
+                }
+
+            return {
+                "seconds": elapsed,
+                "rows": rows,
+                "server": server.stats(),
+                "hosts": scheduler.stats(),
+            }
+    finally:
+        set_scheduler(None)
+        scheduler.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark data acquisition offline.")
+    parser.add_argument("--scale", type=float, default=10.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=0.0)
+    parser.add_argument("--max-per-page", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--host-rate", type=float, default=50.0)
+    parser.add_argument("--host-concurrency", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    results = run_fetch_benchmark(
+        scale=args.scale,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_rate=args.rate_limit_rate,
+        error_rate=args.error_rate,
+        retry_after=args.retry_after,
+        max_per_page=args.max_per_page,
+        seed=args.seed,
+        host_rate=args.host_rate,
+        host_concurrency=args.host_concurrency,
+        workers=args.workers,
+    )
+
+    print(f"\nAcquisition took {results['seconds']:.2f}s at scale {args.scale:g}")
+    print("\nRows written:")
+    for name, n_rows in results["rows"].items():
+        print(f"  {name:<32} {n_rows:>10}")
+    print("\nServer responses:")
+    for status, count in sorted(results["server"].items()):
+        print(f"  {status:<10} {count:>6}")
+    print("\nScheduler per host:")
+    print(results["hosts"].round(3).to_string(index=False))
+
+
+# Entry point of the script
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Preprocessing Memory / Time Benchmark
+-------------------------------------
+
+Compares the DataFrame preprocessing path used by run_ml_pipeline
+
+    clean_data -> split_data -> remove_outliers_iqr
+    -> preprocess_training_data / preprocess_test_data
+
+with the copy-free prepare_arrays path (float64 and float32), on a
+synthetic master-like panel replicated to larger sizes. Reports wall
+time and peak traced allocation (tracemalloc; NumPy and pandas buffers
+are included).
+
+Run from the project root:
+
+    python -m benchmarks.bench_preprocessing
+"""
+
+import contextlib
+import io
+import time
+import tracemalloc
+from typing import Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+from src.ml.preprocessing import (
+    clean_data,
+    split_data,
+    remove_outliers_iqr,
+    preprocess_training_data,
+    preprocess_test_data,
+    prepare_arrays,
+)
+
+
+FEATURES = [
+    "doctors_per_100k", "household_expenditure", "hospital_capacity",
+    "gov_health_expenditure", "gdp_per_capita", "fertility_rate",
+    "urban_population_pct", "population_density",
+]
+
+
+def make_master_like(n_rows: int, missing_rate: float = 0.05, seed: int = 42) -> pd.DataFrame:
+    """
+    Synthetic frame with the master dataset's columns and some gaps.
+    """
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        rng.lognormal(mean=3.0, sigma=1.0, size=(n_rows, len(FEATURES))),
+        columns=FEATURES,
+    )
+    df = df.mask(rng.random(df.shape) < missing_rate)
+    df.insert(0, "iso3", rng.choice(["AUT", "BEL", "DEU", "FRA"], n_rows))
+    df.insert(1, "year", rng.integers(1995, 2022, n_rows))
+    df.insert(2, "life_expectancy", rng.normal(19.0, 1.5, n_rows))
+    return df
+
+
+def dataframe_path(df: pd.DataFrame) -> None:
+    data = clean_data(df, target="life_expectancy")
+    X_train, X_test, y_train, y_test = split_data(data, target="life_expectancy")
+    X_train, y_train = remove_outliers_iqr(X_train, y_train)
+    X_train_p, imputer, scaler = preprocess_training_data(X_train)
+    preprocess_test_data(X_test, imputer, scaler)
+
+
+def array_path_64(df: pd.DataFrame) -> None:
+    prepare_arrays(df, target="life_expectancy", dtype=np.float64)
+
+
+def array_path_32(df: pd.DataFrame) -> None:
+    prepare_arrays(df, target="life_expectancy", dtype=np.float32)
+
+
+def measure(func: Callable[[pd.DataFrame], None], df: pd.DataFrame) -> Dict[str, float]:
+    """
+    Wall time and peak traced allocation above the input frame.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        func(df)
+        seconds = time.perf_counter() - start
+
+        tracemalloc.start()
+        func(df)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {"seconds": seconds, "peak_mb": peak / 1024 ** 2}
+
+
+def run_benchmark(sizes=(10_000, 100_000, 1_000_000)) -> pd.DataFrame:
+    rows = []
+    for n_rows in sizes:
+        df = make_master_like(n_rows)
+        input_mb = df.memory_usage(deep=True).sum() / 1024 ** 2
+
+        for name, func in [
+            ("dataframe", dataframe_path),
+            ("arrays_float64", array_path_64),
+            ("arrays_float32", array_path_32),
+        ]:
+            rows.append({"rows": n_rows, "path": name, "input_mb": input_mb, **measure(func, df)})
+
+    results = pd.DataFrame(rows)
+    print(results.round(3).to_string(index=False))
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark()
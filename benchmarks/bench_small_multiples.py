@@ -0,0 +1,100 @@
+"""
+Small Multiples Benchmark
+-------------------------
+
+Measures panels per second for:
+
+• the per-panel pattern (plt.subplots + save_figure for every panel)
+• the batched renderer (render_small_multiples, PNG pages and PDF)
+
+Run from the project root:
+
+    python -m benchmarks.bench_small_multiples
+"""
+
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from src.visualizations import (
+    Panel,
+    plt,
+    render_small_multiples,
+    save_figure,
+)
+
+
+def make_panels(n_panels: int, n_years: int = 30, seed: int = 42) -> List[Panel]:
+    """
+    Synthetic random-walk trend panels.
+    """
+    rng = np.random.default_rng(seed)
+    years = np.arange(1995, 1995 + n_years, dtype=np.float64)
+    series = rng.normal(size=(n_panels, n_years)).cumsum(axis=1)
+
+    return [(f"C{i:03d} - indicator", years, series[i]) for i in range(n_panels)]
+
+
+def bench_per_panel(panels: List[Panel], out_dir: Path) -> float:
+    """
+    Panels per second when creating and saving one figure per panel.
+    """
+    start = time.perf_counter()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i, (title, x, y) in enumerate(panels):
+            fig, ax = plt.subplots(figsize=(6, 4))
+            ax.plot(x, y)
+            ax.set_title(title)
+            save_figure(fig, out_dir / f"panel_{i:04d}")
+
+    return len(panels) / (time.perf_counter() - start)
+
+
+def bench_batched(panels: List[Panel], out_dir: Path, fmt: str) -> float:
+    """
+    Panels per second for the batched small-multiples renderer.
+    """
+    start = time.perf_counter()
+    render_small_multiples(panels, out_dir / "pages", nrows=4, ncols=9, fmt=fmt)
+    return len(panels) / (time.perf_counter() - start)
+
+
+def run_benchmark(sizes=(36, 360)) -> Dict[int, Dict[str, float]]:
+    """
+    Run all variants for each panel count and print panels per second.
+
+    The per-panel baseline is only measured on the smallest size,
+    since its cost is linear in the number of panels.
+    """
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = Path(tmp)
+
+        for n_panels in sizes:
+            panels = make_panels(n_panels)
+            row = {
+                "batched_png": bench_batched(panels, out_dir, "png"),
+                "batched_pdf": bench_batched(panels, out_dir, "pdf"),
+            }
+            if n_panels == min(sizes):
+                row["per_panel_png"] = bench_per_panel(panels, out_dir)
+
+            results[n_panels] = row
+
+    print(f"{'panels':>8} {'variant':<16} {'panels/s':>10}")
+    for n_panels, row in results.items():
+        for variant, rate in row.items():
+            print(f"{n_panels:>8} {variant:<16} {rate:>10.1f}")
+
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,163 @@
+"""
+Inference Server Load Test
+--------------------------
+
+Fires concurrent POST /predict requests at a local inference server
+over keep-alive connections and reports throughput and latency
+percentiles, followed by the server's own /metrics snapshot.
+
+Run against a running server:
+
+    python serve.py &
+    python -m benchmarks.load_test_server --port 8765
+
+or let the script start an in-process server on a free port:
+
+    python -m benchmarks.load_test_server --in-process
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from src.ml.artifact import DEFAULT_ARTIFACT_PATH, load_pipeline_artifact
+from src.ml.serving import DEFAULT_HOST, DEFAULT_PORT, InferenceServer
+
+
+async def _request(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    host: str,
+    method: str,
+    path: str,
+    body: bytes = b"",
+) -> Tuple[int, bytes]:
+    writer.write(
+        (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {host}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        ).encode("latin-1") + body
+    )
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+
+    return status, await reader.readexactly(length)
+
+
+async def _client(
+    host: str, port: int, n_requests: int, payload: bytes, latencies: List[float]
+) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(n_requests):
+            start = time.perf_counter()
+            status, _ = await _request(reader, writer, host, "POST", "/predict", payload)
+            if status != 200:
+                raise RuntimeError(f"Server returned {status}")
+            latencies.append((time.perf_counter() - start) * 1000.0)
+    finally:
+        writer.close()
+
+
+async def run_load_test(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    concurrency: int = 64,
+    requests_per_client: int = 100,
+    rows_per_request: int = 1,
+    n_features: int = 9,
+) -> Dict[str, float]:
+    """
+    Run the load test and return client-side throughput and latency.
+    """
+    rng = np.random.default_rng(0)
+    payload = json.dumps(
+        {"rows": rng.normal(size=(rows_per_request, n_features)).tolist()}
+    ).encode()
+
+    latencies: List[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        _client(host, port, requests_per_client, payload, latencies)
+        for _ in range(concurrency)
+    ])
+    elapsed = time.perf_counter() - start
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    results = {
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "requests_per_s": len(latencies) / elapsed,
+        "latency_p50_ms": p50,
+        "latency_p95_ms": p95,
+        "latency_p99_ms": p99,
+    }
+
+    reader, writer = await asyncio.open_connection(host, port)
+    _, body = await _request(reader, writer, host, "GET", "/metrics")
+    writer.close()
+    results["server_metrics"] = json.loads(body)
+
+    return results
+
+
+async def _run_in_process(args) -> Dict[str, float]:
+    artifact = load_pipeline_artifact(args.artifact)
+    server = InferenceServer(
+        artifact, args.host, 0, batch_window_ms=args.batch_window_ms
+    )
+    await server.start()
+    try:
+        return await run_load_test(
+            args.host, server.port, args.concurrency,
+            args.requests, args.rows, len(artifact.feature_names)
+        )
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test the inference server.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=100, help="Requests per client")
+    parser.add_argument("--rows", type=int, default=1, help="Rows per request")
+    parser.add_argument("--features", type=int, default=9)
+    parser.add_argument("--in-process", action="store_true")
+    parser.add_argument("--artifact", type=Path, default=DEFAULT_ARTIFACT_PATH)
+    parser.add_argument("--batch-window-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    if args.in_process:
+        results = asyncio.run(_run_in_process(args))
+    else:
+        results = asyncio.run(run_load_test(
+            args.host, args.port, args.concurrency,
+            args.requests, args.rows, args.features
+        ))
+
+    server_metrics = results.pop("server_metrics")
+    for key, value in results.items():
+        print(f"{key:<18} {value:>12.2f}")
+    print(f"{'mean_batch_rows':<18} {server_metrics['mean_batch_rows']:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""
+Benchmark Suite
+---------------
+
+Times every hot path of the refresh and training pipeline on
+synthetic inputs (benchmarks/synthetic.py) scaled from the current
+data volume (1x) up to 1000x:
+
+• sdmx_to_dataframe / decode_multidimensional_index
+• standardize_eurostat / standardize_worldbank
+• integrate_datasets
+• every plot_* function in src/visualizations.py
+• run_ml_pipeline
+
+Results are written as JSON (one record per benchmark and scale, best
+of --repeat runs) and compared against a saved baseline: any case
+slower than baseline * (1 + threshold) is reported as a regression
+and the script exits with status 1.
+
+Some cases have a lower max_scale so the full suite finishes in
+reasonable time and memory: the SDMX cases (a 1000x payload is a
+~24M-entry JSON object) and plots whose cost grows with the number
+of rendered countries.
+
+Run from the project root:
+
+    python -m benchmarks.run_benchmarks --scales 1,10
+    python -m benchmarks.run_benchmarks --save-baseline
+    python -m benchmarks.run_benchmarks --only plot_ --scales 1,10,100
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import matplotlib
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+
+import src.data_loader as data_loader
+from src.data_loader import standardize_eurostat, standardize_worldbank
+from src.eurostat_data_fetcher import (
+    decode_multidimensional_index,
+    sdmx_to_dataframe,
+)
+from src import visualizations
+from ml_main import run_ml_pipeline
+
+from benchmarks.synthetic import (
+    geo_codes,
+    make_eurostat_raw,
+    make_master_panel,
+    make_sdmx_payload,
+    make_worldbank_raw,
+    write_raw_files,
+)
+
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_OUTPUT = BENCHMARK_DIR / "results" / "latest.json"
+DEFAULT_BASELINE = BENCHMARK_DIR / "results" / "baseline.json"
+
+DEFAULT_SCALES = [1, 10, 100, 1000]
+DEFAULT_THRESHOLD = 0.25
+
+
+class Case(NamedTuple):
+    """
+    setup(scale, workdir) builds the inputs (untimed) and returns
+    (callable to time, number of input rows).
+    """
+    name: str
+    setup: Callable[[float, Path], tuple]
+    max_scale: float = 1000
+
+
+# =============================
+# Cases
+# =============================
+
+def _setup_sdmx(scale: float, workdir: Path):
+    payload = make_sdmx_payload(geo_codes(scale))
+    return (lambda: sdmx_to_dataframe(payload)), len(payload["value"])
+
+
+def _setup_decode(scale: float, workdir: Path):
+    payload = make_sdmx_payload(geo_codes(scale))
+    indices = [int(key) for key in payload["value"]]
+    sizes = payload["size"]
+    return (
+        lambda: [decode_multidimensional_index(i, sizes) for i in indices]
+    ), len(indices)
+
+
+def _setup_standardize_eurostat(scale: float, workdir: Path):
+    raw = make_eurostat_raw(scale)
+    return (lambda: standardize_eurostat(raw.copy(), "indicator")), len(raw)
+
+
+def _setup_standardize_worldbank(scale: float, workdir: Path):
+    raw = make_worldbank_raw(scale)
+    return (lambda: standardize_worldbank(raw, "indicator")), len(raw)
+
+
+def _setup_integrate(scale: float, workdir: Path):
+    raw_dir = workdir / "raw"
+    write_raw_files(raw_dir, scale)
+    n_rows = sum(
+        sum(1 for _ in open(path)) - 1 for path in raw_dir.glob("*.csv")
+    )
+
+    def run():
+        # integrate_datasets reads and writes module-level paths
+        saved = data_loader.RAW_DATA_PATH, data_loader.PROCESSED_DATA_PATH
+        data_loader.RAW_DATA_PATH = raw_dir
+        data_loader.PROCESSED_DATA_PATH = workdir / "processed"
+        try:
+            return data_loader.integrate_datasets()
+        finally:
+            data_loader.RAW_DATA_PATH, data_loader.PROCESSED_DATA_PATH = saved
+
+    return run, n_rows
+
+
+def _plot_case(function_name: str) -> Callable:
+    def setup(scale: float, workdir: Path):
+        df = make_master_panel(scale)
+        plot = getattr(visualizations, function_name)
+        figures_dir = workdir / "figures"
+        figures_dir.mkdir(parents=True, exist_ok=True)
+        return (lambda: plot(df, figures_dir)), len(df)
+    return setup
+
+
+def _setup_ml_pipeline(scale: float, workdir: Path):
+    df = make_master_panel(scale)
+    return (
+        lambda: run_ml_pipeline(
+            df, artifact_path=None, n_bootstrap=100, track=False
+        )
+    ), len(df)
+
+
+PLOT_FUNCTIONS = [
+    ("plot_correlation", 1000),
+    ("plot_trends", 100),
+    ("plot_gdp_relationship", 1000),
+    ("plot_fertility_relationship", 1000),
+    ("plot_distribution", 1000),
+    ("plot_country_reports", 10),
+]
+
+CASES: List[Case] = [
+    Case("sdmx_to_dataframe", _setup_sdmx, 100),
+    Case("decode_multidimensional_index", _setup_decode, 100),
+    Case("standardize_eurostat", _setup_standardize_eurostat),
+    Case("standardize_worldbank", _setup_standardize_worldbank),
+    Case("integrate_datasets", _setup_integrate),
+    *[Case(name, _plot_case(name), max_scale) for name, max_scale in PLOT_FUNCTIONS],
+    Case("run_ml_pipeline", _setup_ml_pipeline),
+]
+
+
+# =============================
+# Running and Comparing
+# =============================
+
+def run_case(case: Case, scale: float, repeat: int) -> Dict:
+    """
+    Best-of-`repeat` wall time of one case at one scale.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        run, n_rows = case.setup(scale, workdir)
+
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                run()
+            times.append(time.perf_counter() - start)
+            visualizations.plt.close("all")
+
+    return {
+        "name": case.name,
+        "scale": scale,
+        "n_rows": int(n_rows),
+        "seconds": min(times),
+        "median_seconds": float(np.median(times)),
+        "repeat": repeat,
+    }
+
+
+def run_suite(
+    scales: List[float],
+    only: Optional[str] = None,
+    repeat: int = 3,
+) -> Dict:
+    results = []
+    for case in CASES:
+        if only and only not in case.name:
+            continue
+        for scale in scales:
+            if scale > case.max_scale:
+                continue
+            record = run_case(case, scale, repeat)
+            results.append(record)
+            print(
+                f"{record['name']:<32} x{scale:<6g} rows={record['n_rows']:<9} "
+                f"{record['seconds']:.4f}s"
+            )
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+        },
+        "results": results,
+    }
+
+
+def compare_to_baseline(
+    current: Dict, baseline: Dict, threshold: float = DEFAULT_THRESHOLD
+) -> pd.DataFrame:
+    """
+    Join current and baseline timings on (name, scale).
+
+    Returns:
+        DataFrame with name, scale, baseline, current, ratio and
+        regression (ratio > 1 + threshold).
+    """
+    columns = ["name", "scale", "seconds"]
+    now = pd.DataFrame(current["results"], columns=columns + ["n_rows"])
+    before = pd.DataFrame(baseline["results"], columns=columns + ["n_rows"])
+
+    merged = now[columns].merge(
+        before[columns], on=["name", "scale"], suffixes=("", "_baseline")
+    ).rename(columns={"seconds": "current", "seconds_baseline": "baseline"})
+
+    merged["ratio"] = merged["current"] / merged["baseline"]
+    merged["regression"] = merged["ratio"] > 1.0 + threshold
+
+    return merged[["name", "scale", "baseline", "current", "ratio", "regression"]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the benchmark suite.")
+    parser.add_argument(
+        "--scales", default=",".join(map(str, DEFAULT_SCALES)),
+        help="Comma-separated scale factors relative to the current data",
+    )
+    parser.add_argument("--only", help="Run only cases whose name contains this")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument(
+        "--save-baseline", action="store_true",
+        help="Store this run as the new baseline instead of comparing",
+    )
+    args = parser.parse_args()
+
+    scales = [float(s) for s in args.scales.split(",")]
+    current = run_suite(scales, args.only, args.repeat)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(current, indent=2))
+    print(f"\nResults saved: {args.output}")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(current, indent=2))
+        print(f"Baseline saved: {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline first.")
+        return
+
+    comparison = compare_to_baseline(
+        current, json.loads(args.baseline.read_text()), args.threshold
+    )
+    print("\nCOMPARISON WITH BASELINE")
+    print("-" * 60)
+    print(comparison.round(4).to_string(index=False))
+
+    regressions = comparison[comparison["regression"]]
+    if not regressions.empty:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+        raise SystemExit(1)
+
+
+# Entry point of the script
+if __name__ == "__main__":
+    main()
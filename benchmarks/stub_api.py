@@ -0,0 +1,285 @@
+"""
+Stand-in Eurostat / World Bank API
+----------------------------------
+
+Local HTTP server that answers the requests made by the fetchers with
+synthetic payloads (benchmarks/synthetic.py) at any scale, so the
+fetch path, the parsers and run_data_acquisition can be benchmarked
+and stressed offline:
+
+• GET /eurostat/<dataset_code>?<dimension filters>   → SDMX-JSON
+• GET /worldbank/country/<codes>/indicator/<code>?page=&per_page=
+                                                      → paged JSON
+• GET /stats                                          → request counters
+
+Faults are injected deterministically (seeded, in request order):
+a fixed latency plus jitter, 429 responses with a Retry-After header
+and 500/502/503 responses at configurable rates.
+
+Point the fetchers at it with
+
+    with StubAPIServer(scale=100, error_rate=0.05) as server:
+        server.install()        # sets EUROSTAT_API_URL / WORLD_BANK_API_URL
+        run_data_acquisition()
+
+or run it standalone and export the printed URLs:
+
+    python -m benchmarks.stub_api --scale 100 --rate-limit-rate 0.1
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import src.eurostat_data_fetcher as eurostat_data_fetcher
+import src.world_bank_data_fetcher as world_bank_data_fetcher
+
+from benchmarks.synthetic import (
+    dataset_sdmx_payload,
+    make_worldbank_records,
+    worldbank_countries,
+    worldbank_page,
+)
+
+
+DEFAULT_HOST = "127.0.0.1"
+
+SERVER_ERRORS = (500, 502, 503)
+
+
+class StubAPIServer:
+    """
+    Threaded stand-in server; start()/stop() or use as a context manager.
+
+    Args:
+        scale: Payload size relative to the real downloads.
+        latency_ms: Delay added to every response.
+        jitter_ms: Extra uniform random delay in [0, jitter_ms].
+        rate_limit_rate: Share of requests answered with 429.
+        error_rate: Share of requests answered with a 5xx.
+        retry_after: Retry-After seconds sent with 429 responses.
+        max_per_page: Cap on World Bank per_page, to force paging.
+    """
+
+    def __init__(
+        self,
+        scale: float = 1.0,
+        host: str = DEFAULT_HOST,
+        port: int = 0,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        error_rate: float = 0.0,
+        retry_after: float = 0.0,
+        max_per_page: int = 1000,
+        seed: int = 0,
+    ):
+        self.scale = scale
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.max_per_page = max_per_page
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._payloads: Dict[Tuple, bytes] = {}
+        self._records: Dict[str, list] = {}
+        self.counts: Counter = Counter()
+
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        self._saved_urls: Optional[Tuple[str, str]] = None
+
+    # -------- URLs --------
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def eurostat_url(self) -> str:
+        return f"{self.url}/eurostat"
+
+    @property
+    def worldbank_url(self) -> str:
+        return f"{self.url}/worldbank"
+
+    def install(self) -> None:
+        """
+        Point the fetcher modules at this server until stop().
+        """
+        self._saved_urls = (
+            eurostat_data_fetcher.EUROSTAT_API_URL,
+            world_bank_data_fetcher.WORLD_BANK_API_URL,
+        )
+        eurostat_data_fetcher.EUROSTAT_API_URL = self.eurostat_url
+        world_bank_data_fetcher.WORLD_BANK_API_URL = self.worldbank_url
+
+    # -------- Lifecycle --------
+
+    def start(self) -> "StubAPIServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._saved_urls is not None:
+            (
+                eurostat_data_fetcher.EUROSTAT_API_URL,
+                world_bank_data_fetcher.WORLD_BANK_API_URL,
+            ) = self._saved_urls
+            self._saved_urls = None
+
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubAPIServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counts)
+
+    # -------- Responses --------
+
+    def _fault(self) -> Tuple[float, Optional[int]]:
+        """
+        Delay (seconds) and injected status (None to serve normally).
+        """
+        with self._lock:
+            delay = (self.latency_ms + self._rng.random() * self.jitter_ms) / 1000.0
+            draw = self._rng.random()
+            if draw < self.rate_limit_rate:
+                return delay, 429
+            if draw < self.rate_limit_rate + self.error_rate:
+                return delay, self._rng.choice(SERVER_ERRORS)
+            return delay, None
+
+    def _eurostat(self, dataset_code: str, query: Dict[str, list]) -> bytes:
+        filters = {dim: values[0] for dim, values in query.items()}
+        key = ("eurostat", dataset_code, tuple(sorted(filters.items())))
+
+        with self._lock:
+            cached = self._payloads.get(key)
+        if cached is None:
+            seed = sum(map(ord, dataset_code))
+            payload = dataset_sdmx_payload(filters, self.scale, seed=seed)
+            cached = json.dumps(payload).encode()
+            with self._lock:
+                self._payloads[key] = cached
+        return cached
+
+    def _worldbank(self, indicator_code: str, query: Dict[str, list]) -> bytes:
+        page = int(query.get("page", ["1"])[0])
+        per_page = min(int(query.get("per_page", ["50"])[0]), self.max_per_page)
+
+        with self._lock:
+            records = self._records.get(indicator_code)
+        if records is None:
+            seed = sum(map(ord, indicator_code))
+            records = make_worldbank_records(
+                indicator_code, worldbank_countries(self.scale), seed=seed
+            )
+            with self._lock:
+                self._records[indicator_code] = records
+
+        return json.dumps(worldbank_page(records, page, per_page)).encode()
+
+    def _route(self, path: str) -> Tuple[int, bytes, Dict[str, str]]:
+        parsed = urlparse(path)
+        parts = [p for p in parsed.path.split("/") if p]
+        query = parse_qs(parsed.query)
+
+        if parts == ["stats"]:
+            return 200, json.dumps(self.stats()).encode(), {}
+
+        source = parts[0] if parts else ""
+        if source not in ("eurostat", "worldbank"):
+            return 404, b'{"error": "not found"}', {}
+
+        delay, status = self._fault()
+        if delay:
+            time.sleep(delay)
+        if status == 429:
+            return 429, b'{"error": "too many requests"}', {"Retry-After": f"{self.retry_after:g}"}
+        if status is not None:
+            return status, b'{"error": "injected failure"}', {}
+
+        if source == "eurostat" and len(parts) == 2:
+            return 200, self._eurostat(parts[1], query), {}
+        if source == "worldbank" and len(parts) == 5 and parts[3] == "indicator":
+            return 200, self._worldbank(parts[4], query), {}
+        return 404, b'{"error": "not found"}', {}
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                status, body, headers = server._route(self.path)
+                with server._lock:
+                    server.counts["requests"] += 1
+                    server.counts[str(status)] += 1
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a stand-in Eurostat / World Bank API.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=0.0)
+    parser.add_argument("--max-per-page", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = StubAPIServer(
+        args.scale, args.host, args.port, args.latency_ms, args.jitter_ms,
+        args.rate_limit_rate, args.error_rate, args.retry_after,
+        args.max_per_page, args.seed,
+    )
+    print(f"export EUROSTAT_API_URL={server.eurostat_url}")
+    print(f"export WORLD_BANK_API_URL={server.worldbank_url}")
+
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+# Entry point of the script
+if __name__ == "__main__":
+    main()
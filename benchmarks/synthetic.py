@@ -0,0 +1,269 @@
+"""
+Synthetic Inputs for Benchmarks
+-------------------------------
+
+Deterministic stand-ins for every input of the pipeline, sized by a
+scale factor relative to the current data volume (scale=1):
+
+• SDMX-JSON payloads as returned by the Eurostat API
+• Paged JSON as returned by the World Bank API
+• Raw Eurostat / World Bank CSV frames (as saved in data/raw)
+• A master-dataset-like panel (27 * scale countries)
+
+Raw frames grow the way the real downloads do: the EU countries stay
+fixed and the extra rows are regional (NUTS) or non-EU codes that the
+standardizers filter out.
+"""
+
+import string
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from src.data_loader import COUNTRY_ISO2_TO_ISO3
+
+
+EU_ISO2 = [code for code in COUNTRY_ISO2_TO_ISO3 if code != "GR"]
+EU_ISO3 = [COUNTRY_ISO2_TO_ISO3[code] for code in EU_ISO2]
+
+YEARS = list(range(1990, 2025))
+
+# Raw files in data/raw and the kind of source they come from
+RAW_FILES = {
+    "life_expectancy": "eurostat",
+    "doctors_per_100k": "eurostat",
+    "household_expenditure": "eurostat",
+    "hospital_capacity": "eurostat",
+    "government_health_expenditure": "eurostat",
+    "gdp_per_capita": "worldbank",
+    "fertility_rate": "worldbank",
+    "urban_population_pct": "worldbank",
+    "population_density": "worldbank",
+}
+
+INDICATORS = [
+    "doctors_per_100k", "household_expenditure", "hospital_capacity",
+    "gov_health_expenditure", "gdp_per_capita", "fertility_rate",
+    "urban_population_pct", "population_density",
+]
+
+
+def _codes(n: int, length: int, prefix: str = "") -> List[str]:
+    """
+    n distinct uppercase codes, e.g. NUTS-like regions or ISO3-like ids.
+    """
+    letters = string.ascii_uppercase + string.digits
+    codes = []
+    for i in range(n):
+        code, rest = "", i
+        for _ in range(length):
+            code = letters[rest % len(letters)] + code
+            rest //= len(letters)
+        codes.append(prefix + code)
+    return codes
+
+
+def nuts_codes(n: int) -> List[str]:
+    """
+    n regional geo codes shaped like NUTS 1/2 codes (AT1, AT11, ...).
+    """
+    per_country = -(-n // len(EU_ISO2))
+    codes = [
+        f"{iso2}{suffix}"
+        for iso2 in EU_ISO2
+        for suffix in _codes(per_country, 2)
+    ]
+    return codes[:n]
+
+
+def geo_codes(scale: float) -> List[str]:
+    """
+    Eurostat geo codes: the EU countries plus regions, about 33x the
+    number of countries at scale 1 (the ratio in the real downloads).
+    """
+    n_regions = int(round(len(EU_ISO2) * 32 * scale))
+    return EU_ISO2 + nuts_codes(n_regions)
+
+
+def make_sdmx_payload(
+    geo: List[str],
+    years: List[int] = YEARS,
+    extra_dimensions: Dict[str, List[str]] = None,
+    density: float = 0.8,
+    seed: int = 42,
+) -> Dict:
+    """
+    SDMX-JSON response with dimensions freq, <extra>, geo and time and
+    a sparse `value` map keyed by the flattened index.
+    """
+    rng = np.random.default_rng(seed)
+    dimensions = {"freq": ["A"], **(extra_dimensions or {}), "geo": geo,
+                  "time": [str(y) for y in years]}
+
+    sizes = [len(codes) for codes in dimensions.values()]
+    n_cells = int(np.prod(sizes))
+    kept = np.flatnonzero(rng.random(n_cells) < density)
+    values = np.round(rng.normal(20.0, 3.0, len(kept)), 1)
+
+    return {
+        "id": list(dimensions),
+        "size": sizes,
+        "dimension": {
+            name: {"category": {"index": {code: i for i, code in enumerate(codes)}}}
+            for name, codes in dimensions.items()
+        },
+        "value": dict(zip(map(str, kept.tolist()), values.tolist())),
+    }
+
+
+def dataset_sdmx_payload(
+    filters: Dict[str, object], scale: float, seed: int = 42
+) -> Dict:
+    """
+    SDMX-JSON response for a filtered Eurostat request: one dimension
+    per filter (with the requested codes, '+'-joined or listed) plus
+    NUTS-level geo codes and all years.
+    """
+    extra = {
+        dim: codes.split("+") if isinstance(codes, str) else list(codes)
+        for dim, codes in filters.items()
+        if dim not in ("format", "geo", "time", "freq")
+    }
+    return make_sdmx_payload(geo_codes(scale), extra_dimensions=extra, seed=seed)
+
+
+def worldbank_countries(scale: float) -> List[str]:
+    """
+    EU ISO3 codes plus about 1.5x as many non-EU codes per unit of scale.
+    """
+    n_other = int(round(len(EU_ISO3) * 1.5 * scale))
+    others = [c for c in _codes(n_other + len(EU_ISO3), 3) if c not in EU_ISO3]
+    return EU_ISO3 + others[:n_other]
+
+
+def make_worldbank_records(
+    indicator_code: str,
+    countries: List[str],
+    years: List[int] = YEARS,
+    missing_rate: float = 0.1,
+    seed: int = 42,
+) -> List[Dict]:
+    """
+    World Bank API records (newest year first per country, as served),
+    with a share of null values.
+    """
+    rng = np.random.default_rng(seed)
+    n = len(countries) * len(years)
+    values = rng.lognormal(3.0, 1.0, n)
+    missing = rng.random(n) < missing_rate
+
+    records = []
+    i = 0
+    for iso3 in countries:
+        for year in reversed(years):
+            records.append({
+                "indicator": {"id": indicator_code, "value": indicator_code},
+                "country": {"id": iso3[:2], "value": f"Country {iso3}"},
+                "countryiso3code": iso3,
+                "date": str(year),
+                "value": None if missing[i] else float(values[i]),
+                "unit": "",
+                "obs_status": "",
+                "decimal": 1,
+            })
+            i += 1
+    return records
+
+
+def worldbank_page(records: List[Dict], page: int = 1, per_page: int = 50) -> List:
+    """
+    One page of a World Bank response: [metadata, records].
+    """
+    pages = max(1, -(-len(records) // per_page))
+    start = (page - 1) * per_page
+    metadata = {
+        "page": page,
+        "pages": pages,
+        "per_page": per_page,
+        "total": len(records),
+        "sourceid": "2",
+        "lastupdated": "2024-01-01",
+    }
+    return [metadata, records[start:start + per_page]]
+
+
+def make_eurostat_raw(scale: float, seed: int = 42) -> pd.DataFrame:
+    """
+    Raw Eurostat CSV frame (country, year, value).
+    """
+    rng = np.random.default_rng(seed)
+    geo = geo_codes(scale)
+    frame = pd.DataFrame({
+        "country": np.repeat(geo, len(YEARS)),
+        "year": np.tile(YEARS, len(geo)),
+        "value": rng.lognormal(3.0, 1.0, len(geo) * len(YEARS)).round(2),
+    })
+    return frame.sample(frac=0.75, random_state=seed).sort_values(["country", "year"])
+
+
+def make_worldbank_raw(scale: float, seed: int = 42) -> pd.DataFrame:
+    """
+    Raw World Bank CSV frame (countryName, country, year, value) with
+    the EU countries plus non-EU codes.
+    """
+    rng = np.random.default_rng(seed)
+    countries = worldbank_countries(scale)
+
+    return pd.DataFrame({
+        "countryName": np.repeat([f"Country {c}" for c in countries], len(YEARS)),
+        "country": np.repeat(countries, len(YEARS)),
+        "year": np.tile(YEARS[::-1], len(countries)),
+        "value": rng.lognormal(3.0, 1.0, len(countries) * len(YEARS)),
+    })
+
+
+def write_raw_files(directory: Path, scale: float) -> None:
+    """
+    Write all nine raw CSVs expected by integrate_datasets.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    for i, (name, source) in enumerate(RAW_FILES.items()):
+        maker = make_eurostat_raw if source == "eurostat" else make_worldbank_raw
+        maker(scale, seed=i).to_csv(directory / f"{name}.csv", index=False)
+
+
+def make_master_panel(scale: float, missing_rate: float = 0.02, seed: int = 42) -> pd.DataFrame:
+    """
+    Master-dataset-like panel with 27 * scale countries over 1995-2021,
+    each series a noisy trend so plots and models behave realistically.
+    """
+    rng = np.random.default_rng(seed)
+    n_countries = int(round(len(EU_ISO3) * scale))
+    countries = (EU_ISO3 + _codes(n_countries, 4, prefix="X"))[:n_countries]
+    years = np.arange(1995, 2022)
+
+    n = n_countries * len(years)
+    t = np.tile(years - years[0], n_countries)
+    level = np.repeat(rng.normal(0.0, 1.0, n_countries), len(years))
+
+    df = pd.DataFrame({
+        "iso3": np.repeat(countries, len(years)),
+        "year": np.tile(years, n_countries),
+    })
+    for j, col in enumerate(INDICATORS):
+        base = rng.lognormal(3.0 + j % 3, 0.5, n_countries)
+        df[col] = np.repeat(base, len(years)) * (1 + 0.02 * t) * rng.lognormal(0, 0.05, n)
+
+    df["life_expectancy"] = (
+        18.0 + 0.1 * t + 0.8 * level
+        + 0.5 * np.log(df["gdp_per_capita"]) - 0.3 * df["fertility_rate"].rank(pct=True)
+        + rng.normal(0, 0.3, n)
+    )
+
+    features = df[INDICATORS]
+    df[INDICATORS] = features.mask(rng.random(features.shape) < missing_rate)
+    return df
@@ -11,18 +11,37 @@ Pipeline Steps:
 4. Visualisation Generation
 
 This file should be executed from the project root directory.
+
+    python main.py
+    python main.py --trace --chrome-trace data/traces/pipeline_trace.json
+    python main.py --model-search      # also print the model leaderboard
 """
 
 
+import argparse
+from pathlib import Path
+
 from src.data_fetcher import run_data_acquisition
 from src.data_loader import integrate_datasets
+from src.feature_engineering import DEFAULT_FEATURE_CONFIG
 from src.exploratory_data_analysis import run_eda_summary
 from src.visualizations import run_visualisations
-from ml_main import run_ml_pipeline
+from src.tracing import records, span, summarize, tracing
+from ml_main import (
+    run_ml_pipeline,
+    run_model_selection,
+    run_multi_target_pipeline,
+    run_forecasting,
+)
 
-def main() -> None:
+
+DEFAULT_TRACE_PATH = Path("data/traces/pipeline_trace.jsonl")
+
+
+def run_pipeline(model_search: bool = False) -> None:
     """
-    Execute the full end-to-end data pipeline.
+    Execute the full end-to-end data pipeline; model_search adds the
+    model zoo leaderboard to step 5.
     """
 
     # STEP 1: Data Acquisition
@@ -30,7 +49,8 @@ def main() -> None:
     print("STEP 1: Data Acquisition")
     print("=" * 100)
 
-    run_data_acquisition()
+    with span("step1/data_acquisition"):
+        run_data_acquisition()
 
     # STEP 2: Data Integration
     print("\n" + "=" * 100)
@@ -38,7 +58,8 @@ def main() -> None:
     print("=" * 100)
 
     try:
-        df_master = integrate_datasets()
+        with span("step2/integration"):
+            df_master = integrate_datasets()
     except FileNotFoundError as e:
         print("⚠ Some datasets missing. Skipping integration.")
         print(e)
@@ -52,7 +73,8 @@ def main() -> None:
     print("STEP 3: Exploratory Data Summary")
     print("=" * 100)
 
-    run_eda_summary()
+    with span("step3/eda"):
+        run_eda_summary()
 
     # STEP 4: Generating Visualisations
     print("\n" + "=" * 100)
@@ -60,7 +82,8 @@ def main() -> None:
     print("=" * 100)
 
     try:
-        run_visualisations(df_master)
+        with span("step4/visualisations"):
+            run_visualisations(df_master)
     except Exception as e:
         print("Error during visualisation execution.")
         print(e)
@@ -74,12 +97,75 @@ def main() -> None:
     print("=" * 100)
 
     try:
-        run_ml_pipeline(df_master)
+        # Keep every life expectancy row; gaps in the indicators are
+        # filled by the panel imputer inside the pipeline
+        with span("step5/machine_learning"):
+            df_ml = integrate_datasets(how="left")
+            run_ml_pipeline(
+                df_ml, feature_config=DEFAULT_FEATURE_CONFIG, imputation="panel"
+            )
+            run_multi_target_pipeline(df_master)
+            if model_search:
+                run_model_selection(df_master)
     except Exception as e:
         print(" Error during ML pipeline execution.")
         print(e)
         return
 
+    # STEP 6: Forecasting
+    print("\n" + "=" * 100)
+    print("STEP 6: Life Expectancy Forecasts")
+    print("=" * 100)
+
+    try:
+        with span("step6/forecasting"):
+            run_forecasting(df_master)
+    except Exception as e:
+        print(" Error during forecasting.")
+        print(e)
+        return
+
+
+def main() -> None:
+    """
+    Run the pipeline, optionally recording a per-stage trace.
+    """
+    parser = argparse.ArgumentParser(description="Run the full pipeline.")
+    parser.add_argument(
+        "--trace", type=Path, nargs="?", const=DEFAULT_TRACE_PATH,
+        help=f"Write per-stage timing records as JSON lines (default {DEFAULT_TRACE_PATH})",
+    )
+    parser.add_argument(
+        "--chrome-trace", type=Path,
+        help="Also write a Chrome trace (chrome://tracing, Perfetto)",
+    )
+    parser.add_argument(
+        "--trace-memory", action="store_true",
+        help="Record peak Python allocation per stage (slower)",
+    )
+    parser.add_argument(
+        "--model-search", action="store_true",
+        help="Also rank the model zoo with GroupKFold CV (slow)",
+    )
+    args = parser.parse_args()
+
+    if not (args.trace or args.chrome_trace):
+        run_pipeline(args.model_search)
+        return
+
+    with tracing(args.trace, args.chrome_trace, args.trace_memory):
+        run_pipeline(args.model_search)
+
+    print("\n" + "=" * 100)
+    print("TRACE SUMMARY (slowest stages)")
+    print("=" * 100)
+    print(summarize(records()).head(25).round(3).to_string(index=False))
+    if args.trace:
+        print(f"\nTrace saved: {args.trace}")
+    if args.chrome_trace:
+        print(f"Chrome trace saved: {args.chrome_trace}")
+
+
 # Entry point of the script
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,39 +1,139 @@
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
 import numpy as np
-from sklearn.model_selection import cross_val_score
+from sklearn.model_selection import train_test_split
+
+from src.data_loader import TARGET_COLUMNS, dataset_fingerprint
+from src.feature_engineering import FeatureConfig, engineer_features
+from src.tracing import traced
 
 from src.ml.preprocessing import (
     clean_data,
     split_data,
-    remove_outliers_iqr,
     preprocess_training_data,
     preprocess_test_data,
 )
+from src.ml.outliers import detect_outliers, remove_outliers
+from src.ml.imputation import fit_panel_imputer
 from src.ml.model import train_model
+from src.ml.model_search import run_model_search
+from src.ml.cross_validation import (
+    group_kfold_splits,
+    rolling_origin_splits,
+    panel_cross_validate,
+)
 from src.ml.evaluation import evaluate_model, adjusted_r2
+from src.ml.artifact import DEFAULT_ARTIFACT_PATH, save_pipeline_artifact
+from src.ml.bootstrap import bootstrap_linear, percentile_intervals
+from src.ml.explain import (
+    permutation_importance,
+    linear_attributions,
+    country_attribution_summary,
+)
+from src.ml.tracking import RunStore, get_default_store
+from src.ml.multi_target import (
+    fit_multi_target,
+    evaluate_multi_target,
+    multi_target_cross_validate,
+)
+from src.ml.forecasting import (
+    DEFAULT_HORIZON,
+    build_design,
+    fit_direct,
+    forecast_countries,
+    regional_forecasts,
+    backtest,
+    backtest_summary,
+)
+
+
+DEFAULT_FORECAST_PATH = Path("data/models/forecasts.csv")
+
+
+def _drop_target_slices(df):
+    """
+    Sex/age life expectancy slices are targets, never features.
+    """
+    return df.drop(columns=[col for col in TARGET_COLUMNS if col in df.columns])
+
+
+def _lap(timings: Dict[str, float], stage: str, start: float) -> float:
+    """
+    Record the time since start under stage and return the current time.
+    """
+    now = time.perf_counter()
+    timings[stage] = now - start
+    return now
+
 
+@traced("ml/run_ml_pipeline", rows="df")
+def run_ml_pipeline(
+    df,
+    artifact_path: Optional[Path] = DEFAULT_ARTIFACT_PATH,
+    n_bootstrap: int = 10_000,
+    run_store: Optional[RunStore] = None,
+    track: bool = True,
+    feature_config: Optional[FeatureConfig] = None,
+    imputation: str = "mean",
+) -> Dict[str, float]:
 
-def run_ml_pipeline(df):
+    if imputation not in ("mean", "panel"):
+        raise ValueError(f"Unknown imputation: '{imputation}'")
 
     print("=" * 60)
     print("ML PIPELINE STARTED")
     print("=" * 60)
 
-    df = clean_data(df, target="life_expectancy")
+    timings: Dict[str, float] = {}
+    stage_start = time.perf_counter()
+
+    fingerprint = dataset_fingerprint(df)
+
+    # Per-country lags, growth and rolling windows (needs iso3,
+    # so it runs before clean_data drops it)
+    if feature_config:
+        df = engineer_features(df, feature_config)
+
+    # Country of each row, kept aside for panel-aware CV and reports
+    groups = df["iso3"]
+    keys = df[["iso3", "year"]]
+
+    df = clean_data(_drop_target_slices(df), target="life_expectancy")
 
     # Split BEFORE preprocessing
     X_train, X_test, y_train, y_test = split_data(
         df, target="life_expectancy"
     )
 
-    # Remove outliers from training only
-    X_train, y_train = remove_outliers_iqr(X_train, y_train)
+    # Remove multivariate outliers from training only
+    X_train, y_train, outliers = remove_outliers(
+        X_train, y_train, groups.loc[X_train.index]
+    )
+
+    # Panel imputation (interpolation, carry-forward, KNN across
+    # countries) fitted on training rows; the mean imputer in
+    # preprocessing only sees what is still missing afterwards
+    # (cross-validation refits it per fold on the raw rows)
+    X_train_raw = X_train
+    panel_imputer = None
+    if imputation == "panel":
+        panel_imputer = fit_panel_imputer(
+            X_train.drop(columns=["year"]), keys.loc[X_train.index]
+        )
+        X_train = panel_imputer.transform(X_train, keys.loc[X_train.index])
+        X_test = panel_imputer.transform(X_test, keys.loc[X_test.index])
+    stage_start = _lap(timings, "prepare", stage_start)
 
     # Preprocess
     X_train_processed, imputer, scaler = preprocess_training_data(X_train)
     X_test_processed = preprocess_test_data(X_test, imputer, scaler)
+    stage_start = _lap(timings, "preprocess", stage_start)
 
     # Train
     model = train_model(X_train_processed, y_train)
+    stage_start = _lap(timings, "train", stage_start)
 
     # Evaluate
     train_rmse, train_r2, _ = evaluate_model(
@@ -48,15 +148,81 @@ def run_ml_pipeline(df):
         len(y_test),
         X_test_processed.shape[1]
     )
+    stage_start = _lap(timings, "evaluate", stage_start)
 
-    # Cross-validation
-    cv_scores = cross_val_score(
-        model,
+    # Country-cluster bootstrap: coefficient and test-metric intervals
+    bootstrap_draws = bootstrap_linear(
         X_train_processed,
         y_train,
-        cv=5,
-        scoring="r2"
+        feature_names=list(X_train.columns),
+        n_resamples=n_bootstrap,
+        groups=groups.loc[X_train.index].to_numpy(),
+        X_eval=X_test_processed,
+        y_eval=y_test,
+        groups_eval=groups.loc[X_test.index].to_numpy(),
     )
+    intervals = percentile_intervals(
+        bootstrap_draws,
+        estimates={
+            "intercept": model.intercept_,
+            **dict(zip(X_train.columns, model.coef_)),
+            "rmse": test_rmse,
+            "r2": test_r2,
+            "adjusted_r2": adj,
+        },
+    ).set_index("term")
+    stage_start = _lap(timings, "bootstrap", stage_start)
+
+    # Interpretation: permutation importance on the test set and
+    # exact per-row attributions (original units) for every row
+    importance = permutation_importance(
+        model.predict,
+        X_test_processed,
+        y_test,
+        feature_names=list(X_train.columns),
+    )
+    X_all = df.drop(columns=["life_expectancy"])
+    if panel_imputer is not None:
+        X_all = panel_imputer.transform(X_all, keys.loc[X_all.index])
+    attribution_summary = country_attribution_summary(
+        linear_attributions(X_all, imputer, scaler, model),
+        groups.loc[X_all.index],
+    )
+    stage_start = _lap(timings, "explain", stage_start)
+
+    # Panel-aware cross-validation on the raw (not yet imputed)
+    # training rows; panel imputer, imputer and scaler are refitted
+    # inside every fold
+    panel_keys = keys.loc[X_train_raw.index] if imputation == "panel" else None
+    group_scores = panel_cross_validate(
+        model,
+        X_train_raw,
+        y_train,
+        group_kfold_splits(groups.loc[X_train_raw.index], n_splits=5),
+        panel_keys=panel_keys,
+    )
+    time_scores = panel_cross_validate(
+        model,
+        X_train_raw,
+        y_train,
+        rolling_origin_splits(X_train_raw["year"], min_train_years=10, horizon=3, step=3),
+        panel_keys=panel_keys,
+    )
+    stage_start = _lap(timings, "cross_validation", stage_start)
+
+    metrics = {
+        "train_r2": train_r2,
+        "train_rmse": train_rmse,
+        "test_r2": test_r2,
+        "test_adjusted_r2": adj,
+        "test_rmse": test_rmse,
+        "cv_group_r2_mean": group_scores.mean(),
+        "cv_group_r2_std": group_scores.std(),
+        "cv_time_r2_mean": time_scores.mean(),
+        "cv_time_r2_std": time_scores.std(),
+        "n_train": len(y_train),
+        "n_test": len(y_test),
+    }
 
     # PRINT FULL REPORT
     print("\nMODEL REPORT")
@@ -64,6 +230,11 @@ def run_ml_pipeline(df):
     print(f"Observations (train): {len(y_train)}")
     print(f"Features: {X_train_processed.shape[1]}")
 
+    dropped = outliers.reasons[outliers.reasons["dropped"]]
+    print(f"\nOUTLIERS REMOVED FROM TRAINING ({len(dropped)})")
+    for index, row in dropped.iterrows():
+        print(f"{groups.loc[index]:<6} {row['reasons']}")
+
     print("\nTRAIN PERFORMANCE")
     print(f"R²: {train_r2:.4f}")
     print(f"RMSE: {train_rmse:.4f}")
@@ -73,14 +244,253 @@ def run_ml_pipeline(df):
     print(f"Adjusted R²: {adj:.4f}")
     print(f"RMSE: {test_rmse:.4f}")
 
-    print("\nCROSS-VALIDATION (5-fold)")
-    print(f"Mean R²: {cv_scores.mean():.4f}")
-    print(f"Std: {cv_scores.std():.4f}")
+    print("\nCROSS-VALIDATION (GroupKFold by country, 5 folds)")
+    print(f"Mean R²: {group_scores.mean():.4f}")
+    print(f"Std: {group_scores.std():.4f}")
+
+    print(f"\nCROSS-VALIDATION (rolling origin, {len(time_scores)} splits)")
+    print(f"Mean R²: {time_scores.mean():.4f}")
+    print(f"Std: {time_scores.std():.4f}")
 
-    print("\nCOEFFICIENTS")
+    print(
+        f"\nTEST METRIC 95% INTERVALS ({n_bootstrap} paired country-cluster resamples"
+        " of train and test)"
+    )
+    for metric in ["r2", "adjusted_r2", "rmse"]:
+        row = intervals.loc[metric]
+        print(
+            f"{metric:<30} {row['estimate']:>10.4f}"
+            f"   [{row['lower']:>8.4f}, {row['upper']:>8.4f}]"
+        )
+
+    print("\nCOEFFICIENTS (95% bootstrap interval)")
     for feature, coef in zip(X_train.columns, model.coef_):
-        print(f"{feature:<30} {coef:>10.4f}")
+        row = intervals.loc[feature]
+        print(
+            f"{feature:<30} {coef:>10.4f}"
+            f"   [{row['lower']:>8.4f}, {row['upper']:>8.4f}]"
+        )
+
+    print("\nPERMUTATION IMPORTANCE (test R² drop)")
+    for _, row in importance.iterrows():
+        print(
+            f"{row['feature']:<30} {row['importance_mean']:>10.4f}"
+            f" ± {row['importance_std']:.4f}"
+        )
+
+    # Persist (panel imputer +) imputer + scaler + model for batch
+    # scoring (predict.py, serving)
+    if artifact_path is not None:
+        save_pipeline_artifact(
+            artifact_path,
+            imputer,
+            scaler,
+            model,
+            feature_names=list(X_train.columns),
+            fingerprint=fingerprint,
+            target="life_expectancy",
+            extra_metadata={
+                "feature_config": feature_config or {},
+                "imputation": imputation,
+            },
+            panel_imputer=panel_imputer,
+        )
+        print(f"\nModel artifact saved: {artifact_path}")
+
+        summary_path = Path(artifact_path).with_name("country_attributions.csv")
+        attribution_summary.to_csv(summary_path, index=False)
+        print(f"Country attribution summary saved: {summary_path}")
+
+    # Record the run in the local experiment store
+    if track:
+        store = run_store if run_store is not None else get_default_store()
+        run_id = store.log_run(
+            metrics=metrics,
+            dataset_fingerprint=fingerprint,
+            features=list(X_train.columns),
+            model=type(model).__name__,
+            params={
+                **model.get_params(),
+                "n_bootstrap": n_bootstrap,
+                "feature_config": feature_config or {},
+                "imputation": imputation,
+            },
+            coefficients={
+                "intercept": model.intercept_,
+                **dict(zip(X_train.columns, model.coef_)),
+            },
+            timings=timings,
+        )
+        print(f"Run recorded: {run_id}")
 
     print("=" * 60)
     print("ML FINISHED")
-    print("=" * 60)
\ No newline at end of file
+    print("=" * 60)
+
+    return metrics
+
+
+@traced("ml/run_model_selection", rows="df")
+def run_model_selection(df, n_jobs: int = -1, n_splits: int = 5, **search_kwargs):
+    """
+    Search over the model zoo on the same training data as
+    run_ml_pipeline and print the leaderboard (GroupKFold CV R²).
+    search_kwargs go to run_model_search.
+    """
+
+    print("=" * 60)
+    print("MODEL SEARCH STARTED")
+    print("=" * 60)
+
+    groups = df["iso3"]
+    df = clean_data(_drop_target_slices(df), target="life_expectancy")
+
+    X_train, X_test, y_train, y_test = split_data(
+        df, target="life_expectancy"
+    )
+    X_train, y_train, _ = remove_outliers(
+        X_train, y_train, groups.loc[X_train.index]
+    )
+
+    # Same GroupKFold by country as the pipeline's CV, with imputer
+    # and scaler refitted inside every fold
+    leaderboard = run_model_search(
+        X_train,
+        y_train.to_numpy(),
+        cv=n_splits,
+        groups=groups.loc[X_train.index],
+        n_jobs=n_jobs,
+        **search_kwargs,
+    )
+
+    print(f"\nLEADERBOARD (GroupKFold by country, {n_splits} folds, CV R²)")
+    print("-" * 60)
+    print(leaderboard.round(4).to_string(index=False))
+
+    print("=" * 60)
+    print("MODEL SEARCH FINISHED")
+    print("=" * 60)
+
+    return leaderboard
+
+
+@traced("ml/run_forecasting", rows="df")
+def run_forecasting(
+    df,
+    horizon: int = DEFAULT_HORIZON,
+    output_path: Optional[Path] = DEFAULT_FORECAST_PATH,
+    n_jobs: int = -1,
+):
+    """
+    Backtest the direct multi-horizon forecaster, then refit on all
+    data and forecast every country and region `horizon` years ahead.
+    """
+
+    print("=" * 60)
+    print("FORECASTING STARTED")
+    print("=" * 60)
+
+    design = build_design(df, target="life_expectancy", horizon=horizon)
+
+    results = backtest(design, n_jobs=n_jobs)
+    print("\nROLLING-ORIGIN BACKTEST (pooled over origins)")
+    print("-" * 60)
+    print(backtest_summary(results).round(4).to_string(index=False))
+
+    model = fit_direct(design)
+    forecasts = forecast_countries(design, model)
+    regions = regional_forecasts(forecasts)
+
+    print("\nREGIONAL FORECASTS")
+    print("-" * 60)
+    print(
+        regions.pivot(
+            index=["region", "origin_year", "n_countries"],
+            columns="horizon",
+            values="forecast",
+        )
+        .add_prefix("h+").round(2).to_string()
+    )
+
+    if output_path is not None:
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        forecasts.to_csv(output_path, index=False)
+        regions.to_csv(output_path.with_name("regional_forecasts.csv"), index=False)
+        print(f"\nForecasts saved: {output_path}")
+
+    print("=" * 60)
+    print("FORECASTING FINISHED")
+    print("=" * 60)
+
+    return forecasts
+
+
+@traced("ml/run_multi_target_pipeline", rows="df")
+def run_multi_target_pipeline(df, estimator=None, n_jobs: int = -1):
+    """
+    Train one model per life expectancy slice (at birth / at 65,
+    male / female / total) with shared preprocessing: the imputer and
+    scaler are fitted once, and all targets are solved together.
+    """
+
+    targets = [col for col in TARGET_COLUMNS if col in df.columns]
+    if not targets:
+        print("No life expectancy slices in the data. Skipping multi-target models.")
+        return None
+
+    print("=" * 60)
+    print("MULTI-TARGET PIPELINE STARTED")
+    print("=" * 60)
+
+    timings: Dict[str, float] = {}
+    stage_start = time.perf_counter()
+
+    df = df.dropna(subset=targets, how="all").reset_index(drop=True)
+    groups = df["iso3"]
+
+    # Rows are selected by the slice targets above; the headline
+    # life_expectancy column may be missing on them, so it is not
+    # used as a row filter here (clean_data would drop those rows)
+    Y = df[targets]
+    X = df.drop(columns=targets + ["life_expectancy"], errors="ignore").select_dtypes(
+        include=[np.number]
+    )
+
+    X_train, X_test, Y_train, Y_test = train_test_split(
+        X, Y, test_size=0.2, random_state=42
+    )
+
+    # Feature-only outlier screen, shared by all targets
+    keep = detect_outliers(X_train, groups=groups.loc[X_train.index]).keep
+    X_train, Y_train = X_train[keep], Y_train[keep]
+    stage_start = _lap(timings, "prepare", stage_start)
+
+    model = fit_multi_target(X_train, Y_train, estimator=estimator, n_jobs=n_jobs)
+    stage_start = _lap(timings, "train", stage_start)
+
+    scores = evaluate_multi_target(model, X_test, Y_test)
+
+    cv = multi_target_cross_validate(
+        X, Y, group_kfold_splits(groups, n_splits=5),
+        estimator=estimator, n_jobs=n_jobs,
+    )
+    cv_summary = cv.groupby("target", sort=False)["r2"].agg(["mean", "std"])
+    scores["cv_group_r2_mean"] = cv_summary["mean"].reindex(targets).to_numpy()
+    scores["cv_group_r2_std"] = cv_summary["std"].reindex(targets).to_numpy()
+    stage_start = _lap(timings, "evaluate", stage_start)
+
+    print(f"\nTargets: {len(targets)}  Observations (train): {len(X_train)}")
+    print("\nTEST PERFORMANCE BY TARGET (+ GroupKFold CV R²)")
+    print("-" * 60)
+    print(scores.round(4).to_string(index=False))
+
+    print("\nTIMINGS (s)")
+    for stage, seconds in timings.items():
+        print(f"{stage:<12} {seconds:.3f}")
+
+    print("=" * 60)
+    print("MULTI-TARGET PIPELINE FINISHED")
+    print("=" * 60)
+
+    return scores
@@ -0,0 +1,185 @@
+"""
+Batch Prediction Script
+-----------------------
+
+Scores new data with the artifact saved by the ML pipeline
+(data/models/life_expectancy_model.npz by default).
+
+The artifact is loaded once, then the input is read in large chunks
+restricted to the model's input columns and scored with one matrix
+product per chunk. Key columns (iso3, year) are carried through to
+the output when present.
+
+Artifacts trained with engineered features (lags, growth, rolling
+windows) recompute them from the raw indicators, so the input must
+hold iso3, year and every year of history the features refer to; it
+is then read whole before being scored in chunks. Artifacts trained
+with panel imputation fill gaps from the stored panel (by iso3 and
+year) before the mean imputer, as in training.
+
+Input formats: .csv, .parquet, .feather (columnar formats need pyarrow).
+
+Usage (from the project root):
+
+    python predict.py new_data.csv predictions.csv
+    python predict.py new_data.parquet predictions.csv --full
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Iterator, List
+
+import numpy as np
+import pandas as pd
+
+from src.ml.artifact import (
+    DEFAULT_ARTIFACT_PATH,
+    input_columns,
+    load_pipeline_artifact,
+    load_sklearn_pipeline,
+    prepare_features,
+)
+
+
+# Identifier columns copied from input to output when available
+ID_COLUMNS = ["iso3", "year"]
+
+DEFAULT_CHUNKSIZE = 250_000
+
+
+def read_input_chunks(
+    path: Path, columns: List[str], chunksize: int = DEFAULT_CHUNKSIZE
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield input chunks containing only the given and key columns.
+
+    For CSV files the projection is applied by the parser; columnar
+    files read only the requested columns.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == ".csv":
+        header = pd.read_csv(path, nrows=0).columns
+    elif suffix == ".parquet":
+        import pyarrow.parquet as pq
+        header = pq.read_schema(path).names
+    elif suffix == ".feather":
+        import pyarrow.feather as feather
+        header = feather.read_table(path, memory_map=True).column_names
+    else:
+        raise ValueError(f"Unsupported input format: '{suffix}'")
+
+    missing = [col for col in columns if col not in header]
+    if missing:
+        raise ValueError(f"Input is missing feature columns: {missing}")
+
+    usecols = [col for col in ID_COLUMNS if col in header] + [
+        col for col in columns if col not in ID_COLUMNS
+    ]
+
+    if suffix == ".csv":
+        yield from pd.read_csv(path, usecols=usecols, chunksize=chunksize)
+    elif suffix == ".parquet":
+        yield pd.read_parquet(path, columns=usecols)
+    else:
+        yield pd.read_feather(path, columns=usecols)
+
+
+def predict_file(
+    input_path: Path,
+    output_path: Path,
+    artifact_path: Path = DEFAULT_ARTIFACT_PATH,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    full: bool = False,
+) -> int:
+    """
+    Score an input file and write predictions to CSV.
+
+    Args:
+        input_path: CSV / Parquet / Feather file with the feature columns.
+        output_path: CSV file with key columns and a prediction column.
+        artifact_path: Saved pipeline artifact.
+        chunksize: Rows per scoring batch for CSV input.
+        full: Use the pickled scikit-learn objects instead of the
+              NumPy fast path.
+
+    Returns:
+        Number of rows scored.
+    """
+    artifact = load_pipeline_artifact(artifact_path)
+    metadata = artifact.metadata
+    if full:
+        metadata, imputer, scaler, model = load_sklearn_pipeline(artifact_path)
+
+    feature_names = metadata["feature_names"]
+    prediction_col = f"predicted_{metadata['target']}"
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    chunks = read_input_chunks(input_path, input_columns(metadata), chunksize)
+    if metadata.get("feature_config"):
+        # Lags and rolling windows need each country's earlier years:
+        # build them on the whole input, then score in chunks
+        frame = prepare_features(
+            pd.concat(list(chunks), ignore_index=True), metadata, artifact.panel_imputer
+        )
+        # At least one (possibly empty) chunk, so the header is written
+        chunks = (
+            frame.iloc[i:i + chunksize] for i in range(0, max(len(frame), 1), chunksize)
+        )
+    else:
+        chunks = (prepare_features(chunk, metadata, artifact.panel_imputer) for chunk in chunks)
+
+    n_rows = 0
+    for i, chunk in enumerate(chunks):
+        features = chunk[feature_names]
+
+        if features.empty:
+            # Empty input still gets a header-only output file
+            y_pred = np.empty(0)
+        elif full:
+            y_pred = model.predict(scaler.transform(imputer.transform(features)))
+        else:
+            y_pred = artifact.predict(
+                features.to_numpy(dtype=np.float64, na_value=np.nan)
+            )
+
+        out = chunk[[col for col in ID_COLUMNS if col in chunk.columns]].copy()
+        out[prediction_col] = y_pred
+
+        out.to_csv(output_path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+        n_rows += len(out)
+
+    return n_rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Score data with a saved model.")
+    parser.add_argument("input", type=Path, help="Input CSV/Parquet/Feather file")
+    parser.add_argument("output", type=Path, help="Output CSV file")
+    parser.add_argument(
+        "--artifact", type=Path, default=DEFAULT_ARTIFACT_PATH,
+        help=f"Model artifact (default: {DEFAULT_ARTIFACT_PATH})"
+    )
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument(
+        "--full", action="store_true",
+        help="Score with the pickled scikit-learn pipeline"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    n_rows = predict_file(
+        args.input, args.output, args.artifact, args.chunksize, args.full
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ Scored {n_rows} rows in {elapsed * 1000:.1f} ms -> {args.output}")
+
+
+# Entry point of the script
+if __name__ == "__main__":
+    main()
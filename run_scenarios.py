@@ -0,0 +1,109 @@
+"""
+Scenario Studies
+----------------
+
+Reruns the ML pipeline on subsets of the master dataset in parallel
+and collects the metrics of every run in one table:
+
+• loco     : leave one country out (one run per country)
+• regions  : one run per EU region
+• features : leave one feature out
+
+All workers read the same memory-mapped copy of the dataset. Each
+finished run is appended to a JSON lines checkpoint, so an
+interrupted study picks up where it stopped when rerun with the same
+checkpoint; records from another dataset or other options are run
+again (use --restart to start over).
+
+Usage (from the project root):
+
+    python run_scenarios.py loco --n-jobs -1
+    python run_scenarios.py regions --dataset data/processed/master_dataset_left.csv \\
+        --imputation panel
+    python run_scenarios.py features --n-bootstrap 200
+"""
+
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+from src.feature_engineering import DEFAULT_FEATURE_CONFIG
+from src.query import MasterIndex
+from src.ml.scenarios import (
+    leave_one_country_out,
+    leave_one_feature_out,
+    region_subsets,
+    run_scenarios,
+)
+from ml_main import run_ml_pipeline
+
+
+DEFAULT_DATASET = Path("data/processed/master_dataset.csv")
+DEFAULT_OUTPUT_DIR = Path("data/models/scenarios")
+
+BUILDERS = {
+    "loco": leave_one_country_out,
+    "regions": region_subsets,
+    "features": leave_one_feature_out,
+}
+
+REPORT_COLUMNS = [
+    "scenario", "n_rows", "n_countries", "test_r2", "test_rmse",
+    "cv_group_r2_mean", "cv_time_r2_mean", "seconds", "error",
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run pipeline scenario studies.")
+    parser.add_argument("study", choices=sorted(BUILDERS))
+    parser.add_argument("--dataset", type=Path, default=DEFAULT_DATASET)
+    parser.add_argument("--n-jobs", type=int, default=-1)
+    parser.add_argument("--n-bootstrap", type=int, default=1000)
+    parser.add_argument("--imputation", choices=["mean", "panel"], default="mean")
+    parser.add_argument(
+        "--features", action="store_true",
+        help="Add the engineered lag/growth/rolling features",
+    )
+    parser.add_argument(
+        "--checkpoint", type=Path,
+        help="JSON lines checkpoint (default data/models/scenarios/<study>.jsonl)",
+    )
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint")
+    parser.add_argument("--retry-failed", action="store_true")
+    args = parser.parse_args()
+
+    df = MasterIndex.from_file(args.dataset).frame
+    scenarios = BUILDERS[args.study](df)
+
+    checkpoint = args.checkpoint or DEFAULT_OUTPUT_DIR / f"{args.study}.jsonl"
+    if args.restart and checkpoint.exists():
+        checkpoint.unlink()
+
+    print(f"Running {len(scenarios)} scenarios ({args.study}), checkpoint: {checkpoint}")
+    results = run_scenarios(
+        df,
+        scenarios,
+        run_ml_pipeline,
+        checkpoint_path=checkpoint,
+        n_jobs=args.n_jobs,
+        retry_failed=args.retry_failed,
+        artifact_path=None,
+        track=False,
+        n_bootstrap=args.n_bootstrap,
+        imputation=args.imputation,
+        feature_config=DEFAULT_FEATURE_CONFIG if args.features else None,
+    )
+
+    output_path = checkpoint.with_suffix(".csv")
+    results.to_csv(output_path, index=False)
+
+    pd.set_option("display.width", 200)
+    columns = [col for col in REPORT_COLUMNS if col in results.columns]
+    print(results[columns].round(4).to_string(index=False))
+    print(f"\nResults saved: {output_path}")
+
+
+# Entry point of the script
+if __name__ == "__main__":
+    main()
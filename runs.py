@@ -0,0 +1,71 @@
+"""
+Experiment Runs CLI
+-------------------
+
+Query the local run store written by the ML pipeline
+(data/models/runs.sqlite by default).
+
+Usage (from the project root):
+
+    python runs.py list --limit 20
+    python runs.py best --metric test_r2 --n 5
+    python runs.py best --metric test_rmse --lower-is-better
+    python runs.py show <run_id>
+    python runs.py compare <run_id> <run_id> [--table coefficients]
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from src.ml.tracking import DEFAULT_TRACKING_PATH, RunStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Inspect recorded ML runs.")
+    parser.add_argument("--db", type=Path, default=DEFAULT_TRACKING_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    list_cmd = sub.add_parser("list", help="Most recent runs")
+    list_cmd.add_argument("--fingerprint")
+    list_cmd.add_argument("--model")
+    list_cmd.add_argument("--since", help="ISO timestamp, e.g. 2026-10-01")
+    list_cmd.add_argument("--limit", type=int, default=20)
+
+    best_cmd = sub.add_parser("best", help="Top runs by a metric")
+    best_cmd.add_argument("--metric", default="test_r2")
+    best_cmd.add_argument("--n", type=int, default=10)
+    best_cmd.add_argument("--fingerprint")
+    best_cmd.add_argument("--lower-is-better", action="store_true")
+
+    show_cmd = sub.add_parser("show", help="Everything recorded for one run")
+    show_cmd.add_argument("run_id")
+
+    compare_cmd = sub.add_parser("compare", help="Runs side by side")
+    compare_cmd.add_argument("run_ids", nargs="+")
+    compare_cmd.add_argument(
+        "--table", choices=["metrics", "coefficients", "timings"], default="metrics"
+    )
+
+    args = parser.parse_args()
+    pd.set_option("display.width", 200)
+
+    with RunStore(args.db) as store:
+        if args.command == "list":
+            print(store.list_runs(args.fingerprint, args.model, args.since, args.limit)
+                  .to_string(index=False))
+        elif args.command == "best":
+            print(store.best_runs(
+                args.metric, args.n, not args.lower_is_better, args.fingerprint
+            ).to_string(index=False))
+        elif args.command == "show":
+            print(json.dumps(store.get_run(args.run_id), indent=2, default=str))
+        else:
+            print(store.compare_runs(args.run_ids, args.table).round(4).to_string())
+
+
+# Entry point of the script
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Local Inference Server
+----------------------
+
+Serves life-expectancy predictions from the saved model artifact over
+a local HTTP endpoint. Concurrent requests are grouped into
+micro-batches and scored with one matrix product per batch.
+
+Endpoints:
+    POST /predict   {"instances": [{"year": 2020, "gdp_per_capita": ...}]}
+                    or {"rows": [[...], ...]} in stored feature order
+    GET  /metrics   request/batch counters, throughput, latency percentiles
+    GET  /health    feature list and dataset fingerprint
+
+Usage (from the project root):
+
+    python serve.py --port 8765 --batch-window-ms 2
+"""
+
+import argparse
+from pathlib import Path
+
+from src.ml.artifact import DEFAULT_ARTIFACT_PATH
+from src.ml.serving import (
+    DEFAULT_BATCH_WINDOW_MS,
+    DEFAULT_HOST,
+    DEFAULT_MAX_BATCH_ROWS,
+    DEFAULT_PORT,
+    run_server,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve model predictions locally.")
+    parser.add_argument("--artifact", type=Path, default=DEFAULT_ARTIFACT_PATH)
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--batch-window-ms", type=float, default=DEFAULT_BATCH_WINDOW_MS,
+        help="How long the first request of a batch waits for others"
+    )
+    parser.add_argument("--max-batch-rows", type=int, default=DEFAULT_MAX_BATCH_ROWS)
+    args = parser.parse_args()
+
+    run_server(
+        args.artifact, args.host, args.port,
+        args.batch_window_ms, args.max_batch_rows
+    )
+
+
+# Entry point of the script
+if __name__ == "__main__":
+    main()
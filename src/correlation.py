@@ -0,0 +1,442 @@
+"""
+Correlation Analysis Module
+---------------------------
+
+This module is responsible for:
+
+• Pearson and Spearman correlation matrices with pairwise-complete
+  observations, sample counts and two-sided p-values
+• Per-country lagged cross-correlations (indicator at t-k against
+  the target at t), vectorised across countries, indicators and lags
+• Caching results by dataset fingerprint so the heatmap and reports
+  reuse the same arrays instead of recomputing them
+
+Matrices are computed from masked column blocks with matrix products,
+so screening hundreds of indicators costs a handful of BLAS calls.
+
+NOTE:
+Spearman with no missing values ranks each column once and reuses the
+blocked Pearson path. With gaps, every column pair is re-ranked on its
+own complete rows (as pandas does) from one sort per column, so the
+result is the exact pairwise-complete Spearman's rho.
+"""
+
+# =============================
+# Imports
+# =============================
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.stats import t as t_dist
+
+from src.data_loader import BoundedCache, dataset_fingerprint
+from src.panel import PanelCube
+
+
+# Columns that identify a row rather than measure something
+KEY_COLUMNS = ["iso3", "year"]
+
+# Number of columns per block in the blocked matrix products
+DEFAULT_BLOCK_SIZE = 256
+
+
+class CorrelationResult(NamedTuple):
+    """
+    Correlation matrix with its pairwise sample counts and p-values.
+    """
+    columns: List[str]
+    r: np.ndarray
+    n: np.ndarray
+    p: np.ndarray
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Returns the correlation matrix as a labelled DataFrame.
+        """
+        return pd.DataFrame(self.r, index=self.columns, columns=self.columns)
+
+
+class LaggedCorrelationResult(NamedTuple):
+    """
+    Per-country lagged cross-correlations.
+
+    Arrays are shaped (indicator, country, lag).
+    """
+    indicators: List[str]
+    countries: List[str]
+    lags: np.ndarray
+    r: np.ndarray
+    n: np.ndarray
+    p: np.ndarray
+
+
+# In-memory cache keyed by dataset fingerprint and call arguments
+# (most recent CACHE_SIZE results)
+CACHE_SIZE = 32
+_CACHE: Dict[Tuple, object] = BoundedCache(CACHE_SIZE)
+
+
+def clear_cache() -> None:
+    """
+    Drop all cached correlation results.
+    """
+    _CACHE.clear()
+
+
+# =============================
+# Core Array Routines
+# =============================
+
+def _p_values(r: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """
+    Two-sided p-values for Pearson r with n observations.
+    """
+    dof = n - 2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_clipped = np.clip(r, -1.0, 1.0)
+        t_stat = r_clipped * np.sqrt(dof / (1.0 - r_clipped ** 2))
+        p = 2.0 * t_dist.sf(np.abs(t_stat), dof)
+
+    p = np.where(dof > 0, p, np.nan)
+    return np.where(np.isnan(r), np.nan, p)
+
+
+def _rank_columns(values: np.ndarray) -> np.ndarray:
+    """
+    Average ranks per column, ignoring (and preserving) NaN.
+    """
+    return pd.DataFrame(values).rank(method="average").to_numpy(dtype=np.float64)
+
+
+def _tied_ranks(present: np.ndarray, tie_start: np.ndarray, tie_end: np.ndarray) -> np.ndarray:
+    """
+    Average ranks of already sorted rows, counting only present rows.
+
+    present is a 0/1 (rows, k) matrix in sort order; tie_start and
+    tie_end flag the first and last row of every run of equal values.
+    Ranks of absent rows are meaningless and must be masked out.
+    """
+    count = np.cumsum(present, axis=0)
+    before = count - present
+
+    # Present rows before the tie run, and up to its end
+    start = np.maximum.accumulate(np.where(tie_start, before, 0.0), axis=0)
+    end = np.minimum.accumulate(np.where(tie_end, count, np.inf)[::-1], axis=0)[::-1]
+    return start + (end - start + 1.0) / 2.0
+
+
+def _pairwise_spearman(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exact pairwise-complete Spearman r for columns with gaps.
+
+    Every column is sorted once. The ranks of x_j over the rows shared
+    with x_i are then a cumulative count of x_i's presence along x_j's
+    sort order (and vice versa), so each column pair is re-ranked on
+    its own complete rows with O(rows) array operations and no sort.
+    """
+    n_rows, n_cols = values.shape
+    mask = ~np.isnan(values)
+    n = mask.T.astype(np.float64) @ mask
+
+    order = np.argsort(values, axis=0, kind="stable")  # NaN last
+    sorted_values = np.take_along_axis(values, order, axis=0)
+    sorted_present = ~np.isnan(sorted_values)
+    tie_start = np.ones_like(sorted_present)
+    tie_start[1:] = sorted_values[1:] != sorted_values[:-1]
+    tie_end = np.ones_like(sorted_present)
+    tie_end[:-1] = tie_start[1:]
+
+    r = np.full((n_cols, n_cols), np.nan)
+    for i in range(n_cols):
+        others = slice(i, n_cols)
+        k = n_cols - i
+
+        # x_j ranked over the rows where x_i is present
+        order_j = order[:, others]
+        ranks_j = _tied_ranks(
+            (mask[order_j, i] & sorted_present[:, others]).astype(np.float64),
+            tie_start[:, others], tie_end[:, others],
+        )
+        rank_j = np.empty((n_rows, k))
+        np.put_along_axis(rank_j, order_j, ranks_j, axis=0)
+
+        # x_i ranked over the rows where each x_j is present
+        order_i = order[:, i]
+        ranks_i = _tied_ranks(
+            (mask[order_i][:, others] & sorted_present[:, [i]]).astype(np.float64),
+            tie_start[:, [i]], tie_end[:, [i]],
+        )
+        rank_i = np.empty((n_rows, k))
+        rank_i[order_i] = ranks_i
+
+        both = mask[:, [i]] & mask[:, others]
+        mean = (both.sum(axis=0) + 1.0) / 2.0
+        di = np.where(both, rank_i - mean, 0.0)
+        dj = np.where(both, rank_j - mean, 0.0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            row = (di * dj).sum(axis=0) / np.sqrt((di * di).sum(axis=0) * (dj * dj).sum(axis=0))
+
+        row = np.where(n[i, others] > 1, row, np.nan)
+        r[i, others] = r[others, i] = np.clip(row, -1.0, 1.0)
+
+    return r, n
+
+
+def _masked_block_corr(
+    x: np.ndarray, mx: np.ndarray,
+    y: np.ndarray, my: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pairwise-complete Pearson r between the columns of two blocks.
+
+    x and y hold values with missing entries set to 0; mx and my are
+    the matching 0/1 presence masks. Every statistic is a matrix
+    product, so a block pair costs six GEMMs regardless of sparsity.
+    """
+    n = mx.T @ my
+    sum_x = x.T @ my
+    sum_y = mx.T @ y
+    sum_xx = (x * x).T @ my
+    sum_yy = mx.T @ (y * y)
+    sum_xy = x.T @ y
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sum_xy - sum_x * sum_y / n
+        var_x = sum_xx - sum_x ** 2 / n
+        var_y = sum_yy - sum_y ** 2 / n
+        r = cov / np.sqrt(var_x * var_y)
+
+    r = np.where((n > 1) & (var_x > 0) & (var_y > 0), r, np.nan)
+    return np.clip(r, -1.0, 1.0), n
+
+
+def correlation_matrix(
+    values: np.ndarray,
+    method: str = "pearson",
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pairwise-complete correlation of the columns of a 2-D array.
+
+    Spearman re-ranks every column pair on its shared rows when there
+    are gaps (exact; one vectorised pass per column instead of the
+    blocked matrix products).
+
+    Args:
+        values: Array of shape (rows, columns); NaN marks missing.
+        method: 'pearson' or 'spearman'.
+        block_size: Number of columns processed per block.
+
+    Returns:
+        Tuple of (r, n, p) arrays, each of shape (columns, columns).
+    """
+    if method not in ("pearson", "spearman"):
+        raise ValueError(f"Unknown correlation method: '{method}'")
+
+    values = np.asarray(values, dtype=np.float64)
+
+    if method == "spearman":
+        if np.isnan(values).any():
+            r, n = _pairwise_spearman(values)
+            return r, n, _p_values(r, n)
+        values = _rank_columns(values)
+
+    mask = ~np.isnan(values)
+
+    # Centre each column on its own mean to limit cancellation error
+    with np.errstate(invalid="ignore"):
+        col_means = np.nanmean(np.where(mask, values, np.nan), axis=0)
+    filled = np.where(mask, values - np.nan_to_num(col_means), 0.0)
+    mask_f = mask.astype(np.float64)
+
+    n_cols = values.shape[1]
+    r = np.empty((n_cols, n_cols))
+    n = np.empty((n_cols, n_cols))
+
+    for i in range(0, n_cols, block_size):
+        bi = slice(i, i + block_size)
+
+        for j in range(i, n_cols, block_size):
+            bj = slice(j, j + block_size)
+
+            r_block, n_block = _masked_block_corr(
+                filled[:, bi], mask_f[:, bi],
+                filled[:, bj], mask_f[:, bj],
+            )
+
+            r[bi, bj] = r_block
+            n[bi, bj] = n_block
+            r[bj, bi] = r_block.T
+            n[bj, bi] = n_block.T
+
+    return r, n, _p_values(r, n)
+
+
+# =============================
+# DataFrame API
+# =============================
+
+def numeric_indicators(df: pd.DataFrame) -> List[str]:
+    """
+    Numeric columns of the master dataset, excluding key columns.
+    """
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    return [col for col in numeric_cols if col not in KEY_COLUMNS]
+
+
+def compute_correlations(
+    df: pd.DataFrame,
+    method: str = "pearson",
+    columns: Optional[Sequence[str]] = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> CorrelationResult:
+    """
+    Correlation matrix of the indicator columns, cached by fingerprint.
+
+    Args:
+        df: Master dataset (or any frame with numeric indicator columns).
+        method: 'pearson' or 'spearman'.
+        columns: Columns to include (default: all numeric indicators).
+        block_size: Number of columns processed per block.
+
+    Returns:
+        CorrelationResult with r, n and p matrices.
+    """
+    columns = list(columns) if columns is not None else numeric_indicators(df)
+
+    key = ("matrix", dataset_fingerprint(df), method, tuple(columns))
+    if key in _CACHE:
+        return _CACHE[key]
+
+    values = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+    r, n, p = correlation_matrix(values, method=method, block_size=block_size)
+
+    result = CorrelationResult(columns=columns, r=r, n=n, p=p)
+    _CACHE[key] = result
+    return result
+
+
+def correlation_table(result: CorrelationResult) -> pd.DataFrame:
+    """
+    Tidy table of unique column pairs sorted by absolute correlation.
+
+    Columns: feature_a, feature_b, r, n, p_value.
+    """
+    i, j = np.triu_indices(len(result.columns), k=1)
+    names = np.asarray(result.columns, dtype=object)
+
+    table = pd.DataFrame({
+        "feature_a": names[i],
+        "feature_b": names[j],
+        "r": result.r[i, j],
+        "n": result.n[i, j].astype(int),
+        "p_value": result.p[i, j],
+    })
+
+    order = np.argsort(-np.abs(table["r"].to_numpy()), kind="stable")
+    return table.iloc[order].reset_index(drop=True)
+
+
+# =============================
+# Lagged Cross-Correlations
+# =============================
+
+def lagged_cross_correlations(
+    df: pd.DataFrame,
+    target: str = "life_expectancy",
+    indicators: Optional[Sequence[str]] = None,
+    max_lag: int = 5,
+) -> LaggedCorrelationResult:
+    """
+    Per-country correlation of each indicator at t-k with the target at t.
+
+    All indicators, countries and lags 0..max_lag are evaluated at once
+    on a dense (indicator, country, year) array; gaps in the year
+    sequence are handled by the pairwise-complete mask.
+
+    Args:
+        df: Long-format panel with iso3, year and indicator columns.
+        target: Column correlated against the lagged indicators.
+        indicators: Lagged columns (default: all numeric except target).
+        max_lag: Largest lag in years.
+
+    Returns:
+        LaggedCorrelationResult with arrays of shape
+        (indicator, country, lag).
+    """
+    if indicators is None:
+        indicators = [col for col in numeric_indicators(df) if col != target]
+    indicators = list(indicators)
+
+    key = ("lagged", dataset_fingerprint(df), target, tuple(indicators), max_lag)
+    if key in _CACHE:
+        return _CACHE[key]
+
+    # (indicator, country, year) view of the dense panel cube
+    cube = PanelCube.from_frame(df, indicators + [target])
+    dense = np.moveaxis(cube.values, -1, 0)
+    x, y = dense[:-1], dense[-1]
+    n_years = y.shape[-1]
+
+    # Pad the front of the year axis so that window w is the series
+    # shifted forward by (max_lag - w) years; reverse to index by lag.
+    padded = np.concatenate(
+        [np.full(x.shape[:2] + (max_lag,), np.nan), x], axis=-1
+    )
+    x_lagged = sliding_window_view(padded, n_years, axis=-1)[..., ::-1, :]
+
+    # Broadcast target to (1, country, 1, year)
+    y_b = y[None, :, None, :]
+    mask = ~np.isnan(x_lagged) & ~np.isnan(y_b)
+
+    n = mask.sum(axis=-1).astype(np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xm = np.where(mask, x_lagged, 0.0)
+        ym = np.where(mask, y_b, 0.0)
+
+        mean_x = xm.sum(axis=-1) / n
+        mean_y = ym.sum(axis=-1) / n
+
+        dx = np.where(mask, x_lagged - mean_x[..., None], 0.0)
+        dy = np.where(mask, y_b - mean_y[..., None], 0.0)
+
+        cov = (dx * dy).sum(axis=-1)
+        r = cov / np.sqrt((dx ** 2).sum(axis=-1) * (dy ** 2).sum(axis=-1))
+
+    r = np.where(n > 1, np.clip(r, -1.0, 1.0), np.nan)
+
+    result = LaggedCorrelationResult(
+        indicators=indicators,
+        countries=list(cube.countries),
+        lags=np.arange(max_lag + 1),
+        r=r,
+        n=n,
+        p=_p_values(r, n),
+    )
+    _CACHE[key] = result
+    return result
+
+
+def lagged_correlation_table(result: LaggedCorrelationResult) -> pd.DataFrame:
+    """
+    Tidy table of lagged correlations.
+
+    Columns: indicator, iso3, lag, r, n, p_value.
+    """
+    shape = result.r.shape
+    ind_idx, country_idx, lag_idx = np.indices(shape).reshape(3, -1)
+
+    return pd.DataFrame({
+        "indicator": np.asarray(result.indicators, dtype=object)[ind_idx],
+        "iso3": np.asarray(result.countries, dtype=object)[country_idx],
+        "lag": result.lags[lag_idx],
+        "r": result.r.ravel(),
+        "n": result.n.ravel().astype(int),
+        "p_value": result.p.ravel(),
+    })
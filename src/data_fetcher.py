@@ -9,13 +9,17 @@ from pathlib import Path
 import pandas as pd
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Callable, List
 
+from src.fetch_scheduler import DEFAULT_PRIORITY, get_scheduler, request_priority
+from src.tracing import span
 from src.eurostat_data_fetcher import (
     fetch_doctors_per_100k,
     fetch_hospital_capacity,
     fetch_household_expenditure,
     fetch_life_expectancy,
+    fetch_life_expectancy_slices,
     fetch_gov_health_expenditure,
 )
 from src.world_bank_data_fetcher import (
@@ -52,6 +56,7 @@ def setup_logging() -> None:
 # Map fetcher functions to their output filenames
 EUROSTAT_FETCHERS = [
     (fetch_life_expectancy, "life_expectancy"),
+    (fetch_life_expectancy_slices, "life_expectancy_slices"),
     (fetch_doctors_per_100k, "doctors_per_100k"),
     (fetch_household_expenditure, "household_expenditure"),
     (fetch_hospital_capacity, "hospital_capacity"),
@@ -78,9 +83,26 @@ def run_fetch_if_missing(fetcher: Callable[[], pd.DataFrame], filename: str) ->
         return
 
     logger.info(f"⬇ File not found. Fetching {filename} from API...")
-    fetcher()
+    with span(f"fetch/{filename}", category="io") as s:
+        df = fetcher()
+        s.set(rows=len(df))
 
-def run_data_acquisition() -> None:
+# Datasets fetched first when requests queue up at a host (the
+# prediction target); the rest follow in list order
+PRIORITY_DATASETS = ["life_expectancy"]
+
+
+def fetch_priority(filename: str) -> int:
+    """
+    Scheduler priority of a dataset (lower goes first).
+    """
+    if filename in PRIORITY_DATASETS:
+        return PRIORITY_DATASETS.index(filename)
+    names = [name for _, name in EUROSTAT_FETCHERS + WORLD_BANK_FETCHERS]
+    return len(PRIORITY_DATASETS) + names.index(filename) if filename in names else DEFAULT_PRIORITY
+
+
+def run_data_acquisition(max_workers: int = 4) -> None:
     """
     Orchestrate data acquisition from all sources.
 
@@ -88,49 +110,48 @@ def run_data_acquisition() -> None:
     handling to ensure that failures in one dataset do not halt the entire
     data acquisition pipeline.
 
+    Datasets are fetched concurrently (max_workers at a time); every
+    HTTP request goes through the shared fetch scheduler, which limits
+    the rate per host and serves the target indicator first.
+
     Logs progress and results for each dataset fetch and a summary at the end.
     """
     setup_logging()
 
     logger.info("=" * 60)
-    logger.info("Starting data acquisition from Eurostat")
+    logger.info("Starting data acquisition from Eurostat and World Bank")
     logger.info("=" * 60)
 
     # Track results
     successful_fetches = []
     failed_fetches = []
 
-    # Fetch Eurostat data
-
-    for fetcher, filename in EUROSTAT_FETCHERS:
-        dataset_name = fetcher.__name__
-        try:
-            logger.info(f"Processing {dataset_name}...")
+    def fetch(fetcher: Callable[[], pd.DataFrame], filename: str) -> None:
+        logger.info(f"Processing {fetcher.__name__}...")
+        with request_priority(fetch_priority(filename)):
             run_fetch_if_missing(fetcher, filename)
-            successful_fetches.append(dataset_name)
-        except Exception as e:
-            logger.error(
-                f"✗ {dataset_name} failed with error: {type(e).__name__}: {str(e)}"
-            )
-            failed_fetches.append((dataset_name, str(e)))
 
-    logger.info("=" * 60)
-    logger.info("Starting data acquisition from World Bank")
-    logger.info("=" * 60)
-
-    # Fetch World Bank data
-
-    for fetcher, filename in WORLD_BANK_FETCHERS:
-        dataset_name = fetcher.__name__
-        try:
-            logger.info(f"Processing {dataset_name}...")
-            run_fetch_if_missing(fetcher, filename)
-            successful_fetches.append(dataset_name)
-        except Exception as e:
-            logger.error(
-                f"✗ {dataset_name} failed with error: {type(e).__name__}: {str(e)}"
-            )
-            failed_fetches.append((dataset_name, str(e)))
+    jobs = sorted(EUROSTAT_FETCHERS + WORLD_BANK_FETCHERS, key=lambda job: fetch_priority(job[1]))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(fetch, fetcher, filename): fetcher.__name__
+            for fetcher, filename in jobs
+        }
+        for future in as_completed(futures):
+            dataset_name = futures[future]
+            try:
+                future.result()
+                successful_fetches.append(dataset_name)
+            except Exception as e:
+                logger.error(
+                    f"✗ {dataset_name} failed with error: {type(e).__name__}: {str(e)}"
+                )
+                failed_fetches.append((dataset_name, str(e)))
+
+    # Keep the summary in the fetcher order
+    order = [fetcher.__name__ for fetcher, _ in jobs]
+    successful_fetches.sort(key=order.index)
+    failed_fetches.sort(key=lambda item: order.index(item[0]))
 
     # Log summary
     total_datasets = len(successful_fetches) + len(failed_fetches)
@@ -152,4 +173,13 @@ def run_data_acquisition() -> None:
         for name, error in failed_fetches:
             logger.warning(f"  ✗ {name}: {error}")
 
+    stats = get_scheduler().stats()
+    if not stats.empty:
+        logger.info("Requests per host:")
+        for row in stats.itertuples():
+            logger.info(
+                f"  {row.host}: {row.requests} requests, {row.rate_limited} rate limited, "
+                f"{row.retries} retries, {row.requests_per_s:.1f} req/s"
+            )
+
     logger.info("=" * 60)
@@ -11,9 +11,13 @@ This module:
 5. Saves processed dataset for modeling
 """
 
+import hashlib
+from collections import OrderedDict
 from pathlib import Path
 import pandas as pd
 
+from src.tracing import span, traced
+
 
 # ISO2 → ISO3 mapping (EU countries only)
 # Used to convert Eurostat country codes
@@ -28,12 +32,42 @@ COUNTRY_ISO2_TO_ISO3 = {
 }
 
 
+# UN geoscheme sub-regions for the EU member states
+# Used to group country-level summaries and reports
+EU_REGIONS = {
+    "DNK": "Northern Europe", "EST": "Northern Europe", "FIN": "Northern Europe",
+    "IRL": "Northern Europe", "LVA": "Northern Europe", "LTU": "Northern Europe",
+    "SWE": "Northern Europe",
+    "AUT": "Western Europe", "BEL": "Western Europe", "FRA": "Western Europe",
+    "DEU": "Western Europe", "LUX": "Western Europe", "NLD": "Western Europe",
+    "BGR": "Eastern Europe", "CZE": "Eastern Europe", "HUN": "Eastern Europe",
+    "POL": "Eastern Europe", "ROU": "Eastern Europe", "SVK": "Eastern Europe",
+    "HRV": "Southern Europe", "CYP": "Southern Europe", "GRC": "Southern Europe",
+    "ITA": "Southern Europe", "MLT": "Southern Europe", "PRT": "Southern Europe",
+    "SVN": "Southern Europe", "ESP": "Southern Europe",
+}
+
+
+# (sex, age) slices of Eurostat life expectancy used as model targets
+# age: Y_LT1 = at birth, Y65 = at 65
+TARGET_SLICES = {
+    ("T", "Y_LT1"): "life_expectancy_birth_total",
+    ("M", "Y_LT1"): "life_expectancy_birth_male",
+    ("F", "Y_LT1"): "life_expectancy_birth_female",
+    ("T", "Y65"): "life_expectancy_65_total",
+    ("M", "Y65"): "life_expectancy_65_male",
+    ("F", "Y65"): "life_expectancy_65_female",
+}
+TARGET_COLUMNS = list(TARGET_SLICES.values())
+
+
 # Folder paths
 RAW_DATA_PATH = Path("data/raw")
 PROCESSED_DATA_PATH = Path("data/processed")
 
 
 # Load dataset from raw folder
+@traced("load/{filename}", category="io", rows=len)
 def load_dataset(filename: str) -> pd.DataFrame:
     """
     Loads a CSV file from data/raw folder.
@@ -43,7 +77,51 @@ def load_dataset(filename: str) -> pd.DataFrame:
     return df
 
 
+# Content fingerprint used as a cache key
+def dataset_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Returns a short content hash of a DataFrame.
+
+    Two frames with the same columns and values give the same
+    fingerprint, so derived results (correlations, summaries,
+    fitted models) can be cached and reused safely.
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+    digest = hashlib.sha1(row_hashes.tobytes())
+    digest.update(",".join(map(str, df.columns)).encode())
+
+    return digest.hexdigest()[:16]
+
+
+# Bounded in-memory cache for fingerprint-keyed results
+class BoundedCache(OrderedDict):
+    """
+    Dict that keeps only the maxsize most recently used entries.
+
+    Used by the module-level caches keyed by dataset fingerprint, so a
+    long session over many datasets or subsets does not keep every
+    derived result alive.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
 # Standardize Eurostat datasets
+@traced("standardize/{indicator_name}", rows=len)
 def standardize_eurostat(df: pd.DataFrame, indicator_name: str) -> pd.DataFrame:
     """
     Standardizes Eurostat dataset:
@@ -75,6 +153,7 @@ def standardize_eurostat(df: pd.DataFrame, indicator_name: str) -> pd.DataFrame:
 
 
 # Standardize World Bank datasets
+@traced("standardize/{indicator_name}", rows=len)
 def standardize_worldbank(df: pd.DataFrame, indicator_name: str) -> pd.DataFrame:
     """
     Standardizes World Bank dataset:
@@ -106,12 +185,47 @@ def standardize_worldbank(df: pd.DataFrame, indicator_name: str) -> pd.DataFrame
     return df
 
 
+# Load sex/age life expectancy slices as separate target columns
+def load_target_slices(filename: str = "life_expectancy_slices") -> pd.DataFrame:
+    """
+    Loads the life expectancy slices (sex x age) and pivots them
+    into one column per TARGET_SLICES entry, keyed by iso3 and year.
+    """
+    df = load_dataset(filename)
+
+    df["target"] = [
+        TARGET_SLICES.get(key) for key in zip(df["sex"], df["age"])
+    ]
+    df = df.dropna(subset=["target"])
+
+    long = standardize_eurostat(df, "value").assign(target=df["target"].to_numpy())
+    long = long.dropna(subset=["iso3"])
+
+    wide = long.pivot_table(
+        index=["iso3", "year"], columns="target", values="value", aggfunc="first"
+    )
+    wide.columns.name = None
+
+    return wide.reindex(
+        columns=[col for col in TARGET_COLUMNS if col in wide.columns]
+    ).reset_index()
+
+
 # Integrate all datasets
-def integrate_datasets() -> pd.DataFrame:
+@traced("integrate_datasets", rows=len)
+def integrate_datasets(how: str = "inner") -> pd.DataFrame:
     """
     Loads, standardizes, and merges all datasets.
     Returns a final master dataset.
+
+    how: "inner" keeps country-years present in every dataset;
+         "left" keeps every life expectancy observation and
+         "outer" every country-year, leaving gaps as NaN for
+         the panel imputer (src/ml/imputation.py). Non-inner
+         results are saved as master_dataset_<how>.csv.
     """
+    if how not in ("inner", "left", "outer"):
+        raise ValueError(f"Unsupported join: '{how}'")
 
     # -------- Eurostat datasets --------
     life = standardize_eurostat(
@@ -193,7 +307,18 @@ def integrate_datasets() -> pd.DataFrame:
     df_master = dfs[0]
 
     for df in dfs[1:]:
-        df_master = df_master.merge(df, on=["iso3", "year"], how="inner")
+        with span(f"merge/{df.columns[-1]}", rows=len(df)) as s:
+            df_master = df_master.merge(df, on=["iso3", "year"], how=how)
+            s.set(rows_out=len(df_master))
+
+    # Regional (non-country) Eurostat codes have no iso3
+    df_master = df_master.dropna(subset=["iso3"])
+
+    # Sex/age target slices, when they have been fetched
+    if (RAW_DATA_PATH / "life_expectancy_slices.csv").exists():
+        df_master = df_master.merge(
+            load_target_slices(), on=["iso3", "year"], how="left"
+        )
 
     # Sort by country and year for readability
     df_master = df_master.sort_values(["iso3", "year"]).reset_index(drop=True)
@@ -202,7 +327,8 @@ def integrate_datasets() -> pd.DataFrame:
     PROCESSED_DATA_PATH.mkdir(parents=True, exist_ok=True)
 
     # Save final dataset
-    df_master.to_csv(PROCESSED_DATA_PATH / "master_dataset.csv", index=False)
+    filename = "master_dataset" if how == "inner" else f"master_dataset_{how}"
+    df_master.to_csv(PROCESSED_DATA_PATH / f"{filename}.csv", index=False)
 
     return df_master
 
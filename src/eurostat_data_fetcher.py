@@ -2,18 +2,50 @@
 Module for fetching data from the Eurostat API.
 """
 
+import gzip
+import io
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, Iterator, List, Optional, Union
 from urllib import response
 from warnings import filters
 
 import pandas as pd
 import requests
-from urllib3 import Retry
+import urllib3
+
+from src.fetch_scheduler import scheduled_get
+from src.tracing import span, traced
+
+
+# Base URL of the dissemination API; override with the EUROSTAT_API_URL
+# environment variable (or this attribute) to use a local stand-in
+EUROSTAT_API_URL = os.environ.get(
+    "EUROSTAT_API_URL",
+    "https://ec.europa.eu/eurostat/api/dissemination/statistics/1.0/data",
+)
+
+# Bulk download endpoint (whole tables as gzip SDMX-CSV or TSV);
+# override with EUROSTAT_BULK_URL
+EUROSTAT_BULK_URL = os.environ.get(
+    "EUROSTAT_BULK_URL",
+    "https://ec.europa.eu/eurostat/api/dissemination/sdmx/2.1/data",
+)
+
+# Ingestion mode of fetch_eurostat_dataset: "json" (filtered API
+# request), "sdmx-csv" or "tsv" (compressed bulk table, filtered
+# while reading); override with EUROSTAT_MODE
+EUROSTAT_MODE = os.environ.get("EUROSTAT_MODE", "json")
+
+BULK_FORMATS = {"sdmx-csv": "SDMX-CSV", "tsv": "TSV"}
 
 
 def fetch_eurostat_dataset(
-    dataset_code: str, filters: Dict[str, Any], filename: str
+    dataset_code: str,
+    filters: Dict[str, Any],
+    filename: str,
+    keep_dimensions: Optional[List[str]] = None,
+    mode: Optional[str] = None,
 ) -> pd.DataFrame:
     """
     Fetch dataset from the Eurostat API and save to CSV.
@@ -27,12 +59,20 @@ def fetch_eurostat_dataset(
                  Keys are dimension codes, values are lists of codes or a single code.
                  Example: {'geo': ['AT', 'BE'], 'time': ['2020', '2021']}
         filename: The name of the output CSV file (without .csv extension).
+        keep_dimensions: Extra dimension codes (e.g. ['sex', 'age']) kept
+                         as columns, for datasets fetched with several
+                         codes per dimension.
+        mode: "json" (default, see EUROSTAT_MODE) requests the filtered
+              SDMX-JSON; "sdmx-csv" / "tsv" download the compressed bulk
+              table and apply the filters while reading it
+              (see fetch_eurostat_bulk).
 
     Returns:
         A pandas DataFrame containing the processed dataset with columns:
         - country: Country/geographic code
         - year: Year (integer)
         - value: Indicator value
+        - one column per kept dimension
 
     Raises:
         requests.exceptions.RequestException: If the API request fails.
@@ -44,11 +84,14 @@ def fetch_eurostat_dataset(
         >>> df = fetch_eurostat_dataset('hlth_silc_01', filters, 'health_data')
         >>> df.head()
     """
+    mode = mode or EUROSTAT_MODE
+    if mode in BULK_FORMATS:
+        return fetch_eurostat_bulk(dataset_code, filters, filename, keep_dimensions, mode)
+    if mode != "json":
+        raise ValueError(f"Unknown Eurostat ingestion mode: {mode}")
+
     # Construct the API URL
-    api_url = (
-        f"https://ec.europa.eu/eurostat/api/dissemination/statistics/1.0/data/"
-        f"{dataset_code}"
-    )
+    api_url = f"{EUROSTAT_API_URL.rstrip('/')}/{dataset_code}"
 
     params = {"format": "JSON"}
 
@@ -59,30 +102,16 @@ def fetch_eurostat_dataset(
         else:
             params[dim] = codes
 
-    # Fetch data from the API
-    
-    # Create session with retry logic
-    from requests.adapters import HTTPAdapter
-    from urllib3.util.retry import Retry
-
-    session = requests.Session()
-
-    retry_strategy = Retry(
-        total=5,                     # retry up to 5 times
-        backoff_factor=1,            # exponential backoff
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["GET"],
-    )
-
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("https://", adapter)
-
+    # Fetch data from the API; the shared scheduler applies the
+    # per-host rate limit and retries 429 / 5xx (honouring Retry-After)
     try:
-        response = session.get(
-            api_url,
-            params=params,
-            timeout=(5, 60)  # (connect timeout, read timeout)
-        )
+        with span("http/eurostat", category="io", dataset=dataset_code) as s:
+            response = scheduled_get(
+                api_url,
+                params=params,
+                timeout=(5, 60)  # (connect timeout, read timeout)
+            )
+            s.set(bytes=len(response.content), status=response.status_code)
 
         response.raise_for_status()
 
@@ -96,7 +125,7 @@ def fetch_eurostat_dataset(
         raise ValueError(f"Failed to parse JSON response: {e}")
 
     # Convert SDMX-style JSON to DataFrame
-    df = sdmx_to_dataframe(response_data)
+    df = sdmx_to_dataframe(response_data, keep_dimensions)
 
     # Ensure output directory exists
     output_dir = Path("data/raw")
@@ -109,15 +138,20 @@ def fetch_eurostat_dataset(
     return df
 
 
-def sdmx_to_dataframe(sdmx_data: Dict[str, Any]) -> pd.DataFrame:
+@traced("parse/sdmx", rows=len)
+def sdmx_to_dataframe(
+    sdmx_data: Dict[str, Any], keep_dimensions: Optional[List[str]] = None
+) -> pd.DataFrame:
     """
     Convert SDMX-JSON format data to a tidy pandas DataFrame.
 
     Args:
         sdmx_data: The SDMX-JSON data dictionary from Eurostat API.
+        keep_dimensions: Extra dimension codes to keep as columns.
 
     Returns:
-        A tidy DataFrame with columns: country, year, value.
+        A tidy DataFrame with columns: country, year, value
+        (followed by the kept dimensions).
 
     Raises:
         KeyError: If the expected SDMX structure is not found.
@@ -146,6 +180,15 @@ def sdmx_to_dataframe(sdmx_data: Dict[str, Any]) -> pd.DataFrame:
         if geo_idx is None or time_idx is None:
             raise KeyError("Expected 'geo' and 'time' dimensions not found in data")
 
+        keep_dimensions = list(keep_dimensions or [])
+        kept_maps = {
+            dim: (
+                dimensions_list.index(dim),
+                {idx: code for code, idx in dimension[dim]["category"]["index"].items()},
+            )
+            for dim in keep_dimensions
+        }
+
         # Build mapping from index to values
         geo_map = {
             idx: code
@@ -175,16 +218,17 @@ def sdmx_to_dataframe(sdmx_data: Dict[str, Any]) -> pd.DataFrame:
                 except ValueError:
                     continue
 
-                rows.append(
-                    {"country": country, "year": year_int, "value": float(value)}
-                )
+                row = {"country": country, "year": year_int, "value": float(value)}
+                for dim, (dim_idx, code_map) in kept_maps.items():
+                    row[dim] = code_map.get(indices[dim_idx])
+                rows.append(row)
 
         if not rows:
             raise ValueError("No valid data rows extracted from SDMX response")
 
         df = pd.DataFrame(rows)
-        return df[["country", "year", "value"]].sort_values(
-            by=["country", "year"]
+        return df[["country", "year", "value"] + keep_dimensions].sort_values(
+            by=["country", "year"] + keep_dimensions
         ).reset_index(drop=True)
 
     except KeyError as e:
@@ -217,6 +261,241 @@ def decode_multidimensional_index(
     return indices
 
 
+# =============================
+# Bulk Download Ingestion
+# =============================
+
+def fetch_eurostat_bulk(
+    dataset_code: str,
+    filters: Dict[str, Any],
+    filename: str,
+    keep_dimensions: Optional[List[str]] = None,
+    fmt: str = "sdmx-csv",
+) -> pd.DataFrame:
+    """
+    Fetch a whole Eurostat table as a compressed bulk file and save the
+    filtered rows to CSV.
+
+    Far less data per row than SDMX-JSON: the gzip body is streamed
+    from the socket, decompressed and parsed on the fly, and rows
+    outside the filters are dropped while reading, so neither the
+    compressed file nor the unselected rows are ever held in memory.
+
+    Args:
+        dataset_code, filters, filename, keep_dimensions: As for
+            fetch_eurostat_dataset.
+        fmt: "sdmx-csv" or "tsv".
+
+    Returns:
+        The same tidy country, year, value (plus kept dimensions) table
+        as the JSON path.
+
+    Raises:
+        RuntimeError: If the download fails.
+        ValueError: On an unknown format or when no rows match.
+    """
+    if fmt not in BULK_FORMATS:
+        raise ValueError(f"Unknown bulk format: {fmt}")
+
+    api_url = f"{EUROSTAT_BULK_URL.rstrip('/')}/{dataset_code}"
+    params = {"format": BULK_FORMATS[fmt], "compressed": "true"}
+
+    try:
+        with span("http/eurostat_bulk", category="io", dataset=dataset_code, format=fmt) as s:
+            response = scheduled_get(api_url, params=params, timeout=(5, 300), stream=True)
+            s.set(
+                bytes=int(response.headers.get("Content-Length") or 0),
+                status=response.status_code,
+            )
+
+        with response:
+            response.raise_for_status()
+
+            # Undo any transport Content-Encoding (the gzip file itself
+            # is detected and decompressed by the readers), and keep the
+            # raw stream readable at EOF for the buffered readers on top
+            response.raw.decode_content = True
+            response.raw.auto_close = False
+            if fmt == "sdmx-csv":
+                df = read_eurostat_sdmx_csv(response.raw, filters, keep_dimensions)
+            else:
+                df = read_eurostat_tsv(response.raw, filters, keep_dimensions)
+
+    except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+        # urllib3 errors surface while the streamed body is being read
+        raise RuntimeError(f"Eurostat bulk download failed: {e}")
+
+    output_dir = Path("data/raw")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    df.to_csv(output_dir / f"{filename}.csv", index=False)
+
+    return df
+
+
+def _filter_sets(filters: Dict[str, Any]) -> Dict[str, set]:
+    """
+    Filters as sets of accepted codes ('+'-joined strings, lists or
+    single codes, as accepted by the JSON API).
+    """
+    sets = {}
+    for dim, codes in filters.items():
+        if isinstance(codes, str):
+            codes = codes.split("+")
+        sets[dim] = {str(code) for code in codes}
+    return sets
+
+
+def _open_text(source: Union[str, Path, IO[bytes]]) -> IO[str]:
+    """
+    Text stream over a (possibly gzip-compressed) file or byte stream;
+    gzip is detected by its magic bytes and decompressed on the fly.
+    """
+    raw = open(source, "rb") if isinstance(source, (str, Path)) else source
+    if not hasattr(raw, "peek"):
+        raw = io.BufferedReader(raw)
+    if raw.peek(2)[:2] == b"\x1f\x8b":
+        raw = gzip.GzipFile(fileobj=raw)
+    return io.TextIOWrapper(raw, encoding="utf-8")
+
+
+def _tidy_bulk(df: pd.DataFrame, keep_dimensions: List[str]) -> pd.DataFrame:
+    """
+    Shared tail of the bulk readers: annual numeric rows only, in the
+    column order and sort order of sdmx_to_dataframe.
+    """
+    df = df.assign(
+        year=pd.to_numeric(df["year"].str.strip(), errors="coerce"),
+        value=pd.to_numeric(df["value"], errors="coerce"),
+    ).dropna(subset=["country", "year", "value"])
+
+    if df.empty:
+        raise ValueError("No valid data rows extracted from bulk file")
+
+    df["year"] = df["year"].astype(int)
+    return df[["country", "year", "value"] + keep_dimensions].sort_values(
+        by=["country", "year"] + keep_dimensions
+    ).reset_index(drop=True)
+
+
+@traced("parse/sdmx_csv", rows=len)
+def read_eurostat_sdmx_csv(
+    source: Union[str, Path, IO[bytes]],
+    filters: Optional[Dict[str, Any]] = None,
+    keep_dimensions: Optional[List[str]] = None,
+    chunksize: int = 200_000,
+) -> pd.DataFrame:
+    """
+    Parse an (optionally gzip-compressed) SDMX-CSV bulk file.
+
+    Read in chunks of chunksize rows with only the needed columns;
+    each chunk is filtered before the next one is decompressed.
+    A 'time' filter applies to TIME_PERIOD.
+
+    Raises:
+        KeyError: If a filtered or kept dimension is not in the file.
+        ValueError: If no rows match.
+    """
+    filter_sets = _filter_sets(filters or {})
+    keep_dimensions = list(keep_dimensions or [])
+
+    with _open_text(source) as text:
+        columns = [col.strip() for col in text.readline().rstrip("\r\n").split(",")]
+        column_of = {"time": "TIME_PERIOD"}
+
+        needed = ["geo", "TIME_PERIOD", "OBS_VALUE"] + [
+            column_of.get(dim, dim) for dim in list(filter_sets) + keep_dimensions
+        ]
+        missing = [col for col in needed if col not in columns]
+        if missing:
+            raise KeyError(f"Unexpected SDMX-CSV structure: missing columns {missing}")
+
+        reader = pd.read_csv(
+            text,
+            names=columns,
+            usecols=list(dict.fromkeys(needed)),
+            dtype=str,
+            keep_default_na=False,
+            chunksize=chunksize,
+        )
+        chunks = []
+        for chunk in reader:
+            for dim, codes in filter_sets.items():
+                chunk = chunk[chunk[column_of.get(dim, dim)].isin(codes)]
+            chunks.append(chunk)
+
+    df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=needed)
+    df = df.rename(columns={"geo": "country", "TIME_PERIOD": "year", "OBS_VALUE": "value"})
+    return _tidy_bulk(df, keep_dimensions)
+
+
+def _iter_tsv_rows(
+    text: IO[str], filter_sets: Dict[str, set], keep_dimensions: List[str]
+) -> Iterator[tuple]:
+    """
+    Yield (country, year, value, *kept dimensions) from TSV lines,
+    skipping lines whose key fails the filters before splitting their
+    values.
+    """
+    header = text.readline().rstrip("\r\n").split("\t")
+    # First cell: "freq,unit,geo\TIME_PERIOD" (or "...\time")
+    dimensions = [dim.strip() for dim in header[0].split("\\")[0].split(",")]
+    periods = [period.strip() for period in header[1:]]
+
+    unknown = [d for d in list(filter_sets) + keep_dimensions if d not in dimensions + ["time"]]
+    if unknown or "geo" not in dimensions:
+        raise KeyError(f"Unexpected TSV structure: missing dimensions {unknown or ['geo']}")
+
+    key_checks = [(dimensions.index(d), codes) for d, codes in filter_sets.items() if d != "time"]
+    geo_pos = dimensions.index("geo")
+    kept_pos = [dimensions.index(d) for d in keep_dimensions]
+
+    # Period columns selected once from the header
+    time_codes = filter_sets.get("time")
+    selected = [
+        (i, period) for i, period in enumerate(periods)
+        if time_codes is None or period in time_codes
+    ]
+
+    for line in text:
+        key, _, rest = line.partition("\t")
+        key = key.split(",")
+        if any(key[pos] not in codes for pos, codes in key_checks):
+            continue
+
+        cells = rest.rstrip("\r\n").split("\t")
+        kept = tuple(key[pos] for pos in kept_pos)
+        for i, period in selected:
+            # "12.3 p" = value and flag, ": " = missing
+            value = cells[i].split(" ", 1)[0] if i < len(cells) else ":"
+            if value and value != ":":
+                yield (key[geo_pos], period, value) + kept
+
+
+@traced("parse/tsv", rows=len)
+def read_eurostat_tsv(
+    source: Union[str, Path, IO[bytes]],
+    filters: Optional[Dict[str, Any]] = None,
+    keep_dimensions: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Parse an (optionally gzip-compressed) Eurostat TSV bulk file: one
+    line per series key, one column per period, values with optional
+    flags. Lines are decompressed and filtered one at a time.
+
+    Raises:
+        KeyError: If a filtered or kept dimension is not in the file.
+        ValueError: If no rows match.
+    """
+    filter_sets = _filter_sets(filters or {})
+    keep_dimensions = list(keep_dimensions or [])
+
+    with _open_text(source) as text:
+        rows = list(_iter_tsv_rows(text, filter_sets, keep_dimensions))
+
+    df = pd.DataFrame(rows, columns=["country", "year", "value"] + keep_dimensions)
+    return _tidy_bulk(df, keep_dimensions)
+
+
 def fetch_life_expectancy() -> pd.DataFrame:
     """
     Fetch life expectancy data from Eurostat for 65 Years Old.
@@ -229,6 +508,22 @@ def fetch_life_expectancy() -> pd.DataFrame:
     return fetch_eurostat_dataset("demo_r_mlifexp", filters, "life_expectancy")
 
 
+def fetch_life_expectancy_slices() -> pd.DataFrame:
+    """
+    Fetch life expectancy from Eurostat at birth and at 65,
+    for males, females and total.
+
+    Returns:
+        A pandas DataFrame containing life expectancy data with columns:
+        country, year, value, sex and age.
+    """
+    filters = {"sex": ["M", "F", "T"], "age": ["Y_LT1", "Y65"]}
+    return fetch_eurostat_dataset(
+        "demo_r_mlifexp", filters, "life_expectancy_slices",
+        keep_dimensions=["sex", "age"],
+    )
+
+
 def fetch_doctors_per_100k() -> pd.DataFrame:
     """
     Fetch practicing doctors per 100,000 population data from Eurostat.
@@ -7,6 +7,7 @@ This module is responsible for:
 • Loading the integrated master dataset
 • Performing descriptive statistics
 • Conducting data quality checks
+• Summarising per-country trends and gaps by region
 • Printing structured dataset summaries
 
 NOTE:
@@ -21,6 +22,16 @@ All visualisation logic is handled in visualisations.py.
 from pathlib import Path
 import pandas as pd
 
+from src.correlation import (
+    compute_correlations,
+    correlation_table,
+    lagged_correlation_table,
+    lagged_cross_correlations,
+)
+from src.panel import panel_cube
+from src.panel_summary import panel_summary
+from src.query import load_master_index
+
 
 # =============================
 # Data Loading
@@ -41,7 +52,8 @@ def load_data() -> pd.DataFrame:
         / "master_dataset.csv"
     )
 
-    return pd.read_csv(data_path)
+    # Sorted (iso3, year) frame, cached while the file is unchanged
+    return load_master_index(data_path).frame
 
 
 # =============================
@@ -94,6 +106,102 @@ def basic_summary(df: pd.DataFrame) -> None:
     duplicates = df.duplicated(subset=["iso3", "year"], keep=False).sum()
     print(f"Duplicate rows: {duplicates}")
 
+    # Panel coverage: observed share of the full country x year grid
+    if duplicates == 0:
+        cube = panel_cube(df)
+        n_cells = len(cube.countries) * len(cube.years)
+        coverage = cube.mask.reshape(n_cells, -1).mean(axis=0) * 100
+        print(
+            f"\nPanel coverage ({len(cube.countries)} countries × "
+            f"{cube.years.start}-{cube.years.stop - 1}):"
+        )
+        print(pd.Series(coverage, index=list(cube.indicators), name="Observed %").round(2))
+
+    print("=" * 80)
+
+
+def correlation_summary(
+    df: pd.DataFrame,
+    target: str = "life_expectancy",
+    top_n: int = 10,
+    max_lag: int = 5,
+) -> None:
+    """
+    Print the strongest indicator correlations and, for each indicator,
+    the lag with the highest median per-country correlation to the target.
+
+    Uses the cached arrays from src.correlation, so the heatmap
+    generated later reuses the same computation.
+    """
+
+    print("\n" + "=" * 80)
+    print("CORRELATION SUMMARY")
+    print("=" * 80)
+
+    pairs = correlation_table(compute_correlations(df, method="pearson"))
+    print(f"\nTop {top_n} Pearson correlations (pairwise-complete):")
+    print(pairs.head(top_n).round(4).to_string(index=False))
+
+    lagged = lagged_correlation_table(
+        lagged_cross_correlations(df, target=target, max_lag=max_lag)
+    )
+    by_lag = (
+        lagged.groupby(["indicator", "lag"])["r"]
+        .median()
+        .reset_index()
+    )
+    best = by_lag.loc[by_lag["r"].abs().groupby(by_lag["indicator"]).idxmax()]
+
+    print(f"\nStrongest lag vs {target} (median per-country r):")
+    print(best.round(4).to_string(index=False))
+
+    print("=" * 80)
+
+
+def trend_summary(
+    df: pd.DataFrame,
+    target: str = "life_expectancy",
+    top_n: int = 10,
+) -> None:
+    """
+    Print per-region trends of the target and the country series with
+    the most gaps, from the cached per-country panel summary.
+    """
+
+    print("\n" + "=" * 80)
+    print("PANEL TRENDS")
+    print("=" * 80)
+
+    summary = panel_summary(df)
+
+    by_region = (
+        summary[summary["indicator"] == target]
+        .groupby("region")
+        .agg(
+            countries=("iso3", "nunique"),
+            first_year=("first_year", "min"),
+            last_year=("last_year", "max"),
+            median_slope=("trend_slope", "median"),
+            median_cagr=("cagr", "median"),
+        )
+    )
+    print(f"\n{target} trend by region (median over countries):")
+    print(by_region.round(4).to_string())
+
+    gaps = (
+        summary[summary["missing_years"] > 0]
+        .sort_values("missing_years", ascending=False)
+        .head(top_n)
+    )
+    print(f"\nTop {top_n} series by missing years inside their span:")
+    if gaps.empty:
+        print("None")
+    else:
+        print(
+            gaps[["iso3", "indicator", "first_year", "last_year", "missing_years"]]
+            .to_string(index=False)
+        )
+
     print("=" * 80)
 
 
@@ -108,6 +216,8 @@ def run_eda_summary() -> None:
     This function:
     1. Loads the master dataset
     2. Prints structured summary information
+    3. Prints per-region trends and gaps of the country series
+    4. Prints correlation and lagged-correlation highlights
     """
 
     print("\n" + "=" * 100)
@@ -117,4 +227,6 @@ def run_eda_summary() -> None:
     df = load_data()
     print(f"✓ Data loaded successfully: {df.shape}")
 
-    basic_summary(df)
\ No newline at end of file
+    basic_summary(df)
+    trend_summary(df)
+    correlation_summary(df)
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""
+Feature Engineering Module
+--------------------------
+
+Runs between integrate_datasets() and the ML stage (clean_data) and
+adds per-country temporal features for configured indicators:
+
+• Lags:             value at t-k
+• Growth:           year-over-year growth rate (x_t / x_{t-1} - 1)
+• Rolling windows:  mean and standard deviation over the last w years
+
+All features are computed at once on the dense panel cube
+(src/panel.py) built from the sorted (iso3, year) rows, so there are
+no per-country loops. Because the array is indexed
+by calendar year, gaps are handled correctly: a lag of k years always
+refers to year t-k (NaN if that year is missing), never to the
+previous available row.
+"""
+
+# =============================
+# Imports
+# =============================
+
+import warnings
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.panel import PanelCube
+
+
+# indicator -> {"lags": [...], "growth": bool, "windows": [...]}
+FeatureConfig = Dict[str, Dict[str, object]]
+
+# Health spending and doctor density act on life expectancy with a delay
+DEFAULT_FEATURE_CONFIG: FeatureConfig = {
+    "gov_health_expenditure": {"lags": [1, 2, 3], "growth": True, "windows": [3]},
+    "doctors_per_100k": {"lags": [1, 2, 3], "growth": True, "windows": [3]},
+    "gdp_per_capita": {"lags": [1], "growth": True, "windows": []},
+}
+
+
+# =============================
+# Dense Panel Helpers
+# =============================
+
+def _shift(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Shift along the year axis by k years, filling with NaN.
+    """
+    shifted = np.full_like(values, np.nan)
+    if k < values.shape[-1]:
+        shifted[..., k:] = values[..., :values.shape[-1] - k]
+    return shifted
+
+
+def _rolling_sums(values: np.ndarray, window: int):
+    """
+    Rolling count, sum and sum of squares over the year axis,
+    ignoring NaN, via cumulative sums.
+    """
+    observed = ~np.isnan(values)
+    filled = np.where(observed, values, 0.0)
+
+    def rolling(a: np.ndarray) -> np.ndarray:
+        cs = np.cumsum(a, axis=-1)
+        out = cs.copy()
+        out[..., window:] -= cs[..., :-window]
+        return out
+
+    return (
+        rolling(observed.astype(np.float64)),
+        rolling(filled),
+        rolling(filled * filled),
+    )
+
+
+def feature_names(config: FeatureConfig) -> List[str]:
+    """
+    Names of the columns generated for a config, in output order.
+    """
+    names = []
+    for indicator, spec in config.items():
+        names += [f"{indicator}_lag{k}" for k in spec.get("lags", [])]
+        if spec.get("growth", False):
+            names.append(f"{indicator}_growth")
+        for w in spec.get("windows", []):
+            names += [f"{indicator}_roll{w}_mean", f"{indicator}_roll{w}_std"]
+    return names
+
+
+# =============================
+# Public API
+# =============================
+
+def engineer_features(
+    df: pd.DataFrame,
+    config: FeatureConfig = DEFAULT_FEATURE_CONFIG,
+    min_periods: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Add lag, growth and rolling-window features to a long panel.
+
+    Args:
+        df: Panel with iso3, year and the configured indicator columns
+            (one row per country-year).
+        config: indicator -> {"lags": [k, ...], "growth": bool,
+                              "windows": [w, ...]}.
+        min_periods: Observed years required inside a rolling window
+                     (default: the full window).
+
+    Returns:
+        Copy of df sorted by (iso3, year) with the new columns appended.
+    """
+    indicators = list(config)
+    missing = [col for col in indicators if col not in df.columns]
+    if missing:
+        raise KeyError(f"Configured indicators not in data: {missing}")
+
+    out = df.sort_values(["iso3", "year"], kind="stable").reset_index(drop=True)
+
+    if out.duplicated(subset=["iso3", "year"]).any():
+        raise ValueError("Feature engineering needs one row per (iso3, year).")
+
+    # Dense panel, viewed as (indicator, country, year) so every
+    # operation below runs along the last (year) axis
+    cube = PanelCube.from_frame(out, indicators)
+    dense = cube.values.transpose(2, 0, 1)
+    country_codes, year_offsets = cube.locate(out["iso3"], out["year"])
+
+    new_columns: Dict[str, np.ndarray] = {}
+
+    def gather(values: np.ndarray) -> np.ndarray:
+        return values[country_codes, year_offsets]
+
+    for i, (indicator, spec) in enumerate(config.items()):
+        series = dense[i]
+
+        for k in spec.get("lags", []):
+            new_columns[f"{indicator}_lag{k}"] = gather(_shift(series, k))
+
+        if spec.get("growth", False):
+            previous = _shift(series, 1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                growth = np.where(previous != 0, series / previous - 1.0, np.nan)
+            new_columns[f"{indicator}_growth"] = gather(growth)
+
+        for w in spec.get("windows", []):
+            required = w if min_periods is None else min_periods
+
+            # Centre per country to keep the variance sums well conditioned
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                centre = np.nan_to_num(np.nanmean(series, axis=-1, keepdims=True))
+            count, total, total_sq = _rolling_sums(series - centre, w)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mean = total / count
+                var = (total_sq - count * mean ** 2) / (count - 1)
+
+            valid = count >= required
+            new_columns[f"{indicator}_roll{w}_mean"] = gather(
+                np.where(valid, mean + centre, np.nan)
+            )
+            new_columns[f"{indicator}_roll{w}_std"] = gather(
+                np.where(valid & (count > 1), np.sqrt(np.clip(var, 0.0, None)), np.nan)
+            )
+
+    return pd.concat([out, pd.DataFrame(new_columns, index=out.index)], axis=1)
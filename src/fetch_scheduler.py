@@ -0,0 +1,422 @@
+"""
+Rate-Limited Fetch Scheduler
+----------------------------
+
+Single entry point for every HTTP GET made by the fetchers:
+
+• Token bucket per host (requests / second with a burst allowance)
+• Adaptive concurrency per host (AIMD): the in-flight limit and the
+  request rate are halved on 429 and grow back additively after
+  successes; a Retry-After header pauses the host for that long
+• Priority queue: lower numbers go first (e.g. the target indicator
+  before the features); a host that is not ready never blocks
+  requests to other hosts
+• Retries for 429 and 5xx / connection errors with exponential
+  backoff, up to max_retries
+• Per-host throughput stats (requests, 429s, retries, bytes, mean
+  latency, requests per second, current limits)
+
+    response = scheduled_get(url, params=params, timeout=60)
+
+    with request_priority(0):
+        fetch_life_expectancy()   # every request inside goes first
+"""
+
+# =============================
+# Imports
+# =============================
+
+import bisect
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import pandas as pd
+import requests
+
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+DEFAULT_PRIORITY = 10
+
+
+@dataclass
+class HostConfig:
+    """
+    Limits for one host: steady request rate (per second), burst
+    size and maximum concurrent requests.
+    """
+    rate: float = 5.0
+    burst: float = 5.0
+    max_concurrency: int = 4
+
+
+# Conservative defaults for the providers we call
+HOST_CONFIGS: Dict[str, HostConfig] = {
+    "ec.europa.eu": HostConfig(rate=4.0, burst=4.0, max_concurrency=3),
+    "api.worldbank.org": HostConfig(rate=8.0, burst=8.0, max_concurrency=6),
+}
+
+
+# =============================
+# Per-host state
+# =============================
+
+class HostLimiter:
+    """
+    Token bucket plus AIMD concurrency limit for one host.
+    Not thread-safe on its own; the scheduler holds its lock.
+    """
+
+    def __init__(self, config: HostConfig):
+        self.config = config
+        self.rate = config.rate
+        self.tokens = config.burst
+        self.limit = float(config.max_concurrency)
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._updated = time.monotonic()
+
+        self.stats = {
+            "requests": 0, "ok": 0, "rate_limited": 0, "server_errors": 0,
+            "connection_errors": 0, "retries": 0, "bytes": 0, "latency_s": 0.0,
+            "first_start": None, "last_end": None,
+        }
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.config.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def ready_in(self, now: float) -> float:
+        """
+        Seconds until a request may start (0 = now; inf = wait for a
+        request to finish).
+        """
+        self._refill(now)
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.in_flight >= max(1, int(self.limit)):
+            return float("inf")
+        if self.tokens < 1.0:
+            return (1.0 - self.tokens) / self.rate
+        return 0.0
+
+    def acquire(self, now: float) -> None:
+        self.tokens -= 1.0
+        self.in_flight += 1
+        self.stats["requests"] += 1
+        if self.stats["first_start"] is None:
+            self.stats["first_start"] = now
+
+    def release(self, now: float, status: Optional[int], latency: float, n_bytes: int,
+                retry_after: Optional[float]) -> None:
+        self.in_flight -= 1
+        self.stats["latency_s"] += latency
+        self.stats["bytes"] += n_bytes
+        self.stats["last_end"] = now
+
+        if status == 429:
+            self.stats["rate_limited"] += 1
+            # Multiplicative decrease of both concurrency and rate
+            self.limit = max(1.0, self.limit / 2.0)
+            self.rate = max(self.config.rate / 16.0, self.rate / 2.0)
+            self.tokens = min(self.tokens, 0.0)
+            if retry_after:
+                self.paused_until = max(self.paused_until, now + retry_after)
+        elif status is None:
+            self.stats["connection_errors"] += 1
+        elif status >= 500:
+            self.stats["server_errors"] += 1
+        else:
+            self.stats["ok"] += 1
+            # Additive increase back towards the configured limits
+            self.limit = min(float(self.config.max_concurrency), self.limit + 1.0 / self.limit)
+            self.rate = min(self.config.rate, self.rate + self.config.rate / 10.0)
+
+
+@dataclass(order=True)
+class _Task:
+    priority: int
+    not_before: float
+    seq: int
+    url: str = field(compare=False)
+    kwargs: Dict = field(compare=False)
+    future: Future = field(compare=False)
+    attempt: int = field(default=0, compare=False)
+
+    @property
+    def host(self) -> str:
+        return urlparse(self.url).netloc
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After as seconds (delta-seconds or HTTP date).
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+def _response_bytes(response: requests.Response, stream: bool) -> int:
+    """
+    Body size for the stats. A streamed body is left for the caller
+    to read, so its size comes from Content-Length (0 if absent).
+    """
+    if not stream:
+        return len(response.content)
+    try:
+        return int(response.headers.get("Content-Length", 0))
+    except ValueError:
+        return 0
+
+
+# =============================
+# Scheduler
+# =============================
+
+class FetchScheduler:
+    """
+    Priority queue of GET requests served by a pool of worker threads
+    under per-host limits; see the module docstring.
+
+    Args:
+        n_workers: Worker threads (upper bound on total concurrency).
+        host_configs: Limits per host (netloc); others use default_config.
+        max_retries: Retries per request for 429 / 5xx / connection errors.
+        backoff: Base of the exponential backoff (seconds) when the
+                 server gives no Retry-After.
+    """
+
+    def __init__(
+        self,
+        n_workers: int = 8,
+        host_configs: Optional[Dict[str, HostConfig]] = None,
+        default_config: Optional[HostConfig] = None,
+        max_retries: int = 5,
+        backoff: float = 0.5,
+    ):
+        self.host_configs = dict(HOST_CONFIGS if host_configs is None else host_configs)
+        self.default_config = default_config or HostConfig()
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+        self._queue: List[_Task] = []
+        self._hosts: Dict[str, HostLimiter] = {}
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._local = threading.local()
+        self._closed = False
+
+        self._workers = [
+            threading.Thread(target=self._work, daemon=True, name=f"fetch-{i}")
+            for i in range(n_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    # -------- Public API --------
+
+    def submit(self, url: str, priority: int = DEFAULT_PRIORITY, **kwargs) -> Future:
+        """
+        Queue a GET (kwargs as for requests.get); the future resolves
+        to the final Response or raises the error of the last attempt.
+        With stream=True the body is not read; the caller reads (and
+        closes) it.
+        """
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Scheduler is closed")
+            task = _Task(priority, 0.0, next(self._seq), url, kwargs, future)
+            self._limiter(task.host)
+            bisect.insort(self._queue, task)
+            self._cond.notify_all()
+        return future
+
+    def get(self, url: str, priority: int = DEFAULT_PRIORITY, **kwargs) -> requests.Response:
+        return self.submit(url, priority, **kwargs).result()
+
+    def stats(self) -> pd.DataFrame:
+        """
+        One row per host with counters, mean latency, throughput and
+        the current adaptive limits.
+        """
+        rows = []
+        with self._cond:
+            for host, limiter in self._hosts.items():
+                s = dict(limiter.stats)
+                first, last = s.pop("first_start"), s.pop("last_end")
+                elapsed = (last - first) if first is not None and last is not None else 0.0
+                done = s["ok"] + s["rate_limited"] + s["server_errors"] + s["connection_errors"]
+                rows.append({
+                    "host": host,
+                    **s,
+                    "mean_latency_s": s["latency_s"] / done if done else float("nan"),
+                    "requests_per_s": done / elapsed if elapsed > 0 else float("nan"),
+                    "rate_limit": limiter.rate,
+                    "concurrency_limit": limiter.limit,
+                })
+        return pd.DataFrame(rows)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        for worker in self._workers:
+            worker.join()
+
+    # -------- Internals --------
+
+    def _limiter(self, host: str) -> HostLimiter:
+        if host not in self._hosts:
+            config = self.host_configs.get(host, self.default_config)
+            self._hosts[host] = HostLimiter(config)
+        return self._hosts[host]
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def _next_task(self) -> Optional[_Task]:
+        """
+        Highest-priority queued task whose host can start now,
+        waiting until one can.
+        """
+        with self._cond:
+            while True:
+                if self._closed and not self._queue:
+                    return None
+
+                now = time.monotonic()
+                wait = None
+                for i, task in enumerate(self._queue):
+                    delay = max(task.not_before - now, self._hosts[task.host].ready_in(now))
+                    if delay <= 0:
+                        del self._queue[i]
+                        self._hosts[task.host].acquire(now)
+                        return task
+                    if delay != float("inf"):
+                        wait = delay if wait is None else min(wait, delay)
+
+                self._cond.wait(timeout=wait)
+
+    def _work(self) -> None:
+        while True:
+            task = self._next_task()
+            if task is None:
+                return
+
+            start = time.monotonic()
+            response, status, n_bytes, retry_after, error = None, None, 0, None, None
+            try:
+                response = self._session().get(task.url, **task.kwargs)
+                status = response.status_code
+                n_bytes = _response_bytes(response, task.kwargs.get("stream", False))
+                retry_after = _retry_after_seconds(response.headers.get("Retry-After"))
+            except BaseException as e:
+                # Anything raised goes to the caller; the worker, the
+                # host's in-flight slot and the future must not be lost
+                response, status, error = None, None, e
+
+            now = time.monotonic()
+            with self._cond:
+                self._hosts[task.host].release(
+                    now, status, now - start, n_bytes,
+                    retry_after if status == 429 else None,
+                )
+
+                retryable = (
+                    isinstance(error, requests.exceptions.RequestException)
+                    or (error is None and status in RETRY_STATUSES)
+                )
+                retry = retryable and task.attempt < self.max_retries
+                if retry:
+                    self._hosts[task.host].stats["retries"] += 1
+                    delay = retry_after if retry_after is not None else self.backoff * 2 ** task.attempt
+                    task.attempt += 1
+                    task.not_before = now + delay
+                    task.seq = next(self._seq)
+                    bisect.insort(self._queue, task)
+                    logger.debug(f"Retrying {task.url} in {delay:.2f}s (status {status})")
+                self._cond.notify_all()
+
+            if retry:
+                # Discarded attempt: with stream=True its body is unread
+                # and the pooled connection is only returned on close
+                if response is not None:
+                    response.close()
+                continue
+
+            if error is not None:
+                task.future.set_exception(error)
+            else:
+                task.future.set_result(response)
+
+
+# =============================
+# Shared scheduler
+# =============================
+
+_SCHEDULER: Optional[FetchScheduler] = None
+_SCHEDULER_LOCK = threading.Lock()
+_PRIORITY = threading.local()
+
+
+def get_scheduler() -> FetchScheduler:
+    """
+    Process-wide scheduler used by the fetchers (created on first use).
+    """
+    global _SCHEDULER
+    with _SCHEDULER_LOCK:
+        if _SCHEDULER is None:
+            _SCHEDULER = FetchScheduler()
+        return _SCHEDULER
+
+
+def set_scheduler(scheduler: Optional[FetchScheduler]) -> None:
+    """
+    Replace the shared scheduler (e.g. different limits or tests).
+    """
+    global _SCHEDULER
+    with _SCHEDULER_LOCK:
+        _SCHEDULER = scheduler
+
+
+@contextmanager
+def request_priority(priority: int):
+    """
+    Default priority of scheduled_get() calls made by this thread.
+    """
+    previous = getattr(_PRIORITY, "value", DEFAULT_PRIORITY)
+    _PRIORITY.value = priority
+    try:
+        yield
+    finally:
+        _PRIORITY.value = previous
+
+
+def scheduled_get(url: str, priority: Optional[int] = None, **kwargs) -> requests.Response:
+    """
+    requests.get through the shared scheduler.
+    """
+    if priority is None:
+        priority = getattr(_PRIORITY, "value", DEFAULT_PRIORITY)
+    return get_scheduler().get(url, priority, **kwargs)
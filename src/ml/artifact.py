@@ -0,0 +1,276 @@
+# src/ml/artifact.py
+
+import json
+import os
+import pickle
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.feature_engineering import engineer_features, feature_names as engineered_names
+from src.ml.imputation import PanelImputer
+
+
+# Bump when the stored arrays or metadata change incompatibly
+ARTIFACT_VERSION = 1
+
+DEFAULT_ARTIFACT_PATH = Path("data/models/life_expectancy_model.npz")
+
+
+class PipelineArtifact:
+    """
+    Fitted imputer + scaler + linear model as plain NumPy arrays.
+
+    The three preprocessing/model steps are folded into one affine map:
+        y = impute(X) @ weights + bias
+    so scoring is a single matrix-vector product and does not need
+    scikit-learn to be imported.
+    """
+
+    def __init__(
+        self,
+        metadata: Dict[str, Any],
+        impute_values: np.ndarray,
+        scale_mean: np.ndarray,
+        scale_scale: np.ndarray,
+        coef: np.ndarray,
+        intercept: float,
+        panel_imputer: Optional[PanelImputer] = None,
+    ):
+        self.metadata = metadata
+        self.panel_imputer = panel_imputer
+        self.feature_names: List[str] = metadata["feature_names"]
+        self.impute_values = impute_values
+        self.scale_mean = scale_mean
+        self.scale_scale = scale_scale
+        self.coef = coef
+        self.intercept = float(intercept)
+
+        # Fold standardisation into the coefficients
+        self.weights = coef / scale_scale
+        self.bias = self.intercept - float(scale_mean @ self.weights)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Score a (rows, features) array in the stored feature order.
+        Missing values are replaced by the training means.
+        """
+        X = np.asarray(X, dtype=np.float64)
+
+        if X.ndim != 2 or X.shape[1] != len(self.feature_names):
+            raise ValueError(
+                f"Expected array with {len(self.feature_names)} columns, "
+                f"got shape {X.shape}"
+            )
+
+        missing = np.isnan(X)
+        if missing.any():
+            X = np.where(missing, self.impute_values, X)
+
+        return X @ self.weights + self.bias
+
+
+def save_pipeline_artifact(
+    path: Path,
+    imputer,
+    scaler,
+    model,
+    feature_names: List[str],
+    fingerprint: str,
+    target: str = "life_expectancy",
+    extra_metadata: Optional[Dict[str, Any]] = None,
+    panel_imputer: Optional[PanelImputer] = None,
+) -> Path:
+    """
+    Save imputer, scaler and model as one versioned .npz artifact.
+
+    The file holds the folded NumPy arrays used by the light-weight
+    path, JSON metadata (version, feature order, dataset fingerprint)
+    and the pickled scikit-learn objects for the full path. A fitted
+    PanelImputer (applied before the mean imputer) is stored as its
+    filled cube and column means.
+    """
+    feature_names = list(feature_names)
+    coef = np.asarray(model.coef_, dtype=np.float64).ravel()
+
+    if len(coef) != len(feature_names):
+        raise ValueError("Model coefficients do not match feature names.")
+
+    metadata = {
+        "artifact_version": ARTIFACT_VERSION,
+        "feature_names": feature_names,
+        "target": target,
+        "dataset_fingerprint": fingerprint,
+        "model_class": type(model).__name__,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    if extra_metadata:
+        metadata.update(extra_metadata)
+
+    panel_arrays = {}
+    if panel_imputer is not None:
+        metadata["panel_imputer"] = {
+            "columns": list(panel_imputer.columns_),
+            "countries": list(panel_imputer.countries_),
+            "first_year": panel_imputer.first_year_,
+            "params": {k: list(v) if isinstance(v, tuple) else v
+                       for k, v in panel_imputer.get_params().items()},
+        }
+        panel_arrays = {
+            "panel_cube": np.asarray(panel_imputer.cube_, dtype=np.float64),
+            "panel_means": np.asarray(panel_imputer.means_, dtype=np.float64),
+        }
+
+    sklearn_blob = pickle.dumps((imputer, scaler, model))
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first so readers never see a partial file
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez(
+            f,
+            metadata=np.array(json.dumps(metadata)),
+            impute_values=np.asarray(imputer.statistics_, dtype=np.float64),
+            scale_mean=np.asarray(scaler.mean_, dtype=np.float64),
+            scale_scale=np.asarray(scaler.scale_, dtype=np.float64),
+            coef=coef,
+            intercept=np.array(float(np.ravel(model.intercept_)[0])),
+            sklearn_pipeline=np.frombuffer(sklearn_blob, dtype=np.uint8),
+            **panel_arrays,
+        )
+    os.replace(tmp_path, path)
+
+    return path
+
+
+def _read_metadata(archive) -> Dict[str, Any]:
+    metadata = json.loads(str(archive["metadata"]))
+
+    if metadata.get("artifact_version") != ARTIFACT_VERSION:
+        raise ValueError(
+            f"Unsupported artifact version {metadata.get('artifact_version')} "
+            f"(expected {ARTIFACT_VERSION})"
+        )
+
+    return metadata
+
+
+def _read_panel_imputer(archive, metadata: Dict[str, Any]) -> Optional[PanelImputer]:
+    """
+    Rebuild the fitted PanelImputer stored with the artifact, if any.
+    """
+    state = metadata.get("panel_imputer")
+    if state is None:
+        if metadata.get("imputation") == "panel":
+            raise ValueError(
+                "Artifact was trained with panel imputation but does not contain "
+                "the fitted imputer; retrain it to score."
+            )
+        return None
+
+    imputer = PanelImputer(**state["params"])
+    imputer.columns_ = list(state["columns"])
+    imputer.countries_ = pd.Index(state["countries"])
+    imputer.first_year_ = int(state["first_year"])
+    imputer.cube_ = archive["panel_cube"]
+    imputer.means_ = archive["panel_means"]
+    return imputer
+
+
+def load_pipeline_artifact(path: Path = DEFAULT_ARTIFACT_PATH) -> PipelineArtifact:
+    """
+    Load the light-weight NumPy scoring path of an artifact.
+
+    Only the small coefficient arrays are read; the pickled
+    scikit-learn objects are left untouched.
+    """
+    with np.load(path) as archive:
+        metadata = _read_metadata(archive)
+        return PipelineArtifact(
+            metadata=metadata,
+            impute_values=archive["impute_values"],
+            scale_mean=archive["scale_mean"],
+            scale_scale=archive["scale_scale"],
+            coef=archive["coef"],
+            intercept=archive["intercept"],
+            panel_imputer=_read_panel_imputer(archive, metadata),
+        )
+
+
+def input_columns(metadata: Dict[str, Any]) -> List[str]:
+    """
+    Columns an input needs so prepare_features() can rebuild the
+    model features: the stored features minus the engineered ones,
+    plus iso3, year and the configured indicators when the artifact
+    was trained with a feature config or panel imputation.
+    """
+    config = metadata.get("feature_config") or {}
+    engineered = set(engineered_names(config))
+
+    columns = [col for col in metadata["feature_names"] if col not in engineered]
+    if config or metadata.get("panel_imputer"):
+        columns += [col for col in ["iso3", "year", *config] if col not in columns]
+    return columns
+
+
+def prepare_features(
+    df: pd.DataFrame,
+    metadata: Dict[str, Any],
+    panel_imputer: Optional[PanelImputer] = None,
+) -> pd.DataFrame:
+    """
+    Recompute the training-time feature stages on raw input rows:
+    lag / growth / rolling features from metadata["feature_config"]
+    (unless the input already has all of them), then the fitted panel
+    imputer. Row order and index are kept; the caller selects
+    metadata["feature_names"].
+
+    Engineered features are computed per country over the rows
+    given, so earlier years must be part of the same input.
+    """
+    config = metadata.get("feature_config") or {}
+    engineered = engineered_names(config)
+
+    if config and any(col not in df.columns for col in engineered):
+        missing = [col for col in ["iso3", "year", *config] if col not in df.columns]
+        if missing:
+            raise ValueError(f"Input is missing columns for engineered features: {missing}")
+
+        index = df.index
+        out = engineer_features(
+            df.drop(columns=[col for col in engineered if col in df.columns])
+            .assign(_row=np.arange(len(df))),
+            config,
+        )
+        df = out.sort_values("_row").drop(columns="_row").set_axis(index)
+
+    if panel_imputer is not None:
+        missing = [col for col in ["iso3", "year"] if col not in df.columns]
+        if missing:
+            raise ValueError(f"Input is missing key columns for panel imputation: {missing}")
+        df = panel_imputer.transform(df, df[["iso3", "year"]])
+
+    return df
+
+
+def load_sklearn_pipeline(
+    path: Path = DEFAULT_ARTIFACT_PATH
+) -> Tuple[Dict[str, Any], Any, Any, Any]:
+    """
+    Load the fitted scikit-learn objects of an artifact.
+
+    Only load artifacts from trusted locations: this unpickles code objects.
+
+    Returns:
+        (metadata, imputer, scaler, model)
+    """
+    with np.load(path) as archive:
+        metadata = _read_metadata(archive)
+        imputer, scaler, model = pickle.loads(archive["sklearn_pipeline"].tobytes())
+
+    return metadata, imputer, scaler, model
@@ -0,0 +1,267 @@
+# src/ml/cross_validation.py
+
+import hashlib
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import r2_score
+from sklearn.model_selection import GroupKFold
+
+from src.data_loader import BoundedCache, dataset_fingerprint
+from src.ml.imputation import PanelImputer
+from src.ml.preprocessing import preprocess_training_data, preprocess_test_data
+from src.tracing import traced
+
+
+Split = Tuple[np.ndarray, np.ndarray]
+FoldMatrices = Tuple[np.ndarray, np.ndarray]
+
+
+def group_kfold_splits(groups: pd.Series, n_splits: int = 5) -> List[Split]:
+    """
+    K folds where every country (group) is entirely in train or in test.
+    """
+    groups = np.asarray(groups)
+    n_splits = min(n_splits, len(np.unique(groups)))
+    dummy = np.zeros(len(groups))
+    return list(GroupKFold(n_splits=n_splits).split(dummy, groups=groups))
+
+
+def rolling_origin_splits(
+    years: pd.Series,
+    min_train_years: int = 10,
+    horizon: int = 1,
+    step: int = 1,
+    max_splits: Optional[int] = None,
+) -> List[Split]:
+    """
+    Expanding-window time-series splits over calendar years.
+
+    Each split trains on all years before a cutoff and tests on the
+    next `horizon` years, so no future year ever leaks into training.
+
+    Args:
+        years: Year of each row.
+        min_train_years: Distinct years in the first training window.
+        horizon: Number of test years per split.
+        step: Years the cutoff advances between splits.
+        max_splits: Keep only the most recent splits.
+    """
+    years = np.asarray(years)
+    unique_years = np.unique(years)
+
+    splits = []
+    for start in range(min_train_years, len(unique_years), step):
+        cutoff = unique_years[start]
+        test_years = unique_years[start:start + horizon]
+
+        train_idx = np.flatnonzero(years < cutoff)
+        test_idx = np.flatnonzero(np.isin(years, test_years))
+        if len(train_idx) and len(test_idx):
+            splits.append((train_idx, test_idx))
+
+    if max_splits is not None:
+        splits = splits[-max_splits:]
+
+    return splits
+
+
+class FoldCache:
+    """
+    Cache of per-fold preprocessed (X_train, X_test) matrices.
+
+    Keys combine the dataset fingerprint, the preprocessing function
+    and a hash of the fold indices, so repeated experiments on the same
+    data and splits reuse the imputed and scaled matrices. With a
+    cache_dir, matrices are also stored as .npz files and survive
+    across processes. max_entries bounds the folds kept in memory
+    (least recently used dropped first; None = unbounded).
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_entries: Optional[int] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._store: Dict[str, FoldMatrices] = (
+            {} if max_entries is None else BoundedCache(max_entries)
+        )
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(fingerprint: str, preprocess_name: str, split: Split) -> str:
+        digest = hashlib.sha1(preprocess_name.encode())
+        digest.update(np.ascontiguousarray(split[0], dtype=np.int64).tobytes())
+        digest.update(b"|")
+        digest.update(np.ascontiguousarray(split[1], dtype=np.int64).tobytes())
+        return f"{fingerprint}_{digest.hexdigest()[:16]}"
+
+    def _path(self, key: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"fold_{key}.npz"
+
+    def get(self, key: str) -> Optional[FoldMatrices]:
+        if key in self._store:
+            self.hits += 1
+            return self._store[key]
+
+        path = self._path(key)
+        if path is not None and path.exists():
+            with np.load(path) as archive:
+                matrices = (archive["X_train"], archive["X_test"])
+            self._store[key] = matrices
+            self.hits += 1
+            return matrices
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, matrices: FoldMatrices) -> None:
+        self._store[key] = matrices
+
+        path = self._path(key)
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            np.savez(path, X_train=matrices[0], X_test=matrices[1])
+
+    def clear(self) -> None:
+        self._store.clear()
+
+
+# Shared in-process cache used when no cache is passed explicitly;
+# a pipeline run uses about ten folds, so this holds a few runs
+DEFAULT_FOLD_CACHE = FoldCache(max_entries=32)
+
+
+def _preprocess_fold(
+    X: pd.DataFrame,
+    split: Split,
+    preprocess_train: Callable,
+    preprocess_test: Callable,
+    panel_keys: Optional[pd.DataFrame] = None,
+    panel_params: Optional[Dict] = None,
+) -> FoldMatrices:
+    """
+    Fit preprocessing on the fold's training rows only; with
+    panel_keys, a PanelImputer is fitted on them first.
+    """
+    train_idx, test_idx = split
+    X_train, X_test = X.iloc[train_idx], X.iloc[test_idx]
+
+    if panel_keys is not None:
+        keys_train, keys_test = panel_keys.iloc[train_idx], panel_keys.iloc[test_idx]
+        panel_imputer = PanelImputer(**(panel_params or {})).fit(
+            X_train.drop(columns=["year"], errors="ignore"), keys_train
+        )
+        X_train = panel_imputer.transform(X_train, keys_train)
+        X_test = panel_imputer.transform(X_test, keys_test)
+
+    X_train, imputer, scaler = preprocess_train(X_train)
+    X_test = preprocess_test(X_test, imputer, scaler)
+    return X_train, X_test
+
+
+def prepare_fold_matrices(
+    X: pd.DataFrame,
+    splits: List[Split],
+    cache: Optional[FoldCache] = None,
+    preprocess_train: Callable = preprocess_training_data,
+    preprocess_test: Callable = preprocess_test_data,
+    n_jobs: int = -1,
+    panel_keys: Optional[pd.DataFrame] = None,
+    panel_params: Optional[Dict] = None,
+) -> List[FoldMatrices]:
+    """
+    Preprocessed matrices for every fold, computing only cache misses
+    (in parallel) and storing them for the next experiment.
+
+    panel_keys (iso3 and year of every row of X) adds panel
+    imputation, fitted inside each fold like the mean imputer, so
+    validation rows are never filled from their own countries/years
+    in other folds.
+    """
+    cache = cache if cache is not None else DEFAULT_FOLD_CACHE
+
+    fingerprint = dataset_fingerprint(X)
+    preprocess_name = (
+        f"{preprocess_train.__module__}.{preprocess_train.__qualname__}"
+    )
+    if panel_keys is not None:
+        panel_keys = panel_keys[["iso3", "year"]].reset_index(drop=True)
+        preprocess_name += (
+            f"|panel:{dataset_fingerprint(panel_keys)}"
+            f":{sorted(PanelImputer(**(panel_params or {})).get_params().items())}"
+        )
+    keys = [FoldCache.make_key(fingerprint, preprocess_name, s) for s in splits]
+
+    matrices: List[Optional[FoldMatrices]] = [cache.get(key) for key in keys]
+    missing = [i for i, m in enumerate(matrices) if m is None]
+
+    if missing:
+        computed = Parallel(n_jobs=n_jobs)(
+            delayed(_preprocess_fold)(
+                X, splits[i], preprocess_train, preprocess_test, panel_keys, panel_params
+            )
+            for i in missing
+        )
+        for i, fold_matrices in zip(missing, computed):
+            cache.put(keys[i], fold_matrices)
+            matrices[i] = fold_matrices
+
+    return matrices
+
+
+def _fit_and_score(estimator, X_train, y_train, X_test, y_test, scorer) -> float:
+    model = clone(estimator)
+    model.fit(X_train, y_train)
+    return scorer(y_test, model.predict(X_test))
+
+
+@traced("fit/cross_validate", category="fit", rows="X")
+def panel_cross_validate(
+    estimator,
+    X: pd.DataFrame,
+    y: pd.Series,
+    splits: List[Split],
+    cache: Optional[FoldCache] = None,
+    scorer: Callable[[np.ndarray, np.ndarray], float] = r2_score,
+    n_jobs: int = -1,
+    panel_keys: Optional[pd.DataFrame] = None,
+    panel_params: Optional[Dict] = None,
+) -> np.ndarray:
+    """
+    Cross-validate with preprocessing fitted inside each fold.
+
+    Args:
+        estimator: Unfitted scikit-learn estimator.
+        X: Raw (unimputed, unscaled) feature frame.
+        y: Target aligned with X.
+        splits: (train_idx, test_idx) positional splits, e.g. from
+                group_kfold_splits or rolling_origin_splits.
+        cache: FoldCache for the preprocessed fold matrices.
+        scorer: Function (y_true, y_pred) -> score.
+        n_jobs: Parallel workers (-1 = all cores).
+        panel_keys: iso3 and year of every row of X to add per-fold
+                    panel imputation (see prepare_fold_matrices).
+        panel_params: PanelImputer settings.
+
+    Returns:
+        Array with one score per fold.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    matrices = prepare_fold_matrices(
+        X, splits, cache=cache, n_jobs=n_jobs,
+        panel_keys=panel_keys, panel_params=panel_params,
+    )
+
+    scores = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_and_score)(
+            estimator, X_train, y[train_idx], X_test, y[test_idx], scorer
+        )
+        for (train_idx, test_idx), (X_train, X_test) in zip(splits, matrices)
+    )
+
+    return np.asarray(scores)
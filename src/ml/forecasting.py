@@ -0,0 +1,332 @@
+# src/ml/forecasting.py
+
+from typing import List, NamedTuple, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+from src.data_loader import EU_REGIONS, TARGET_COLUMNS
+from src.tracing import traced
+
+
+DEFAULT_HORIZON = 5
+DEFAULT_N_LAGS = 3
+DEFAULT_ALPHA = 1.0
+
+
+class ForecastDesign(NamedTuple):
+    """
+    Dense direct-forecasting design over (country, origin year).
+
+    X[c, t] holds the features known at origin year t (the first
+    n_lags are target lags), level[c, t] the target at t and
+    Y[c, t, h-1] the target at t + h (NaN when unobserved).
+    """
+    X: np.ndarray
+    level: np.ndarray
+    Y: np.ndarray
+    countries: List[str]
+    years: np.ndarray
+    feature_names: List[str]
+    n_lags: int
+
+
+class DirectForecaster(NamedTuple):
+    """
+    One ridge model per horizon, stored as stacked arrays so that all
+    horizons are predicted with a single matrix product. Each model
+    predicts the change from the origin level.
+    """
+    mean: np.ndarray
+    scale: np.ndarray
+    intercept: np.ndarray
+    coef: np.ndarray
+    feature_names: List[str]
+
+    @property
+    def horizon(self) -> int:
+        return len(self.intercept)
+
+    def predict(self, X: np.ndarray, level: np.ndarray) -> np.ndarray:
+        """
+        Forecasts of shape (..., horizon) for features (..., n_features)
+        and origin levels (...).
+        """
+        Z = np.nan_to_num((X - self.mean) / self.scale)
+        return level[..., None] + self.intercept + Z @ self.coef.T
+
+
+def build_design(
+    df: pd.DataFrame,
+    target: str = "life_expectancy",
+    indicators: Optional[Sequence[str]] = None,
+    n_lags: int = DEFAULT_N_LAGS,
+    horizon: int = DEFAULT_HORIZON,
+) -> ForecastDesign:
+    """
+    Build lag features and 1..horizon-ahead targets for every country
+    and year at once on a dense calendar-year grid (gaps stay NaN).
+
+    Features: the target at t, t-1, ..., t-n_lags+1 and the
+    indicators at t.
+    """
+    if indicators is None:
+        indicators = [
+            col for col in df.select_dtypes(include=[np.number]).columns
+            if col not in (target, "year") and col not in TARGET_COLUMNS
+        ]
+    indicators = list(indicators)
+
+    country_codes, countries = pd.factorize(df["iso3"], sort=True)
+    years = df["year"].to_numpy(dtype=np.int64)
+    first_year = years.min()
+    year_offsets = years - first_year
+    n_years = int(year_offsets.max()) + 1
+
+    columns = [target] + indicators
+    dense = np.full((len(columns), len(countries), n_years), np.nan)
+    dense[:, country_codes, year_offsets] = (
+        df[columns].to_numpy(dtype=np.float64, na_value=np.nan).T
+    )
+    level = dense[0]
+
+    # Pad both ends of the year axis so shifts become plain slices
+    pad = max(n_lags, horizon)
+    padded = np.pad(level, ((0, 0), (pad, pad)), constant_values=np.nan)
+
+    lags = np.stack(
+        [padded[:, pad - k:pad - k + n_years] for k in range(n_lags)], axis=-1
+    )
+    futures = np.stack(
+        [padded[:, pad + h:pad + h + n_years] for h in range(1, horizon + 1)], axis=-1
+    )
+
+    X = np.concatenate([lags, np.moveaxis(dense[1:], 0, -1)], axis=-1)
+    feature_names = [f"{target}_lag{k}" for k in range(n_lags)] + indicators
+
+    return ForecastDesign(
+        X=X,
+        level=level,
+        Y=futures,
+        countries=list(countries),
+        years=np.arange(first_year, first_year + n_years),
+        feature_names=feature_names,
+        n_lags=n_lags,
+    )
+
+
+@traced("fit/direct_forecaster", category="fit")
+def fit_direct(
+    design: ForecastDesign,
+    train_mask: Optional[np.ndarray] = None,
+    alpha: float = DEFAULT_ALPHA,
+) -> DirectForecaster:
+    """
+    Fit all horizons as one batched ridge solve.
+
+    Every horizon has its own set of usable rows (its target must be
+    observed), so the per-horizon normal equations are formed with
+    one weighted GEMM and solved together. Rows with a missing target
+    lag are not used for training; missing indicators are imputed
+    with the training mean.
+
+    Args:
+        design: Output of build_design.
+        train_mask: Boolean mask broadcastable to (country, year, horizon)
+                    selecting training rows (default: all).
+        alpha: Ridge penalty on the standardized coefficients.
+    """
+    C, T, F = design.X.shape
+    H = design.Y.shape[-1]
+
+    delta = design.Y - design.level[..., None]
+    usable = np.isfinite(delta) & np.isfinite(
+        design.X[..., :design.n_lags]
+    ).all(axis=-1, keepdims=True)
+    if train_mask is not None:
+        usable &= np.broadcast_to(
+            np.asarray(train_mask, dtype=bool).reshape(
+                np.shape(train_mask) + (1,) * (3 - np.ndim(train_mask))
+            ),
+            usable.shape,
+        )
+
+    usable = usable.reshape(C * T, H)
+    X = design.X.reshape(C * T, F)
+    delta = np.where(usable, delta.reshape(C * T, H), 0.0)
+
+    counts = usable.sum(axis=0)
+    if counts.min() <= F:
+        raise ValueError(
+            f"Not enough training rows for every horizon: {counts.tolist()}"
+        )
+
+    rows = usable.any(axis=1)
+    mean = np.nanmean(X[rows], axis=0)
+    scale = np.nanstd(X[rows], axis=0)
+    mean = np.nan_to_num(mean)
+    scale = np.where(np.isfinite(scale) & (scale > 0), scale, 1.0)
+
+    A = np.column_stack([np.ones(len(X)), np.nan_to_num((X - mean) / scale)])
+    q = A.shape[1]
+    W = usable.astype(np.float64)
+
+    # gram[h] = A.T @ diag(W[:, h]) @ A for all h in one product
+    gram = ((A[:, None, :] * W[:, :, None]).reshape(len(A), H * q).T @ A)
+    gram = gram.reshape(H, q, q)
+    rhs = (A.T @ (W * delta)).T
+
+    penalty = alpha * np.eye(q)
+    penalty[0, 0] = 0.0
+    beta = np.linalg.solve(gram + penalty, rhs[..., None])[..., 0]
+
+    return DirectForecaster(
+        mean=mean,
+        scale=scale,
+        intercept=beta[:, 0],
+        coef=beta[:, 1:],
+        feature_names=design.feature_names,
+    )
+
+
+def latest_origins(design: ForecastDesign) -> np.ndarray:
+    """
+    Index of the last year with an observed target, per country.
+    """
+    observed = np.isfinite(design.level)
+    last = design.level.shape[1] - 1 - np.argmax(observed[:, ::-1], axis=1)
+    return np.where(observed.any(axis=1), last, -1)
+
+
+def forecast_countries(
+    design: ForecastDesign,
+    model: DirectForecaster,
+) -> pd.DataFrame:
+    """
+    1..horizon-ahead forecasts for every country from its latest
+    observed year, computed in one batch.
+
+    Returns:
+        Long DataFrame with iso3, region, origin_year, horizon, year
+        and forecast.
+    """
+    origins = latest_origins(design)
+    keep = np.flatnonzero(origins >= 0)
+    origins = origins[keep]
+
+    predictions = model.predict(
+        design.X[keep, origins], design.level[keep, origins]
+    )
+
+    H = model.horizon
+    origin_years = design.years[origins]
+    iso3 = np.asarray(design.countries)[keep]
+
+    return pd.DataFrame({
+        "iso3": np.repeat(iso3, H),
+        "region": [EU_REGIONS.get(code, "Other") for code in np.repeat(iso3, H)],
+        "origin_year": np.repeat(origin_years, H),
+        "horizon": np.tile(np.arange(1, H + 1), len(keep)),
+        "year": (origin_years[:, None] + np.arange(1, H + 1)).ravel(),
+        "forecast": predictions.ravel(),
+    })
+
+
+def regional_forecasts(forecasts: pd.DataFrame) -> pd.DataFrame:
+    """
+    Average country forecasts by region and horizon from a common origin.
+
+    Each region is forecast from its latest origin year; countries whose
+    data end earlier are left out, so a regional value never mixes
+    origins (and country subsets) across years. n_countries is the
+    number of countries averaged.
+
+    Returns:
+        DataFrame with region, horizon, origin_year, year, forecast
+        and n_countries.
+    """
+    latest = forecasts.groupby("region")["origin_year"].transform("max")
+    return (
+        forecasts[forecasts["origin_year"] == latest]
+        .groupby(["region", "horizon"], as_index=False)
+        .agg(
+            origin_year=("origin_year", "first"),
+            year=("year", "first"),
+            forecast=("forecast", "mean"),
+            n_countries=("iso3", "nunique"),
+        )
+    )
+
+
+def _backtest_origin(
+    design: ForecastDesign, origin: int, alpha: float
+) -> pd.DataFrame:
+    """
+    Fit with only the information available at `origin` and score the
+    forecasts made from it.
+    """
+    T = design.level.shape[1]
+    H = design.Y.shape[-1]
+
+    # Row (t, h) is usable only if its target year t + h <= origin
+    year_idx = np.arange(T)[:, None]
+    train_mask = (year_idx + np.arange(1, H + 1)) <= origin
+
+    model = fit_direct(design, train_mask[None, :, :], alpha)
+
+    predictions = model.predict(design.X[:, origin], design.level[:, origin])
+    errors = predictions - design.Y[:, origin]
+    observed = np.isfinite(errors)
+    errors = np.where(observed, errors, 0.0)
+    n = observed.sum(axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return pd.DataFrame({
+            "origin_year": design.years[origin],
+            "horizon": np.arange(1, H + 1),
+            "n": n,
+            "rmse": np.sqrt((errors ** 2).sum(axis=0) / n),
+            "mae": np.abs(errors).sum(axis=0) / n,
+        })
+
+
+@traced("forecast/backtest", category="fit")
+def backtest(
+    design: ForecastDesign,
+    min_train_years: int = 10,
+    step: int = 1,
+    alpha: float = DEFAULT_ALPHA,
+    n_jobs: int = -1,
+) -> pd.DataFrame:
+    """
+    Rolling-origin backtest with origins evaluated in parallel.
+
+    Returns:
+        DataFrame with origin_year, horizon, n, rmse and mae
+        (horizons with no observed outcome have n = 0).
+    """
+    T = design.level.shape[1]
+    origins = range(min_train_years, T - 1, step)
+
+    frames = Parallel(n_jobs=n_jobs)(
+        delayed(_backtest_origin)(design, origin, alpha) for origin in origins
+    )
+    return pd.concat(frames, ignore_index=True)
+
+
+def backtest_summary(results: pd.DataFrame) -> pd.DataFrame:
+    """
+    Error by horizon pooled over all origins (weighted by n).
+    """
+    scored = results[results["n"] > 0].assign(
+        sse=lambda r: r["rmse"] ** 2 * r["n"],
+        sae=lambda r: r["mae"] * r["n"],
+    )
+    pooled = scored.groupby("horizon")[["n", "sse", "sae"]].sum()
+
+    return pd.DataFrame({
+        "n": pooled["n"],
+        "rmse": np.sqrt(pooled["sse"] / pooled["n"]),
+        "mae": pooled["sae"] / pooled["n"],
+    }).reset_index()
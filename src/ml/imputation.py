@@ -0,0 +1,262 @@
+# src/ml/imputation.py
+
+import warnings
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.data_loader import BoundedCache, dataset_fingerprint
+from src.tracing import traced
+
+
+DEFAULT_METHODS = ("interpolate", "ffill", "knn")
+
+# Fitted imputers keyed by (fingerprint, settings), most recent
+# CACHE_SIZE kept
+CACHE_SIZE = 8
+_CACHE: Dict[Tuple, "PanelImputer"] = BoundedCache(CACHE_SIZE)
+
+
+def _previous_observed(observed: np.ndarray) -> np.ndarray:
+    """
+    Index of the last observed year at or before each cell (-1 if none).
+    """
+    T = observed.shape[-1]
+    idx = np.where(observed, np.arange(T), -1)
+    return np.maximum.accumulate(idx, axis=-1)
+
+
+def _next_observed(observed: np.ndarray) -> np.ndarray:
+    """
+    Index of the first observed year at or after each cell (T if none).
+    """
+    T = observed.shape[-1]
+    idx = np.where(observed, np.arange(T), T)
+    return np.minimum.accumulate(idx[..., ::-1], axis=-1)[..., ::-1]
+
+
+def interpolate_years(cube: np.ndarray, max_gap: Optional[int] = None) -> np.ndarray:
+    """
+    Linear interpolation along the year axis of a (..., year) array,
+    for interior gaps of at most max_gap years (all gaps if None).
+    """
+    observed = ~np.isnan(cube)
+    T = cube.shape[-1]
+    prev = _previous_observed(observed)
+    nxt = _next_observed(observed)
+
+    fillable = ~observed & (prev >= 0) & (nxt < T)
+    if max_gap is not None:
+        fillable &= (nxt - prev - 1) <= max_gap
+
+    prev_c = np.clip(prev, 0, T - 1)
+    next_c = np.clip(nxt, 0, T - 1)
+    v_prev = np.take_along_axis(cube, prev_c, axis=-1)
+    v_next = np.take_along_axis(cube, next_c, axis=-1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = (np.arange(T) - prev) / (nxt - prev)
+        interpolated = v_prev + (v_next - v_prev) * weight
+
+    return np.where(fillable, interpolated, cube)
+
+
+def carry_forward(cube: np.ndarray, limit: int = 2) -> np.ndarray:
+    """
+    Forward-fill along the year axis, at most `limit` years past the
+    last observation.
+    """
+    observed = ~np.isnan(cube)
+    prev = _previous_observed(observed)
+
+    fillable = ~observed & (prev >= 0) & (np.arange(cube.shape[-1]) - prev <= limit)
+    carried = np.take_along_axis(cube, np.clip(prev, 0, None), axis=-1)
+
+    return np.where(fillable, carried, cube)
+
+
+def country_neighbours(cube: np.ndarray, max_candidates: int = 20) -> np.ndarray:
+    """
+    Most similar countries, from the standardized mean profile of
+    every indicator (missing profile entries are ignored).
+
+    Args:
+        cube: (indicator, country, year) array.
+        max_candidates: Neighbours kept per country.
+
+    Returns:
+        (country, candidates) array of neighbour indices, nearest first.
+    """
+    with warnings.catch_warnings(), np.errstate(divide="ignore", invalid="ignore"):
+        warnings.simplefilter("ignore", RuntimeWarning)
+        profile = np.nanmean(cube, axis=-1).T
+        profile = (profile - np.nanmean(profile, axis=0)) / np.nanstd(profile, axis=0)
+
+    observed = np.isfinite(profile)
+    filled = np.where(observed, profile, 0.0)
+
+    # Mean squared difference over indicators observed for both countries
+    both = observed.astype(np.float64) @ observed.T.astype(np.float64)
+    sq = (filled ** 2) @ observed.T + observed @ (filled ** 2).T - 2.0 * filled @ filled.T
+    with np.errstate(divide="ignore", invalid="ignore"):
+        distance = np.where(both > 0, sq / both, np.inf)
+    np.fill_diagonal(distance, np.inf)
+
+    n_candidates = min(max_candidates, distance.shape[0] - 1)
+    order = np.argsort(distance, axis=1, kind="stable")
+    return order[:, :n_candidates]
+
+
+def knn_fill(cube: np.ndarray, neighbours: np.ndarray, k: int = 3) -> np.ndarray:
+    """
+    Fill each missing (country, year) cell with the mean of the same
+    year in the k most similar candidate countries that observe it.
+
+    Args:
+        cube: (indicator, country, year) array.
+        neighbours: Output of country_neighbours.
+    """
+    filled = cube.copy()
+
+    # One indicator at a time bounds memory to country x candidates x year
+    for i, values in enumerate(cube):
+        candidates = values[neighbours, :]
+        observed = ~np.isnan(candidates)
+
+        # Use only the first k candidates that observe the year
+        use = observed & (np.cumsum(observed, axis=1) <= k)
+
+        count = use.sum(axis=1)
+        total = np.where(use, candidates, 0.0).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            knn = total / count
+
+        filled[i] = np.where(np.isnan(values) & (count > 0), knn, values)
+
+    return filled
+
+
+class PanelImputer:
+    """
+    Imputation that uses the (iso3, year) structure of the panel.
+
+    fit() scatters the training rows into a dense
+    (indicator, country, year) cube and fills it in order with
+    within-country interpolation, limited carry-forward and KNN over
+    similar countries, all as whole-array operations. transform()
+    looks up each row's cell in the filled cube; anything still
+    missing falls back to the training column mean.
+    """
+
+    def __init__(
+        self,
+        methods: Sequence[str] = DEFAULT_METHODS,
+        max_gap: Optional[int] = None,
+        ffill_limit: int = 2,
+        n_neighbors: int = 3,
+        max_candidates: int = 20,
+    ):
+        unknown = set(methods) - set(DEFAULT_METHODS)
+        if unknown:
+            raise ValueError(f"Unknown imputation methods: {sorted(unknown)}")
+
+        self.methods = tuple(methods)
+        self.max_gap = max_gap
+        self.ffill_limit = ffill_limit
+        self.n_neighbors = n_neighbors
+        self.max_candidates = max_candidates
+
+    def get_params(self) -> Dict:
+        return {
+            "methods": self.methods,
+            "max_gap": self.max_gap,
+            "ffill_limit": self.ffill_limit,
+            "n_neighbors": self.n_neighbors,
+            "max_candidates": self.max_candidates,
+        }
+
+    def fit(self, X: pd.DataFrame, keys: pd.DataFrame) -> "PanelImputer":
+        """
+        Args:
+            X: Numeric columns to impute.
+            keys: iso3 and year of every row of X.
+        """
+        self.columns_: List[str] = list(X.columns)
+
+        codes, countries = pd.factorize(keys["iso3"], sort=True)
+        years = keys["year"].to_numpy(dtype=np.int64)
+        self.countries_ = pd.Index(countries)
+        self.first_year_ = int(years.min())
+        n_years = int(years.max()) - self.first_year_ + 1
+
+        cube = np.full((len(self.columns_), len(countries), n_years), np.nan)
+        cube[:, codes, years - self.first_year_] = (
+            X.to_numpy(dtype=np.float64, na_value=np.nan).T
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            self.means_ = np.nanmean(cube.reshape(len(self.columns_), -1), axis=1)
+
+        if "interpolate" in self.methods:
+            cube = interpolate_years(cube, self.max_gap)
+        if "ffill" in self.methods:
+            cube = carry_forward(cube, self.ffill_limit)
+        if "knn" in self.methods and len(countries) > 1:
+            self.neighbours_ = country_neighbours(cube, self.max_candidates)
+            cube = knn_fill(cube, self.neighbours_, self.n_neighbors)
+
+        self.cube_ = cube
+        return self
+
+    def transform(self, X: pd.DataFrame, keys: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fill missing values of X (columns as in fit) from the fitted
+        panel; observed values are never changed.
+        """
+        values = X[self.columns_].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        codes = self.countries_.get_indexer(keys["iso3"])
+        offsets = keys["year"].to_numpy(dtype=np.int64) - self.first_year_
+        inside = (codes >= 0) & (offsets >= 0) & (offsets < self.cube_.shape[-1])
+
+        panel = np.full_like(values, np.nan)
+        panel[inside] = self.cube_[:, codes[inside], offsets[inside]].T
+
+        filled = np.where(np.isnan(values), panel, values)
+        filled = np.where(np.isnan(filled), self.means_, filled)
+
+        out = X.copy()
+        out[self.columns_] = filled
+        return out
+
+    def fit_transform(self, X: pd.DataFrame, keys: pd.DataFrame) -> pd.DataFrame:
+        return self.fit(X, keys).transform(X, keys)
+
+
+@traced("fit/panel_imputer", category="fit", rows="X")
+def fit_panel_imputer(
+    X: pd.DataFrame,
+    keys: pd.DataFrame,
+    **params,
+) -> PanelImputer:
+    """
+    Fitted PanelImputer, reused from the cache when the same data
+    (values and keys) and settings were seen before.
+    """
+    imputer = PanelImputer(**params)
+
+    fingerprint = dataset_fingerprint(
+        pd.concat([keys[["iso3", "year"]], X], axis=1)
+    )
+    key = (fingerprint, tuple(sorted(imputer.get_params().items())))
+
+    if key not in _CACHE:
+        _CACHE[key] = imputer.fit(X, keys)
+
+    return _CACHE[key]
+
+
+def clear_cache() -> None:
+    _CACHE.clear()
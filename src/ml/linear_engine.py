@@ -0,0 +1,382 @@
+# src/ml/linear_engine.py
+
+# Out-of-core OLS / ridge on complete rows (e.g. a CSV streamed with
+# iter_csv_chunks). The pipeline's own CV does not use it on purpose:
+# panel_cross_validate refits the imputers on every training fold and
+# also scores overlapping rolling-origin splits, while downdated fold
+# statistics assume fixed, complete rows and disjoint folds.
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
+
+
+class LinearSufficientStats:
+    """
+    Sufficient statistics of a linear regression problem.
+
+    Holds n, sum(x), sum(y), XᵀX, Xᵀy and yᵀy. Statistics from
+    different chunks add up, and subtracting a fold's statistics from
+    the total gives the statistics of the remaining rows, so one
+    streaming pass over the data supports full fits, k-fold CV and
+    ridge paths without keeping the design matrix in memory.
+
+    Rows must not contain missing values (impute or drop them first).
+    """
+
+    def __init__(self, n_features: int):
+        self.n_features = n_features
+        self.n = 0
+        self.sum_x = np.zeros(n_features)
+        self.sum_y = 0.0
+        self.xtx = np.zeros((n_features, n_features))
+        self.xty = np.zeros(n_features)
+        self.yty = 0.0
+
+    # -----------------------------
+    # Accumulation
+    # -----------------------------
+
+    def partial_fit(self, X: np.ndarray, y: np.ndarray) -> "LinearSufficientStats":
+        """
+        Add one chunk of rows to the statistics.
+        """
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64).ravel()
+
+        if X.shape[1] != self.n_features:
+            raise ValueError(
+                f"Expected {self.n_features} features, got {X.shape[1]}"
+            )
+        if np.isnan(X).any() or np.isnan(y).any():
+            raise ValueError("Chunks must not contain missing values.")
+
+        self.n += len(y)
+        self.sum_x += X.sum(axis=0)
+        self.sum_y += y.sum()
+        self.xtx += X.T @ X
+        self.xty += X.T @ y
+        self.yty += y @ y
+        return self
+
+    @classmethod
+    def from_chunks(
+        cls, chunks: Iterable[Tuple[np.ndarray, np.ndarray]]
+    ) -> "LinearSufficientStats":
+        """
+        Accumulate statistics from an iterable of (X, y) chunks.
+        """
+        stats = None
+        for X, y in chunks:
+            if stats is None:
+                stats = cls(np.asarray(X).shape[1])
+            stats.partial_fit(X, y)
+
+        if stats is None:
+            raise ValueError("No chunks to accumulate.")
+        return stats
+
+    def copy(self) -> "LinearSufficientStats":
+        other = LinearSufficientStats(self.n_features)
+        other.n = self.n
+        other.sum_x = self.sum_x.copy()
+        other.sum_y = self.sum_y
+        other.xtx = self.xtx.copy()
+        other.xty = self.xty.copy()
+        other.yty = self.yty
+        return other
+
+    def __add__(self, other: "LinearSufficientStats") -> "LinearSufficientStats":
+        result = self.copy()
+        result.n += other.n
+        result.sum_x += other.sum_x
+        result.sum_y += other.sum_y
+        result.xtx += other.xtx
+        result.xty += other.xty
+        result.yty += other.yty
+        return result
+
+    def __sub__(self, other: "LinearSufficientStats") -> "LinearSufficientStats":
+        """
+        Downdate: statistics of the rows in self but not in other.
+        """
+        result = self.copy()
+        result.n -= other.n
+        result.sum_x -= other.sum_x
+        result.sum_y -= other.sum_y
+        result.xtx -= other.xtx
+        result.xty -= other.xty
+        result.yty -= other.yty
+        return result
+
+    # -----------------------------
+    # Solving
+    # -----------------------------
+
+    def centered(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        """
+        Means and centred cross-products.
+
+        Returns:
+            (mean_x, mean_y, Sxx, Sxy)
+        """
+        mean_x = self.sum_x / self.n
+        mean_y = self.sum_y / self.n
+        sxx = self.xtx - self.n * np.outer(mean_x, mean_x)
+        sxy = self.xty - self.n * mean_x * mean_y
+        return mean_x, mean_y, sxx, sxy
+
+    def _scales(self, sxx: np.ndarray, standardize: bool) -> np.ndarray:
+        """
+        Population standard deviation per feature (as StandardScaler),
+        or ones when not standardising.
+        """
+        if not standardize:
+            return np.ones(self.n_features)
+        scale = np.sqrt(np.clip(np.diag(sxx), 0.0, None) / self.n)
+        return np.where(scale > 0, scale, 1.0)
+
+    def solve(
+        self, alpha: float = 0.0, standardize: bool = False
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Least-squares (alpha=0) or ridge coefficients with an
+        unpenalised intercept.
+
+        With standardize=True the penalty is applied to standardised
+        features (as StandardScaler + Ridge) and the returned
+        coefficients are mapped back to original units.
+
+        Returns:
+            (coef, intercept)
+        """
+        coef, intercept = self.ridge_path([alpha], standardize=standardize)
+        return coef[:, 0], float(intercept[0])
+
+    def ridge_path(
+        self, alphas: Sequence[float], standardize: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Coefficients for many ridge penalties from one eigendecomposition.
+
+        Returns:
+            (coef of shape (features, alphas), intercepts of shape (alphas,))
+        """
+        alphas = np.asarray(alphas, dtype=np.float64)
+        mean_x, mean_y, sxx, sxy = self.centered()
+
+        scale = self._scales(sxx, standardize)
+        sxx_s = sxx / np.outer(scale, scale)
+        sxy_s = sxy / scale
+
+        eigvals, eigvecs = np.linalg.eigh(sxx_s)
+        eigvals = np.clip(eigvals, 0.0, None)
+
+        # Pseudo-inverse for directions with no variance (alpha=0 only)
+        denom = eigvals[:, None] + alphas[None, :]
+        tol = eigvals.max() * self.n_features * np.finfo(np.float64).eps
+        inv = np.where(denom > tol, 1.0 / np.where(denom > tol, denom, 1.0), 0.0)
+
+        projected = eigvecs.T @ sxy_s
+        coef = eigvecs @ (projected[:, None] * inv) / scale[:, None]
+        intercepts = mean_y - mean_x @ coef
+
+        return coef, intercepts
+
+    # -----------------------------
+    # Scoring from statistics
+    # -----------------------------
+
+    def sse(self, coef: np.ndarray, intercept: np.ndarray) -> np.ndarray:
+        """
+        Sum of squared errors of (coef, intercept) over these rows,
+        computed from the statistics alone. Accepts a coefficient
+        matrix of shape (features, k) to score k models at once.
+        """
+        coef = np.asarray(coef, dtype=np.float64).reshape(self.n_features, -1)
+        intercept = np.asarray(intercept, dtype=np.float64)
+
+        quad = np.einsum("ik,ij,jk->k", coef, self.xtx, coef)
+        linear = self.xty @ coef
+        cross = self.sum_x @ coef
+
+        sse = (
+            self.yty
+            - 2.0 * intercept * self.sum_y
+            - 2.0 * linear
+            + self.n * intercept ** 2
+            + 2.0 * intercept * cross
+            + quad
+        )
+        return np.clip(sse, 0.0, None).reshape(np.shape(intercept))
+
+    def sst(self) -> float:
+        """
+        Total sum of squares around these rows' own mean.
+        """
+        return self.yty - self.sum_y ** 2 / self.n
+
+
+def predict(X: np.ndarray, coef: np.ndarray, intercept: float) -> np.ndarray:
+    """
+    Predictions of a fitted linear model.
+    """
+    return np.asarray(X, dtype=np.float64) @ coef + intercept
+
+
+# -----------------------------
+# Cross-validation
+# -----------------------------
+
+def accumulate_fold_stats(
+    chunks: Iterable[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+    n_folds: int,
+) -> List[LinearSufficientStats]:
+    """
+    One streaming pass that accumulates statistics per fold.
+
+    Args:
+        chunks: Iterable of (X, y, fold_id) chunks; fold_id gives the
+                fold (0..n_folds-1) of every row.
+        n_folds: Number of folds.
+    """
+    fold_stats: Optional[List[LinearSufficientStats]] = None
+
+    for X, y, fold_id in chunks:
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64).ravel()
+        fold_id = np.asarray(fold_id)
+
+        if fold_stats is None:
+            fold_stats = [LinearSufficientStats(X.shape[1]) for _ in range(n_folds)]
+
+        for k in range(n_folds):
+            rows = fold_id == k
+            if rows.any():
+                fold_stats[k].partial_fit(X[rows], y[rows])
+
+    if fold_stats is None:
+        raise ValueError("No chunks to accumulate.")
+    return fold_stats
+
+
+def kfold_scores(
+    fold_stats: List[LinearSufficientStats],
+    alphas: Sequence[float] = (0.0,),
+    standardize: bool = False,
+) -> pd.DataFrame:
+    """
+    K-fold R² and RMSE for every alpha, using downdated statistics.
+
+    The training statistics of fold k are total - fold_k; each fold
+    needs one small eigendecomposition, and its test error is computed
+    from fold_k's statistics without touching the rows again.
+
+    Returns:
+        DataFrame with columns fold, alpha, r2, rmse.
+    """
+    alphas = np.asarray(alphas, dtype=np.float64)
+    total = fold_stats[0]
+    for stats in fold_stats[1:]:
+        total = total + stats
+
+    rows = []
+    for k, test_stats in enumerate(fold_stats):
+        if test_stats.n == 0:
+            continue
+
+        coef, intercepts = (total - test_stats).ridge_path(alphas, standardize)
+        sse = test_stats.sse(coef, intercepts)
+
+        for alpha, fold_sse in zip(alphas, sse):
+            rows.append({
+                "fold": k,
+                "alpha": alpha,
+                "r2": 1.0 - fold_sse / test_stats.sst(),
+                "rmse": np.sqrt(fold_sse / test_stats.n),
+            })
+
+    return pd.DataFrame(rows)
+
+
+def kfold_cv(
+    X: np.ndarray,
+    y: np.ndarray,
+    n_splits: int = 5,
+    alphas: Sequence[float] = (0.0,),
+    standardize: bool = False,
+    fold_ids: Optional[np.ndarray] = None,
+    random_state: int = 42,
+) -> pd.DataFrame:
+    """
+    In-memory convenience wrapper around accumulate_fold_stats and
+    kfold_scores. fold_ids defaults to a shuffled balanced assignment.
+    """
+    if fold_ids is None:
+        rng = np.random.default_rng(random_state)
+        fold_ids = rng.permutation(np.arange(len(y)) % n_splits)
+    n_folds = int(np.max(fold_ids)) + 1
+
+    fold_stats = accumulate_fold_stats([(X, y, fold_ids)], n_folds)
+    return kfold_scores(fold_stats, alphas, standardize)
+
+
+def loo_scores(
+    stats: LinearSufficientStats,
+    chunks: Iterable[Tuple[np.ndarray, np.ndarray]],
+    alpha: float = 0.0,
+    standardize: bool = False,
+) -> Tuple[float, float]:
+    """
+    Exact leave-one-out RMSE and R² (PRESS) for one alpha.
+
+    Uses the closed form e_i / (1 - h_i) with leverages from the
+    augmented Gram matrix, so it needs one extra streaming pass over
+    the rows instead of n refits. With standardize=True the feature
+    scale is taken from all rows rather than refitted per left-out row.
+
+    Returns:
+        (loo_rmse, loo_r2)
+    """
+    mean_x, _, sxx, _ = stats.centered()
+    scale = stats._scales(sxx, standardize)
+    coef, intercept = stats.solve(alpha, standardize)
+
+    # Gram of [1, x] with the ridge penalty on the (scaled) slopes only
+    gram = np.empty((stats.n_features + 1, stats.n_features + 1))
+    gram[0, 0] = stats.n
+    gram[0, 1:] = gram[1:, 0] = stats.sum_x
+    gram[1:, 1:] = stats.xtx + np.diag(alpha * scale ** 2)
+
+    try:
+        factor = cho_factor(gram)
+        gram_inv = cho_solve(factor, np.eye(len(gram)))
+    except LinAlgError:
+        gram_inv = np.linalg.pinv(gram)
+
+    press = 0.0
+    for X, y in chunks:
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64).ravel()
+
+        X_aug = np.column_stack([np.ones(len(X)), X])
+        leverage = np.einsum("ij,jk,ik->i", X_aug, gram_inv, X_aug)
+        residual = y - (X @ coef + intercept)
+        press += np.sum((residual / (1.0 - leverage)) ** 2)
+
+    return np.sqrt(press / stats.n), 1.0 - press / stats.sst()
+
+
+def iter_csv_chunks(
+    path,
+    features: Sequence[str],
+    target: str,
+    chunksize: int = 100_000,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Stream (X, y) chunks from a CSV file, dropping incomplete rows.
+    """
+    for chunk in pd.read_csv(path, usecols=list(features) + [target], chunksize=chunksize):
+        chunk = chunk.dropna()
+        yield chunk[list(features)].to_numpy(dtype=np.float64), chunk[target].to_numpy(dtype=np.float64)
@@ -3,7 +3,10 @@
 from sklearn.linear_model import LinearRegression
 import numpy as np
 
+from src.tracing import traced
 
+
+@traced("fit/train_model", category="fit", rows="X_train")
 def train_model(X_train: np.ndarray, y_train: np.ndarray) -> LinearRegression:
     """
     Train linear regression model.
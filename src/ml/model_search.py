@@ -0,0 +1,222 @@
+# src/ml/model_search.py
+
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import ElasticNet, Lasso, LinearRegression, Ridge
+from sklearn.metrics import r2_score
+from sklearn.model_selection import KFold, ParameterGrid
+
+from src.ml.cross_validation import group_kfold_splits, prepare_fold_matrices
+from src.tracing import traced
+
+
+# name -> (estimator, parameter grid)
+SearchSpace = Dict[str, Tuple[Any, Dict[str, List[Any]]]]
+
+DEFAULT_SEARCH_SPACE: SearchSpace = {
+    "ols": (LinearRegression(), {}),
+    "ridge": (Ridge(), {"alpha": [0.01, 0.1, 1.0, 10.0, 100.0]}),
+    "lasso": (
+        Lasso(max_iter=10_000),
+        {"alpha": [0.001, 0.01, 0.1, 1.0]},
+    ),
+    "elastic_net": (
+        ElasticNet(max_iter=10_000),
+        {"alpha": [0.001, 0.01, 0.1], "l1_ratio": [0.2, 0.5, 0.8]},
+    ),
+    "random_forest": (
+        RandomForestRegressor(n_estimators=200, random_state=42, n_jobs=1),
+        {"max_depth": [None, 10], "min_samples_leaf": [1, 5]},
+    ),
+    "gradient_boosting": (
+        GradientBoostingRegressor(random_state=42),
+        {
+            "n_estimators": [200, 500],
+            "learning_rate": [0.05, 0.1],
+            "max_depth": [2, 3],
+        },
+    ),
+}
+
+LEADERBOARD_COLUMNS = [
+    "rank", "model", "params", "cv_mean", "cv_std", "folds_evaluated",
+    "fit_time", "predict_time", "status",
+]
+
+
+def expand_search_space(search_space: SearchSpace) -> List[Tuple[str, Any]]:
+    """
+    Expand every parameter grid into (model name, configured estimator).
+    """
+    configs = []
+    for name, (estimator, grid) in search_space.items():
+        for params in ParameterGrid(grid):
+            configs.append((name, clone(estimator).set_params(**params)))
+    return configs
+
+
+def _evaluate_fold(
+    estimator,
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+    scorer: Callable[[np.ndarray, np.ndarray], float],
+) -> Tuple[float, float, float]:
+    """
+    Fit one configuration on one fold.
+
+    Returns (score, fit seconds, predict seconds).
+    """
+    model = clone(estimator)
+
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    y_pred = model.predict(X_test)
+    predict_time = time.perf_counter() - start
+
+    return scorer(y_test, y_pred), fit_time, predict_time
+
+
+@traced("fit/model_search", category="fit", rows="X")
+def run_model_search(
+    X: Union[pd.DataFrame, np.ndarray],
+    y: np.ndarray,
+    search_space: Optional[SearchSpace] = None,
+    cv: Union[int, Iterable[Tuple[np.ndarray, np.ndarray]]] = 5,
+    screening_folds: int = 1,
+    abandon_margin: float = 0.1,
+    n_jobs: int = -1,
+    scorer: Callable[[np.ndarray, np.ndarray], float] = r2_score,
+    random_state: int = 42,
+    groups: Optional[Union[pd.Series, np.ndarray]] = None,
+) -> pd.DataFrame:
+    """
+    Evaluate a set of estimators and parameter grids in parallel.
+
+    A raw feature frame is imputed and scaled inside every fold
+    (prepare_fold_matrices, shared with panel_cross_validate), so the
+    scores are comparable to the pipeline's CV. An array is taken as
+    already preprocessed and only sliced per fold.
+
+    The search runs in two stages:
+    1. Every configuration is scored on the first `screening_folds`
+       folds. Configurations whose mean score is more than
+       `abandon_margin` below the best are abandoned.
+    2. Surviving configurations are scored on the remaining folds.
+
+    All (configuration, fold) pairs of a stage run as one parallel batch.
+
+    Args:
+        X: Raw feature frame, or a preprocessed feature matrix.
+        y: Target vector.
+        search_space: name -> (estimator, param grid); default covers
+                      OLS, Ridge, Lasso, ElasticNet, random forest and
+                      gradient boosting.
+        cv: Number of folds, or an iterable of (train_idx, test_idx)
+            pairs. With groups, an int gives GroupKFold by group
+            (country); without, shuffled K-folds.
+        screening_folds: Folds used for the screening stage.
+        abandon_margin: Score gap to the best that triggers abandonment.
+        n_jobs: Parallel workers (-1 = all cores).
+        scorer: Function (y_true, y_pred) -> score, higher is better.
+        random_state: Seed for the shuffled K-folds.
+        groups: Group of every row, for group K-folds.
+
+    Returns:
+        Leaderboard DataFrame sorted by mean CV score.
+    """
+    y = np.asarray(y, dtype=np.float64)
+
+    if isinstance(cv, int):
+        if groups is not None:
+            cv = group_kfold_splits(pd.Series(np.asarray(groups)), n_splits=cv)
+        else:
+            cv = KFold(n_splits=cv, shuffle=True, random_state=random_state).split(
+                np.zeros(len(y))
+            )
+    folds = list(cv)
+
+    if isinstance(X, pd.DataFrame):
+        fold_matrices = prepare_fold_matrices(X, folds, n_jobs=n_jobs)
+    else:
+        X = np.asarray(X, dtype=np.float64)
+        fold_matrices = [(X[train_idx], X[test_idx]) for train_idx, test_idx in folds]
+
+    configs = expand_search_space(search_space or DEFAULT_SEARCH_SPACE)
+    screening_folds = min(screening_folds, len(folds))
+
+    # fold results per configuration: list of (score, fit, predict)
+    results: Dict[int, List[Tuple[float, float, float]]] = {
+        i: [] for i in range(len(configs))
+    }
+
+    def run_stage(config_ids: List[int], fold_ids: List[int]) -> None:
+        tasks = [(c, f) for c in config_ids for f in fold_ids]
+        outputs = Parallel(n_jobs=n_jobs)(
+            delayed(_evaluate_fold)(
+                configs[c][1],
+                fold_matrices[f][0], y[folds[f][0]],
+                fold_matrices[f][1], y[folds[f][1]],
+                scorer,
+            )
+            for c, f in tasks
+        )
+        for (c, _), output in zip(tasks, outputs):
+            results[c].append(output)
+
+    # Stage 1: screening
+    all_ids = list(range(len(configs)))
+    run_stage(all_ids, list(range(screening_folds)))
+
+    screening_scores = np.array(
+        [np.mean([r[0] for r in results[c]]) for c in all_ids]
+    )
+    best = np.nanmax(screening_scores)
+    survivors = [
+        c for c in all_ids if screening_scores[c] >= best - abandon_margin
+    ]
+
+    # Stage 2: full evaluation of the survivors
+    run_stage(survivors, list(range(screening_folds, len(folds))))
+
+    rows = []
+    for c, (name, estimator) in enumerate(configs):
+        scores, fit_times, predict_times = np.array(results[c]).T
+        rows.append({
+            "model": name,
+            "params": _format_params(estimator, name, search_space),
+            "cv_mean": scores.mean(),
+            "cv_std": scores.std(),
+            "folds_evaluated": len(scores),
+            "fit_time": fit_times.mean(),
+            "predict_time": predict_times.mean(),
+            "status": "complete" if c in survivors else "abandoned",
+        })
+
+    leaderboard = pd.DataFrame(rows)
+    leaderboard["complete"] = leaderboard["status"] == "complete"
+    leaderboard = leaderboard.sort_values(
+        ["complete", "cv_mean"], ascending=[False, False]
+    ).drop(columns="complete").reset_index(drop=True)
+    leaderboard["rank"] = np.arange(1, len(leaderboard) + 1)
+
+    return leaderboard[LEADERBOARD_COLUMNS]
+
+
+def _format_params(estimator, name: str, search_space: Optional[SearchSpace]) -> str:
+    """
+    Show only the parameters that are searched for this model.
+    """
+    grid = (search_space or DEFAULT_SEARCH_SPACE)[name][1]
+    params = estimator.get_params()
+    return ", ".join(f"{key}={params[key]}" for key in sorted(grid))
@@ -0,0 +1,214 @@
+# src/ml/multi_target.py
+
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.impute import SimpleImputer
+from sklearn.preprocessing import StandardScaler
+
+from src.ml.cross_validation import Split, FoldCache, prepare_fold_matrices
+from src.ml.preprocessing import preprocess_training_data, preprocess_test_data
+from src.tracing import traced
+
+
+class MultiTargetModel(NamedTuple):
+    """
+    One shared imputer + scaler and one model per target.
+
+    Linear fits store stacked coefficients (coef: targets x features)
+    so all targets are predicted with one matrix product; other
+    estimators are kept in `estimators`.
+    """
+    imputer: SimpleImputer
+    scaler: StandardScaler
+    targets: List[str]
+    coef: Optional[np.ndarray] = None
+    intercept: Optional[np.ndarray] = None
+    estimators: Optional[List] = None
+
+    def predict_processed(self, X_processed: np.ndarray) -> np.ndarray:
+        if self.coef is not None:
+            return X_processed @ self.coef.T + self.intercept
+        return np.column_stack([m.predict(X_processed) for m in self.estimators])
+
+    def predict(self, X: pd.DataFrame) -> pd.DataFrame:
+        """
+        Predictions for every target (one column each).
+        """
+        X_processed = preprocess_test_data(X, self.imputer, self.scaler)
+        return pd.DataFrame(
+            self.predict_processed(X_processed), index=X.index, columns=self.targets
+        )
+
+
+def solve_multi_output(
+    X: np.ndarray, Y: np.ndarray, alpha: float = 0.0
+) -> Dict[str, np.ndarray]:
+    """
+    Least squares for all targets as one problem.
+
+    Targets may be missing on different rows (NaN in Y). With no
+    missing targets this is a single lstsq call with a multi-column
+    right-hand side; otherwise every target's masked normal equations
+    are built with one GEMM and solved as a batch.
+
+    Returns:
+        Dict with coef (targets x features) and intercept (targets,).
+    """
+    n_rows, n_features = X.shape
+    A = np.column_stack([np.ones(n_rows), X])
+    observed = np.isfinite(Y)
+
+    if observed.all() and alpha == 0.0:
+        beta = np.linalg.lstsq(A, Y, rcond=None)[0].T
+    else:
+        W = observed.astype(np.float64)
+        q, K = A.shape[1], Y.shape[1]
+
+        # gram[k] = A.T @ diag(W[:, k]) @ A for every target k
+        gram = (A[:, None, :] * W[:, :, None]).reshape(n_rows, K * q).T @ A
+        gram = gram.reshape(K, q, q)
+        rhs = (A.T @ np.where(observed, Y, 0.0)).T
+
+        penalty = alpha * np.eye(q)
+        penalty[0, 0] = 0.0
+        try:
+            beta = np.linalg.solve(gram + penalty, rhs[..., None])[..., 0]
+        except np.linalg.LinAlgError:
+            beta = (np.linalg.pinv(gram + penalty) @ rhs[..., None])[..., 0]
+
+    return {"coef": beta[:, 1:], "intercept": beta[:, 0]}
+
+
+def _fit_one_target(estimator, X: np.ndarray, y: np.ndarray):
+    observed = np.isfinite(y)
+    return clone(estimator).fit(X[observed], y[observed])
+
+
+def _fit_processed(
+    X_processed: np.ndarray,
+    Y: np.ndarray,
+    estimator=None,
+    alpha: float = 0.0,
+    n_jobs: int = -1,
+) -> Dict:
+    """
+    Fit every target on an already preprocessed matrix.
+    """
+    if estimator is None:
+        return solve_multi_output(X_processed, Y, alpha)
+
+    estimators = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_one_target)(estimator, X_processed, Y[:, k])
+        for k in range(Y.shape[1])
+    )
+    return {"estimators": estimators}
+
+
+@traced("fit/multi_target", category="fit", rows="X_train")
+def fit_multi_target(
+    X_train: pd.DataFrame,
+    Y_train: pd.DataFrame,
+    estimator=None,
+    alpha: float = 0.0,
+    n_jobs: int = -1,
+) -> MultiTargetModel:
+    """
+    Fit all targets with one shared preprocessing step.
+
+    Args:
+        X_train: Raw feature frame.
+        Y_train: One column per target (NaN where a slice is missing).
+        estimator: None for multi-output least squares (ridge when
+                   alpha > 0), or any scikit-learn regressor, which is
+                   then fitted per target in parallel.
+        alpha: Ridge penalty for the linear solve.
+        n_jobs: Parallel workers for non-linear estimators.
+    """
+    X_processed, imputer, scaler = preprocess_training_data(X_train)
+    Y = Y_train.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    return MultiTargetModel(
+        imputer=imputer,
+        scaler=scaler,
+        targets=list(Y_train.columns),
+        **_fit_processed(X_processed, Y, estimator, alpha, n_jobs),
+    )
+
+
+def score_targets(
+    Y_true: np.ndarray, Y_pred: np.ndarray, targets: Sequence[str]
+) -> pd.DataFrame:
+    """
+    R², RMSE and n per target over the observed cells.
+    """
+    observed = np.isfinite(Y_true)
+    residuals = np.where(observed, Y_true - Y_pred, 0.0)
+    n = observed.sum(axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(observed, Y_true, 0.0).sum(axis=0) / n
+        sst = (np.where(observed, Y_true - mean, 0.0) ** 2).sum(axis=0)
+        sse = (residuals ** 2).sum(axis=0)
+
+        return pd.DataFrame({
+            "target": list(targets),
+            "n": n,
+            "r2": 1.0 - sse / sst,
+            "rmse": np.sqrt(sse / n),
+        })
+
+
+def evaluate_multi_target(
+    model: MultiTargetModel, X: pd.DataFrame, Y: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Per-target scores of a fitted model on (X, Y).
+    """
+    Y_pred = model.predict(X)[model.targets].to_numpy()
+    return score_targets(
+        Y[model.targets].to_numpy(dtype=np.float64, na_value=np.nan),
+        Y_pred,
+        model.targets,
+    )
+
+
+def multi_target_cross_validate(
+    X: pd.DataFrame,
+    Y: pd.DataFrame,
+    splits: List[Split],
+    estimator=None,
+    alpha: float = 0.0,
+    cache: Optional[FoldCache] = None,
+    n_jobs: int = -1,
+) -> pd.DataFrame:
+    """
+    Cross-validate all targets, preprocessing each fold once.
+
+    The fold matrices come from prepare_fold_matrices (and its cache),
+    so adding a target only adds one more column to the solve.
+
+    Returns:
+        DataFrame with fold, target, n, r2 and rmse.
+    """
+    Y_values = Y.to_numpy(dtype=np.float64, na_value=np.nan)
+    matrices = prepare_fold_matrices(X, splits, cache=cache, n_jobs=n_jobs)
+
+    frames = []
+    for fold, ((train_idx, test_idx), (X_train, X_test)) in enumerate(
+        zip(splits, matrices)
+    ):
+        fitted = _fit_processed(X_train, Y_values[train_idx], estimator, alpha, n_jobs)
+
+        if "coef" in fitted:
+            Y_pred = X_test @ fitted["coef"].T + fitted["intercept"]
+        else:
+            Y_pred = np.column_stack([m.predict(X_test) for m in fitted["estimators"]])
+
+        scores = score_targets(Y_values[test_idx], Y_pred, Y.columns)
+        frames.append(scores.assign(fold=fold))
+
+    return pd.concat(frames, ignore_index=True)[["fold", "target", "n", "r2", "rmse"]]
@@ -0,0 +1,243 @@
+# src/ml/outliers.py
+
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import IsolationForest
+
+from src.tracing import traced
+
+
+DEFAULT_METHODS = ("iqr", "country_z")
+
+# Scales the MAD to the standard deviation of a normal distribution
+MAD_TO_SIGMA = 1.4826
+
+
+class OutlierReport(NamedTuple):
+    """
+    Result of detect_outliers.
+
+    keep: Boolean mask of rows to keep (aligned with the input).
+    flags: (n_rows, n_methods, n_columns) boolean cube of cell flags
+           (the isolation forest flags whole rows, so its slice is
+           constant across columns).
+    methods / columns: Labels of the flag cube axes.
+    reasons: Per-row report for every row with at least one flag,
+             indexed like the input, with n_methods (distinct methods
+             flagging), reasons ("method:column; ...") and dropped.
+    """
+    keep: np.ndarray
+    flags: np.ndarray
+    methods: List[str]
+    columns: List[str]
+    reasons: pd.DataFrame
+
+
+def iqr_flags(values: np.ndarray, k: float = 3.0) -> np.ndarray:
+    """
+    Cells outside [Q1 - k*IQR, Q3 + k*IQR] of their column.
+    """
+    q1, q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+    iqr = q3 - q1
+    return (values < q1 - k * iqr) | (values > q3 + k * iqr)
+
+
+def _robust_z(values: np.ndarray, median: np.ndarray, mad: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (values - median) / (MAD_TO_SIGMA * mad)
+    # Constant columns (MAD = 0) cannot be judged
+    return np.where(mad > 0, np.abs(z), 0.0)
+
+
+def mad_flags(values: np.ndarray, threshold: float = 3.5) -> np.ndarray:
+    """
+    Cells whose robust z-score |x - median| / (1.4826 MAD) over the
+    whole column exceeds the threshold.
+    """
+    median = np.nanmedian(values, axis=0)
+    mad = np.nanmedian(np.abs(values - median), axis=0)
+    return _robust_z(values, median, mad) > threshold
+
+
+def country_z_flags(
+    values: np.ndarray, groups: np.ndarray, threshold: float = 3.5
+) -> np.ndarray:
+    """
+    Cells whose robust z-score within their own country exceeds the
+    threshold, i.e. breaks in a country's series rather than
+    countries that are simply different (Luxembourg's GDP).
+    """
+    frame = pd.DataFrame(values)
+    grouped = frame.groupby(np.asarray(groups))
+
+    median = grouped.transform("median").to_numpy()
+    deviation = pd.DataFrame(np.abs(values - median))
+    mad = deviation.groupby(np.asarray(groups)).transform("median").to_numpy()
+
+    return _robust_z(values, median, mad) > threshold
+
+
+def isolation_forest_flags(
+    values: np.ndarray,
+    contamination="auto",
+    n_estimators: int = 200,
+    n_jobs: int = -1,
+    random_state: int = 42,
+) -> np.ndarray:
+    """
+    Rows the isolation forest labels anomalous (trees are built in
+    parallel). Missing cells are filled with the column median.
+    """
+    filled = np.where(np.isnan(values), np.nanmedian(values, axis=0), values)
+    forest = IsolationForest(
+        n_estimators=n_estimators,
+        contamination=contamination,
+        n_jobs=n_jobs,
+        random_state=random_state,
+    )
+    return forest.fit_predict(filled) == -1
+
+
+def _reason_report(
+    flags: np.ndarray,
+    methods: Sequence[str],
+    columns: Sequence[str],
+    index: pd.Index,
+) -> pd.DataFrame:
+    """
+    One row per flagged input row with the distinct methods flagging
+    it and the flagged (method, column) pairs.
+
+    Reason strings are built once per distinct flag pattern, not per
+    row, so the cost stays flat on large panels.
+    """
+    flagged = np.flatnonzero(flags.any(axis=(1, 2)))
+    patterns, inverse = np.unique(
+        flags[flagged].reshape(len(flagged), flags.shape[1] * flags.shape[2]),
+        axis=0,
+        return_inverse=True,
+    )
+
+    labels = [
+        "isolation_forest" if method == "isolation_forest" else f"{method}:{column}"
+        for method in methods for column in columns
+    ]
+    texts = np.array(
+        ["; ".join(dict.fromkeys(np.asarray(labels, dtype=object)[p])) for p in patterns],
+        dtype=object,
+    )
+
+    return pd.DataFrame(
+        {
+            "n_methods": flags[flagged].any(axis=2).sum(axis=1),
+            "reasons": texts[inverse.ravel()] if len(flagged) else [],
+        },
+        index=index[flagged],
+    )
+
+
+def detect_outliers(
+    X: pd.DataFrame,
+    y: Optional[pd.Series] = None,
+    groups: Optional[Sequence] = None,
+    methods: Sequence[str] = DEFAULT_METHODS,
+    min_methods: Optional[int] = None,
+    iqr_k: float = 3.0,
+    z_threshold: float = 3.5,
+    isolation_forest: bool = False,
+    contamination="auto",
+    n_jobs: int = -1,
+    random_state: int = 42,
+) -> OutlierReport:
+    """
+    Multivariate outlier detection over all features (and the target)
+    in one vectorized pass per method.
+
+    A row is dropped when at least `min_methods` methods flag the same
+    cell. With the defaults a value must be extreme both across the
+    panel and within its own country's series, so countries that are
+    simply different (Luxembourg's GDP) are kept while breaks and
+    data errors are removed.
+
+    Args:
+        X: Feature frame.
+        y: Optional target, checked like a feature column.
+        groups: Country of each row (used by "country_z").
+        methods: Any of "iqr", "mad", "country_z".
+                 Without groups the per-country check is skipped.
+        min_methods: Votes required to drop a row
+                     (default: 2, or 1 if only one method runs).
+        iqr_k: IQR fence multiplier.
+        z_threshold: Robust z-score threshold for "mad" / "country_z".
+        isolation_forest: Also run a parallel isolation forest.
+        contamination, n_jobs, random_state: Isolation forest settings.
+    """
+    columns = list(X.columns)
+    values = X.to_numpy(dtype=np.float64, na_value=np.nan)
+    if y is not None:
+        columns.append(y.name or "target")
+        values = np.column_stack([values, np.asarray(y, dtype=np.float64)])
+
+    checks: List[Tuple[str, np.ndarray]] = []
+    for method in methods:
+        if method == "iqr":
+            checks.append((method, iqr_flags(values, iqr_k)))
+        elif method == "mad":
+            checks.append((method, mad_flags(values, z_threshold)))
+        elif method == "country_z":
+            if groups is None:
+                continue
+            checks.append((method, country_z_flags(values, groups, z_threshold)))
+        else:
+            raise ValueError(f"Unknown outlier method: '{method}'")
+
+    if isolation_forest:
+        row_flags = isolation_forest_flags(
+            values, contamination, n_jobs=n_jobs, random_state=random_state
+        )
+        checks.append((
+            "isolation_forest",
+            np.broadcast_to(row_flags[:, None], values.shape),
+        ))
+
+    method_names = [name for name, _ in checks]
+    flags = np.stack([flag for _, flag in checks], axis=1)
+
+    # Methods must agree on the same cell (row, column)
+    if min_methods is None:
+        min_methods = min(2, len(checks))
+    votes = flags.sum(axis=1).max(axis=1)
+    keep = votes < min_methods
+
+    reasons = _reason_report(flags, method_names, columns, X.index)
+    reasons["dropped"] = ~keep[X.index.get_indexer(reasons.index)]
+
+    return OutlierReport(
+        keep=keep,
+        flags=flags,
+        methods=method_names,
+        columns=columns,
+        reasons=reasons,
+    )
+
+
+@traced("outliers/remove", rows="X_train")
+def remove_outliers(
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    groups: Optional[Sequence] = None,
+    **kwargs,
+) -> Tuple[pd.DataFrame, pd.Series, OutlierReport]:
+    """
+    Drop multivariate outliers from the training set only.
+
+    Drop-in for remove_outliers_iqr that also returns the report.
+    """
+    report = detect_outliers(X_train, y_train, groups, **kwargs)
+
+    print("Train size BEFORE outlier removal:", len(y_train))
+    print("Train size AFTER outlier removal:", int(report.keep.sum()))
+
+    return X_train[report.keep], y_train[report.keep], report
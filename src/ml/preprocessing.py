@@ -1,6 +1,6 @@
 # src/ml/preprocessing.py
 
-from typing import Tuple
+from typing import Dict, Tuple
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
@@ -11,11 +11,12 @@ from sklearn.preprocessing import StandardScaler
 def clean_data(df: pd.DataFrame, target: str) -> pd.DataFrame:
     """
     Keeps only numeric columns and target.
+    Rows without a target value (non-inner joins) are dropped.
     """
     numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
     if target not in numeric_cols:
         raise ValueError(f"Target column '{target}' must be numeric.")
-    return df[numeric_cols].copy()
+    return df.loc[df[target].notna(), numeric_cols].copy()
 
 
 def split_data(
@@ -78,4 +79,105 @@ def preprocess_test_data(
     """
     X_imputed = imputer.transform(X_test)
     X_scaled = scaler.transform(X_imputed)
-    return X_scaled
\ No newline at end of file
+    return X_scaled
+
+
+# ---------------------------------------------------------------------
+# Copy-free path: one contiguous array, in-place impute + scale
+# ---------------------------------------------------------------------
+
+def prepare_arrays(
+    df: pd.DataFrame,
+    target: str,
+    test_size: float = 0.2,
+    dtype=np.float64,
+    remove_outliers: bool = True,
+    random_state: int = 42,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Memory-lean equivalent of clean_data -> split_data ->
+    remove_outliers_iqr -> preprocess_training_data / preprocess_test_data.
+
+    The numeric features are written once, straight from the frame,
+    into one contiguous column-major array of the requested dtype per
+    split (training rows after target outlier removal, and test rows).
+    Mean imputation and standard scaling are then applied in place,
+    column by column, using statistics from the training rows only.
+
+    Uses the same split and outlier rule as the DataFrame path, so
+    results match it up to floating-point precision.
+
+    Returns:
+        (X_train, X_test, y_train, y_test, stats) where stats holds
+        feature_names, mean and scale for transforming new data.
+    """
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    if target not in numeric_cols:
+        raise ValueError(f"Target column '{target}' must be numeric.")
+    feature_names = [col for col in numeric_cols if col != target]
+
+    # Rows without a target are dropped before the split, as in
+    # clean_data; kept as row positions so the frame is never copied
+    y_all = df[target].to_numpy(dtype=dtype, copy=False)
+    train_idx, test_idx = train_test_split(
+        np.flatnonzero(~np.isnan(y_all)), test_size=test_size, random_state=random_state
+    )
+
+    if remove_outliers:
+        y_train_all = y_all[train_idx]
+        q1, q3 = np.quantile(y_train_all, [0.25, 0.75])
+        iqr = q3 - q1
+        keep = (y_train_all >= q1 - 1.5 * iqr) & (y_train_all <= q3 + 1.5 * iqr)
+        train_idx = train_idx[keep]
+
+    # One allocation per block; each column is filled straight from the frame
+    X_train = np.empty((len(train_idx), len(feature_names)), dtype=dtype, order="F")
+    X_test = np.empty((len(test_idx), len(feature_names)), dtype=dtype, order="F")
+    for j, col in enumerate(feature_names):
+        values = df[col].to_numpy(copy=False)
+        X_train[:, j] = values[train_idx]
+        X_test[:, j] = values[test_idx]
+
+    mean, scale = fit_impute_scale_inplace(X_train)
+    transform_inplace(X_test, mean, scale)
+
+    stats = {"feature_names": feature_names, "mean": mean, "scale": scale}
+    return X_train, X_test, y_all[train_idx], y_all[test_idx], stats
+
+
+def fit_impute_scale_inplace(X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Learn per-column mean/std on X and mean-impute + standardise it in
+    place (as SimpleImputer(mean) + StandardScaler).
+
+    Returns:
+        (mean, scale) per column.
+    """
+    n_rows, n_cols = X.shape
+    mean = np.zeros(n_cols, dtype=np.float64)
+    scale = np.ones(n_cols, dtype=np.float64)
+
+    for j in range(n_cols):
+        col = X[:, j]
+        observed = ~np.isnan(col)
+
+        if observed.any():
+            mean[j] = col[observed].mean(dtype=np.float64)
+            # Imputed rows sit exactly at the mean and add no variance
+            var = np.square(col[observed] - mean[j], dtype=np.float64).sum() / n_rows
+            scale[j] = np.sqrt(var) if var > 0 else 1.0
+
+    transform_inplace(X, mean, scale)
+    return mean, scale
+
+
+def transform_inplace(X: np.ndarray, mean: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """
+    Apply stored impute + scale statistics to new data in place.
+    """
+    for j in range(X.shape[1]):
+        col = X[:, j]
+        np.nan_to_num(col, copy=False, nan=mean[j])
+        col -= mean[j]
+        col /= scale[j]
+    return X
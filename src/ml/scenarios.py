@@ -0,0 +1,290 @@
+# src/ml/scenarios.py
+
+import contextlib
+import hashlib
+import io
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+from src.data_loader import EU_REGIONS, TARGET_COLUMNS, dataset_fingerprint
+from src.query import MasterIndex
+
+
+# Columns every scenario keeps, whatever its feature subset
+KEY_COLUMNS = ["iso3", "year", "life_expectancy"]
+
+
+class Scenario(NamedTuple):
+    """
+    One pipeline run on a subset of the master dataset.
+
+    countries: iso3 codes kept (None = all).
+    exclude: iso3 codes dropped.
+    features: feature columns kept (None = all).
+    """
+    name: str
+    countries: Optional[Sequence[str]] = None
+    exclude: Sequence[str] = ()
+    features: Optional[Sequence[str]] = None
+
+
+# =============================
+# Scenario builders
+# =============================
+
+def leave_one_country_out(df: pd.DataFrame) -> List[Scenario]:
+    return [
+        Scenario(f"without_{iso3}", exclude=(iso3,))
+        for iso3 in sorted(df["iso3"].unique())
+    ]
+
+
+def region_subsets(df: pd.DataFrame) -> List[Scenario]:
+    """
+    One scenario per EU region, trained on that region's countries.
+    """
+    present = set(df["iso3"])
+    regions: Dict[str, List[str]] = {}
+    for iso3, region in EU_REGIONS.items():
+        if iso3 in present:
+            regions.setdefault(region, []).append(iso3)
+
+    return [
+        Scenario(f"region_{region.lower().replace(' ', '_')}", countries=tuple(codes))
+        for region, codes in sorted(regions.items())
+    ]
+
+
+def leave_one_feature_out(df: pd.DataFrame) -> List[Scenario]:
+    features = feature_columns(df)
+    return [
+        Scenario(f"without_{feature}", features=tuple(f for f in features if f != feature))
+        for feature in features
+    ]
+
+
+def feature_columns(df: pd.DataFrame) -> List[str]:
+    return [
+        col for col in df.select_dtypes(include=[np.number]).columns
+        if col not in KEY_COLUMNS and col not in TARGET_COLUMNS
+    ]
+
+
+# =============================
+# Shared master dataset
+# =============================
+
+class SharedMaster(NamedTuple):
+    """
+    Master dataset saved once as memory-mapped .npy files: numeric
+    columns as one float64 matrix and iso3 as integer codes.
+    Workers map the same pages instead of receiving a pickled copy.
+    """
+    directory: Path
+    columns: List[str]
+    countries: List[str]
+
+
+def share_master(df: pd.DataFrame, directory: Path) -> SharedMaster:
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    # Sorted by (iso3, year): every country is one contiguous block
+    df = MasterIndex(df).frame
+    columns = [col for col in df.columns if col != "iso3"]
+    codes, countries = pd.factorize(df["iso3"], sort=True)
+
+    np.save(directory / "values.npy", df[columns].to_numpy(dtype=np.float64, na_value=np.nan))
+    np.save(directory / "iso3.npy", codes.astype(np.int32))
+
+    return SharedMaster(directory, columns, list(countries))
+
+
+def load_scenario_frame(shared: SharedMaster, scenario: Scenario) -> pd.DataFrame:
+    """
+    Rows and columns of one scenario, read from the mapped master.
+    Only the selected rows are copied into the worker.
+    """
+    values = np.load(shared.directory / "values.npy", mmap_mode="r")
+    codes = np.load(shared.directory / "iso3.npy", mmap_mode="r")
+
+    countries = np.asarray(shared.countries, dtype=object)
+    keep = np.ones(len(countries), dtype=bool)
+    if scenario.countries is not None:
+        keep &= np.isin(countries, list(scenario.countries))
+    keep &= ~np.isin(countries, list(scenario.exclude))
+
+    # Codes are sorted, so each kept country is one block of rows
+    # found by binary search; only those pages of the map are read
+    bounds = np.searchsorted(codes, np.arange(len(countries) + 1))
+    kept = np.flatnonzero(keep)
+    rows = np.concatenate(
+        [np.arange(bounds[i], bounds[i + 1]) for i in kept] or [np.empty(0, dtype=np.intp)]
+    )
+    if scenario.features is None:
+        columns = shared.columns
+    else:
+        unknown = set(scenario.features) - set(shared.columns)
+        if unknown:
+            raise KeyError(f"Unknown features in scenario '{scenario.name}': {sorted(unknown)}")
+        columns = [col for col in shared.columns
+                   if col in KEY_COLUMNS or col in scenario.features]
+    col_idx = [shared.columns.index(col) for col in columns]
+
+    df = pd.DataFrame(values[np.ix_(rows, col_idx)], columns=columns)
+    df.insert(0, "iso3", countries[codes[rows]])
+    df["year"] = df["year"].astype(int)
+    return df
+
+
+# =============================
+# Running
+# =============================
+
+def run_key(df: pd.DataFrame, pipeline: Callable, pipeline_kwargs: Dict) -> str:
+    """
+    Identifies what a checkpointed record was computed from: the
+    dataset fingerprint, the pipeline and its keyword arguments.
+    """
+    settings = json.dumps(
+        {"pipeline": getattr(pipeline, "__qualname__", repr(pipeline)), **pipeline_kwargs},
+        sort_keys=True, default=repr,
+    )
+    digest = hashlib.sha1(settings.encode()).hexdigest()[:16]
+    return f"{dataset_fingerprint(df)}:{digest}"
+
+
+def _run_shard(
+    pipeline: Callable,
+    shared: SharedMaster,
+    scenario: Scenario,
+    pipeline_kwargs: Dict,
+    key: str,
+) -> Dict:
+    start = time.perf_counter()
+    df = load_scenario_frame(shared, scenario)
+
+    record = {
+        "scenario": scenario.name,
+        "run_key": key,
+        "definition": _definition(scenario),
+        "n_rows": len(df),
+        "n_countries": int(df["iso3"].nunique()),
+    }
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            metrics = pipeline(df, **pipeline_kwargs)
+        record.update({k: float(v) for k, v in metrics.items()})
+        record["error"] = None
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+def _definition(scenario: Scenario) -> Dict:
+    return {
+        "countries": None if scenario.countries is None else sorted(scenario.countries),
+        "exclude": sorted(scenario.exclude),
+        "features": None if scenario.features is None else sorted(scenario.features),
+    }
+
+
+def read_checkpoint(path: Path, key: Optional[str] = None) -> Dict[str, Dict]:
+    """
+    Completed scenario records by name (the last one wins); with a
+    key, only records computed with that run_key.
+    """
+    done: Dict[str, Dict] = {}
+    path = Path(path)
+    if not path.exists():
+        return done
+
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A line cut short by an interruption
+                continue
+            if key is not None and record.get("run_key") != key:
+                continue
+            done[record["scenario"]] = record
+    return done
+
+
+def run_scenarios(
+    df: pd.DataFrame,
+    scenarios: Sequence[Scenario],
+    pipeline: Callable,
+    checkpoint_path: Optional[Path] = None,
+    n_jobs: int = -1,
+    retry_failed: bool = False,
+    **pipeline_kwargs,
+) -> pd.DataFrame:
+    """
+    Run pipeline(df_subset, **pipeline_kwargs) for every scenario in
+    a process pool and collect the returned metrics in one table.
+
+    The master is written once to memory-mapped files shared by all
+    workers. Every finished scenario is appended to checkpoint_path
+    (JSON lines) as it completes, and scenarios already in the
+    checkpoint are skipped, so an interrupted study resumes where it
+    stopped. A record is only reused if its run_key (dataset
+    fingerprint, pipeline and pipeline_kwargs) and the scenario's
+    definition match; anything else is run again.
+
+    Returns:
+        One row per scenario (in the given order) with run_key,
+        n_rows, n_countries, the pipeline metrics, seconds and error.
+    """
+    names = [s.name for s in scenarios]
+    if len(set(names)) != len(names):
+        raise ValueError("Scenario names must be unique")
+
+    key = run_key(df, pipeline, pipeline_kwargs)
+    definitions = {s.name: _definition(s) for s in scenarios}
+
+    done = read_checkpoint(checkpoint_path, key) if checkpoint_path else {}
+    done = {
+        name: r for name, r in done.items()
+        if r.get("definition") == definitions.get(name)
+        and not (retry_failed and r.get("error") is not None)
+    }
+    pending = [s for s in scenarios if s.name not in done]
+
+    if pending:
+        with tempfile.TemporaryDirectory(prefix="scenarios_") as tmp:
+            shared = share_master(df, Path(tmp))
+
+            checkpoint = None
+            if checkpoint_path:
+                Path(checkpoint_path).parent.mkdir(parents=True, exist_ok=True)
+                checkpoint = open(checkpoint_path, "a")
+
+            try:
+                results = Parallel(n_jobs=n_jobs, return_as="generator_unordered")(
+                    delayed(_run_shard)(pipeline, shared, scenario, pipeline_kwargs, key)
+                    for scenario in pending
+                )
+                for record in results:
+                    done[record["scenario"]] = record
+                    if checkpoint is not None:
+                        checkpoint.write(json.dumps(record) + "\n")
+                        checkpoint.flush()
+            finally:
+                if checkpoint is not None:
+                    checkpoint.close()
+
+    return pd.DataFrame([done[name] for name in names]).drop(columns="definition")
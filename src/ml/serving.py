@@ -0,0 +1,414 @@
+# src/ml/serving.py
+
+import asyncio
+import json
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.ml.artifact import (
+    DEFAULT_ARTIFACT_PATH,
+    PipelineArtifact,
+    load_pipeline_artifact,
+    prepare_features,
+)
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Requests arriving within this window are scored together
+DEFAULT_BATCH_WINDOW_MS = 2.0
+DEFAULT_MAX_BATCH_ROWS = 4096
+
+# Number of recent requests kept for latency percentiles
+LATENCY_WINDOW = 10_000
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+
+class ServerMetrics:
+    """
+    Request, batch and latency counters exposed on GET /metrics.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.errors = 0
+        self.latencies_ms = deque(maxlen=LATENCY_WINDOW)
+        self.batch_sizes = deque(maxlen=LATENCY_WINDOW)
+
+    def record_batch(self, n_rows: int) -> None:
+        self.batches += 1
+        self.batch_sizes.append(n_rows)
+
+    def record_request(self, n_rows: int, latency_ms: float) -> None:
+        self.requests += 1
+        self.rows += n_rows
+        self.latencies_ms.append(latency_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        uptime = time.perf_counter() - self.started_at
+        latencies = np.asarray(self.latencies_ms, dtype=np.float64)
+
+        if latencies.size:
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+            latency = {
+                "p50": p50, "p95": p95, "p99": p99, "max": latencies.max()
+            }
+        else:
+            latency = {"p50": None, "p95": None, "p99": None, "max": None}
+
+        return {
+            "uptime_s": uptime,
+            "requests": self.requests,
+            "rows": self.rows,
+            "batches": self.batches,
+            "errors": self.errors,
+            "requests_per_s": self.requests / uptime if uptime > 0 else 0.0,
+            "rows_per_s": self.rows / uptime if uptime > 0 else 0.0,
+            "mean_batch_rows": (
+                float(np.mean(self.batch_sizes)) if self.batch_sizes else 0.0
+            ),
+            "latency_ms": latency,
+        }
+
+
+class MicroBatcher:
+    """
+    Collects concurrent prediction requests into micro-batches.
+
+    The first request of a batch opens a window of batch_window_ms;
+    everything queued before the window closes (up to max_batch_rows)
+    is stacked and scored with one matrix product.
+    """
+
+    def __init__(
+        self,
+        artifact: PipelineArtifact,
+        metrics: ServerMetrics,
+        batch_window_ms: float = DEFAULT_BATCH_WINDOW_MS,
+        max_batch_rows: int = DEFAULT_MAX_BATCH_ROWS,
+    ):
+        self.artifact = artifact
+        self.metrics = metrics
+        self.batch_window = batch_window_ms / 1000.0
+        self.max_batch_rows = max_batch_rows
+        self.queue: "asyncio.Queue[Tuple[np.ndarray, asyncio.Future]]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def predict(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Queue rows for scoring and wait for their predictions.
+        Rows must be a (n, features) array; anything else is rejected
+        here so it can never reach a shared batch.
+        """
+        n_features = len(self.artifact.feature_names)
+        if rows.ndim != 2 or rows.shape[1] != n_features:
+            raise ValueError(
+                f"Expected rows of shape (n, {n_features}), got {rows.shape}"
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((rows, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[np.ndarray, asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+
+        items = [await self.queue.get()]
+        n_rows = len(items[0][0])
+        deadline = loop.time() + self.batch_window
+
+        while n_rows < self.max_batch_rows:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self.queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            items.append(item)
+            n_rows += len(item[0])
+
+        # Drain anything already queued without waiting further
+        while n_rows < self.max_batch_rows and not self.queue.empty():
+            item = self.queue.get_nowait()
+            items.append(item)
+            n_rows += len(item[0])
+
+        return items
+
+    async def _run(self) -> None:
+        # Only cancellation (stop) ends the loop: any other error is
+        # handed to the waiting requests and the next batch is served
+        while True:
+            items = await self._collect()
+            try:
+                self._score(items)
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _score(self, items: List[Tuple[np.ndarray, asyncio.Future]]) -> None:
+        try:
+            X = np.concatenate([rows for rows, _ in items], axis=0)
+            y_pred = self.artifact.predict(X)
+        except Exception:
+            if len(items) == 1:
+                raise
+            # Score every request on its own so only the failing one
+            # gets the error, not the others coalesced with it
+            for item in items:
+                try:
+                    self._score([item])
+                except Exception as e:
+                    if not item[1].done():
+                        item[1].set_exception(e)
+            return
+
+        self.metrics.record_batch(len(X))
+
+        offset = 0
+        for rows, future in items:
+            if not future.done():
+                future.set_result(y_pred[offset:offset + len(rows)])
+            offset += len(rows)
+
+
+def parse_instances(payload: Dict[str, Any], artifact: PipelineArtifact) -> np.ndarray:
+    """
+    Convert a request body into a (rows, features) array.
+
+    Accepted bodies:
+        {"instances": [{"feature": value, ...}, ...]}  (missing keys -> NaN)
+        {"rows": [[v1, v2, ...], ...]}                 (stored feature order)
+
+    Instances are raw rows: for artifacts trained with engineered
+    features or panel imputation these steps are rerun (see
+    prepare_features), so the instances need iso3 and year, plus the
+    earlier years any engineered feature refers to. Rows are taken
+    as the final feature matrix.
+    """
+    feature_names = artifact.feature_names
+
+    if "rows" in payload:
+        X = np.asarray(payload["rows"], dtype=np.float64)
+        if X.ndim == 1:
+            X = X[None, :]
+        if X.ndim != 2:
+            raise ValueError("'rows' must be a list of rows (a 2-D array).")
+    elif "instances" in payload and (
+        artifact.metadata.get("feature_config") or artifact.panel_imputer is not None
+    ):
+        df = prepare_features(
+            pd.DataFrame(payload["instances"]), artifact.metadata, artifact.panel_imputer
+        )
+        X = df.reindex(columns=feature_names).to_numpy(dtype=np.float64, na_value=np.nan)
+    elif "instances" in payload:
+        X = np.array(
+            [
+                [np.nan if inst.get(f) is None else inst[f] for f in feature_names]
+                for inst in payload["instances"]
+            ],
+            dtype=np.float64,
+        ).reshape(-1, len(feature_names))
+    else:
+        raise ValueError("Body must contain 'instances' or 'rows'.")
+
+    if X.shape[1] != len(feature_names):
+        raise ValueError(f"Expected {len(feature_names)} features per row.")
+
+    return X
+
+
+class InferenceServer:
+    """
+    Minimal asyncio HTTP/1.1 server (keep-alive) around a MicroBatcher.
+
+    Endpoints:
+        POST /predict  -> {"predictions": [...]}
+        GET  /metrics  -> ServerMetrics.snapshot()
+        GET  /health   -> {"status": "ok", ...}
+    """
+
+    def __init__(
+        self,
+        artifact: PipelineArtifact,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        batch_window_ms: float = DEFAULT_BATCH_WINDOW_MS,
+        max_batch_rows: int = DEFAULT_MAX_BATCH_ROWS,
+    ):
+        self.artifact = artifact
+        self.host = host
+        self.port = port
+        self.metrics = ServerMetrics()
+        self.batcher = MicroBatcher(
+            artifact, self.metrics, batch_window_ms, max_batch_rows
+        )
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        self.batcher.start()
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        # Resolve the actual port when started with port=0
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                parts = request_line.decode("latin-1").rstrip("\r\n").split(" ")
+                headers, malformed = {}, len(parts) != 3
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, sep, value = line.decode("latin-1").partition(":")
+                    if not sep or not name.strip():
+                        malformed = True
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    length, malformed = -1, True
+
+                # The connection cannot be resynchronised after a bad
+                # head or an unread body: answer, then close it
+                if malformed or length < 0:
+                    self.metrics.errors += 1
+                    await self._respond(
+                        writer, 400, {"error": "Malformed request"}, keep_alive=False
+                    )
+                    break
+                if length > MAX_BODY_BYTES:
+                    self.metrics.errors += 1
+                    await self._respond(
+                        writer, 413, {"error": "Body too large"}, keep_alive=False
+                    )
+                    break
+                method, path, _ = parts
+                body = await reader.readexactly(length) if length else b""
+
+                status, response = await self._route(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self._respond(writer, status, response, keep_alive)
+
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            # Peer gone, body cut short, or a head line over the
+            # stream limit (readline raises ValueError)
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, body: bytes):
+        if method == "GET" and path == "/metrics":
+            return 200, self.metrics.snapshot()
+
+        if method == "GET" and path == "/health":
+            return 200, {
+                "status": "ok",
+                "features": self.artifact.feature_names,
+                "dataset_fingerprint": self.artifact.metadata.get("dataset_fingerprint"),
+            }
+
+        if method == "POST" and path == "/predict":
+            start = time.perf_counter()
+            try:
+                X = parse_instances(json.loads(body), self.artifact)
+                y_pred = await self.batcher.predict(X)
+            except (ValueError, TypeError, KeyError, AttributeError) as e:
+                self.metrics.errors += 1
+                return 400, {"error": str(e)}
+
+            self.metrics.record_request(
+                len(X), (time.perf_counter() - start) * 1000.0
+            )
+            return 200, {"predictions": y_pred.tolist()}
+
+        return 404, {"error": f"No route for {method} {path}"}
+
+    @staticmethod
+    async def _respond(
+        writer: asyncio.StreamWriter,
+        status: int,
+        payload: Dict[str, Any],
+        keep_alive: bool = True,
+    ) -> None:
+        reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large"}
+        body = json.dumps(payload).encode()
+
+        head = (
+            f"HTTP/1.1 {status} {reasons.get(status, 'Error')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        ).encode("latin-1")
+
+        writer.write(head + body)
+        await writer.drain()
+
+
+def run_server(
+    artifact_path: Path = DEFAULT_ARTIFACT_PATH,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    batch_window_ms: float = DEFAULT_BATCH_WINDOW_MS,
+    max_batch_rows: int = DEFAULT_MAX_BATCH_ROWS,
+) -> None:
+    """
+    Load the artifact once and serve predictions until interrupted.
+    """
+    artifact = load_pipeline_artifact(artifact_path)
+    server = InferenceServer(artifact, host, port, batch_window_ms, max_batch_rows)
+
+    print(f"Serving {artifact_path} on http://{host}:{port} "
+          f"(batch window {batch_window_ms} ms)")
+
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("Server stopped.")
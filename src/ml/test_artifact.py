@@ -0,0 +1,165 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from src.ml.preprocessing import preprocess_training_data
+from src.ml.model import train_model
+from src.ml.artifact import (
+    save_pipeline_artifact,
+    load_pipeline_artifact,
+    load_sklearn_pipeline,
+)
+
+
+def test_artifact_roundtrip(tmp_path):
+    """
+    The NumPy fast path must reproduce the scikit-learn pipeline,
+    including mean imputation of missing values.
+    """
+
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(rng.normal(size=(200, 4)), columns=list("abcd"))
+    y = X.to_numpy() @ np.array([1.0, -2.0, 0.5, 3.0]) + rng.normal(size=200)
+    X.iloc[::10, 1] = np.nan
+
+    X_processed, imputer, scaler = preprocess_training_data(X)
+    model = train_model(X_processed, y)
+
+    path = save_pipeline_artifact(
+        tmp_path / "model.npz", imputer, scaler, model,
+        feature_names=list(X.columns), fingerprint="test"
+    )
+
+    artifact = load_pipeline_artifact(path)
+    metadata, imputer2, scaler2, model2 = load_sklearn_pipeline(path)
+
+    expected = model2.predict(scaler2.transform(imputer2.transform(X)))
+
+    assert metadata["feature_names"] == list("abcd")
+    assert np.allclose(artifact.predict(X.to_numpy()), expected)
+
+
+def test_engineered_feature_artifact_scores_raw_input(tmp_path):
+    """
+    An artifact trained with a feature config scores raw panel rows
+    (predict.py and serving instances) by recomputing the engineered
+    features, matching the training-time transformation; an empty input
+    file gives a header-only output.
+    """
+    from predict import predict_file
+    from src.feature_engineering import engineer_features, feature_names
+    from src.ml.serving import parse_instances
+
+    rng = np.random.default_rng(0)
+    countries, years = ["AUT", "BEL", "DEU", "FRA"], np.arange(2000, 2015)
+    df = pd.DataFrame({
+        "iso3": np.repeat(countries, len(years)),
+        "year": np.tile(years, len(countries)),
+        "gdp_per_capita": rng.lognormal(10, 0.3, len(countries) * len(years)),
+        "doctors_per_100k": rng.normal(400, 50, len(countries) * len(years)),
+    })
+    df.loc[::7, "doctors_per_100k"] = np.nan
+    config = {
+        "gdp_per_capita": {"lags": [1], "growth": True, "windows": [3]},
+        "doctors_per_100k": {"lags": [2], "growth": False, "windows": []},
+    }
+
+    engineered = engineer_features(df, config)
+    X = engineered.drop(columns=["iso3"])
+    y = rng.normal(80, 2, len(X))
+    X_processed, imputer, scaler = preprocess_training_data(X)
+    model = train_model(X_processed, y)
+
+    path = save_pipeline_artifact(
+        tmp_path / "model.npz", imputer, scaler, model,
+        feature_names=list(X.columns), fingerprint="test",
+        extra_metadata={"feature_config": config},
+    )
+    assert set(feature_names(config)) <= set(X.columns)
+
+    # Raw input in shuffled order: no engineered columns
+    raw = df.sample(frac=1.0, random_state=1)
+    raw.to_csv(tmp_path / "raw.csv", index=False)
+
+    expected = (
+        engineered.assign(pred=model.predict(scaler.transform(imputer.transform(X))))
+        .set_index(["iso3", "year"])["pred"]
+    )
+
+    for full in (False, True):
+        n_rows = predict_file(
+            tmp_path / "raw.csv", tmp_path / "out.csv", path, chunksize=13, full=full
+        )
+        out = pd.read_csv(tmp_path / "out.csv")
+        assert n_rows == len(raw)
+        assert list(out["iso3"]) == list(raw["iso3"])
+        assert np.allclose(
+            out["predicted_life_expectancy"],
+            expected.loc[list(zip(out["iso3"], out["year"]))],
+        )
+
+        # Empty input: header-only output
+        raw.iloc[:0].to_csv(tmp_path / "empty.csv", index=False)
+        assert predict_file(
+            tmp_path / "empty.csv", tmp_path / "empty_out.csv", path, full=full
+        ) == 0
+        empty = pd.read_csv(tmp_path / "empty_out.csv")
+        assert empty.empty
+        assert list(empty.columns) == ["iso3", "year", "predicted_life_expectancy"]
+
+    artifact = load_pipeline_artifact(path)
+    instances = raw.astype(object).where(raw.notna(), None).to_dict(orient="records")
+    rows = parse_instances({"instances": instances}, artifact)
+    assert np.allclose(
+        artifact.predict(rows), expected.loc[list(zip(raw["iso3"], raw["year"]))]
+    )
+
+
+def test_panel_imputer_is_persisted(tmp_path):
+    """
+    The fitted panel imputer is stored with the artifact and applied
+    before the mean imputer when scoring; an artifact trained with
+    panel imputation but saved without it is refused.
+    """
+    from predict import predict_file
+    from src.ml.imputation import PanelImputer
+
+    rng = np.random.default_rng(1)
+    countries, years = ["AUT", "BEL", "DEU", "FRA", "ITA"], np.arange(2000, 2012)
+    keys = pd.DataFrame({
+        "iso3": np.repeat(countries, len(years)),
+        "year": np.tile(years, len(countries)),
+    })
+    X = pd.DataFrame({
+        "year": keys["year"],
+        "a": np.cumsum(rng.normal(size=len(keys))),
+        "b": rng.normal(size=len(keys)),
+    })
+    X.loc[rng.random(len(X)) < 0.25, "a"] = np.nan
+    y = rng.normal(size=len(X))
+
+    panel_imputer = PanelImputer().fit(X.drop(columns=["year"]), keys)
+    X_filled = panel_imputer.transform(X, keys)
+    X_processed, imputer, scaler = preprocess_training_data(X_filled)
+    model = train_model(X_processed, y)
+
+    path = save_pipeline_artifact(
+        tmp_path / "model.npz", imputer, scaler, model,
+        feature_names=list(X.columns), fingerprint="test",
+        extra_metadata={"imputation": "panel"}, panel_imputer=panel_imputer,
+    )
+    artifact = load_pipeline_artifact(path)
+    pd.testing.assert_frame_equal(artifact.panel_imputer.transform(X, keys), X_filled)
+
+    pd.concat([keys[["iso3"]], X], axis=1).to_csv(tmp_path / "raw.csv", index=False)
+    predict_file(tmp_path / "raw.csv", tmp_path / "out.csv", path)
+    expected = model.predict(scaler.transform(imputer.transform(X_filled)))
+    assert np.allclose(pd.read_csv(tmp_path / "out.csv")["predicted_life_expectancy"], expected)
+
+    legacy = save_pipeline_artifact(
+        tmp_path / "legacy.npz", imputer, scaler, model,
+        feature_names=list(X.columns), fingerprint="test",
+        extra_metadata={"imputation": "panel"},
+    )
+    with pytest.raises(ValueError, match="panel imputation"):
+        load_pipeline_artifact(legacy)
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+
+from src.ml.cross_validation import (
+    FoldCache,
+    group_kfold_splits,
+    rolling_origin_splits,
+    panel_cross_validate,
+)
+
+
+def test_panel_splits_do_not_leak_and_folds_are_cached():
+    """
+    Group folds never share a country, rolling-origin folds never train
+    on future years, and a repeated experiment reuses cached fold matrices.
+    """
+
+    rng = np.random.default_rng(0)
+    countries = np.repeat(["AUT", "BEL", "DEU", "FRA", "ITA", "ESP"], 20)
+    years = np.tile(np.arange(2000, 2020), 6)
+
+    X = pd.DataFrame({
+        "year": years,
+        "x1": rng.normal(size=len(years)),
+        "x2": rng.normal(size=len(years)),
+    })
+    y = pd.Series(0.1 * (years - 2000) + 2 * X["x1"] + rng.normal(0, 0.1, len(years)))
+
+    group_splits = group_kfold_splits(pd.Series(countries), n_splits=3)
+    for train_idx, test_idx in group_splits:
+        assert not set(countries[train_idx]) & set(countries[test_idx])
+
+    time_splits = rolling_origin_splits(X["year"], min_train_years=10, horizon=2)
+    for train_idx, test_idx in time_splits:
+        assert years[train_idx].max() < years[test_idx].min()
+
+    cache = FoldCache()
+    scores = panel_cross_validate(LinearRegression(), X, y, group_splits, cache=cache, n_jobs=1)
+    again = panel_cross_validate(LinearRegression(), X, y, group_splits, cache=cache, n_jobs=1)
+
+    assert cache.misses == len(group_splits)
+    assert cache.hits == len(group_splits)
+    assert np.allclose(scores, again)
+    assert scores.mean() > 0.9
+
+
+def test_panel_imputation_is_fitted_inside_each_fold():
+    """
+    With panel_keys, every fold's panel imputer sees only that fold's
+    training rows: validation countries are filled from the training
+    countries, never from their own values in other folds.
+    """
+    from src.ml.cross_validation import prepare_fold_matrices
+    from src.ml.imputation import PanelImputer
+    from src.ml.preprocessing import preprocess_training_data, preprocess_test_data
+
+    rng = np.random.default_rng(1)
+    countries = np.repeat(["AUT", "BEL", "DEU", "FRA", "ITA", "ESP"], 15)
+    years = np.tile(np.arange(2000, 2015), 6)
+    keys = pd.DataFrame({"iso3": countries, "year": years})
+    X = pd.DataFrame({
+        "year": years,
+        "x1": np.cumsum(rng.normal(size=len(years))),
+        "x2": rng.normal(size=len(years)),
+    })
+    X.loc[rng.random(len(X)) < 0.3, "x1"] = np.nan
+
+    splits = group_kfold_splits(pd.Series(countries), n_splits=3)
+    matrices = prepare_fold_matrices(X, splits, cache=FoldCache(), n_jobs=1, panel_keys=keys)
+
+    leaky = PanelImputer().fit(X.drop(columns=["year"]), keys).transform(X, keys)
+    for (train_idx, test_idx), (X_train, X_test) in zip(splits, matrices):
+        imputer = PanelImputer().fit(X.iloc[train_idx].drop(columns=["year"]), keys.iloc[train_idx])
+        expected_train, mean_imputer, scaler = preprocess_training_data(
+            imputer.transform(X.iloc[train_idx], keys.iloc[train_idx])
+        )
+        expected_test = preprocess_test_data(
+            imputer.transform(X.iloc[test_idx], keys.iloc[test_idx]), mean_imputer, scaler
+        )
+        assert np.allclose(X_train, expected_train)
+        assert np.allclose(X_test, expected_test)
+
+        # Globally imputed validation rows would differ (leakage)
+        leaked = preprocess_test_data(leaky.iloc[test_idx], mean_imputer, scaler)
+        assert not np.allclose(X_test, leaked)
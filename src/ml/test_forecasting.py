@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+from src.ml.forecasting import (
+    backtest,
+    build_design,
+    fit_direct,
+    forecast_countries,
+    regional_forecasts,
+)
+
+
+def test_direct_forecaster_extrapolates_trends():
+    """
+    Countries on exact linear trends must be forecast exactly at every
+    horizon, from each country's own last observed year.
+    """
+
+    years = np.arange(1990, 2020)
+    slopes = {"AUT": 0.2, "BEL": 0.1, "CZE": 0.3, "DNK": 0.15}
+    df = pd.DataFrame([
+        {"iso3": iso3, "year": year, "life_expectancy": 70 + slope * (year - 1990)}
+        for iso3, slope in slopes.items() for year in years
+    ])
+    df = df[~((df["iso3"] == "CZE") & (df["year"] > 2015))]
+
+    design = build_design(df, indicators=[], n_lags=2, horizon=3)
+    forecasts = forecast_countries(design, fit_direct(design, alpha=1e-9))
+
+    expected = 70 + forecasts["iso3"].map(slopes) * (forecasts["year"] - 1990)
+    assert np.allclose(forecasts["forecast"], expected, atol=1e-6)
+    assert forecasts.loc[forecasts["iso3"] == "CZE", "origin_year"].eq(2015).all()
+
+    results = backtest(design, min_train_years=8, alpha=1e-9, n_jobs=1)
+    assert (results.loc[results["n"] > 0, "rmse"] < 1e-6).all()
+
+
+def test_regional_forecasts_share_one_origin():
+    """
+    A region is averaged per horizon over the countries observed at its
+    latest origin; a country whose data end earlier is not mixed in.
+    """
+
+    years = np.arange(1990, 2020)
+    slopes = {"CZE": 0.3, "POL": 0.1, "SVK": 0.2, "AUT": 0.15}
+    df = pd.DataFrame([
+        {"iso3": iso3, "year": year, "life_expectancy": 70 + slope * (year - 1990)}
+        for iso3, slope in slopes.items() for year in years
+    ])
+    df = df[~((df["iso3"] == "CZE") & (df["year"] > 2015))]
+
+    design = build_design(df, indicators=[], n_lags=2, horizon=3)
+    regions = regional_forecasts(
+        forecast_countries(design, fit_direct(design, alpha=1e-9))
+    ).set_index(["region", "horizon"])
+
+    east = regions.loc["Eastern Europe"]
+    assert list(east.index) == [1, 2, 3]
+    assert east["origin_year"].eq(2019).all() and east["n_countries"].eq(2).all()
+    assert list(east["year"]) == [2020, 2021, 2022]
+    expected = 70 + (slopes["POL"] + slopes["SVK"]) / 2 * (east["year"] - 1990)
+    assert np.allclose(east["forecast"], expected, atol=1e-6)
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from src.ml.imputation import PanelImputer, carry_forward, interpolate_years
+
+
+def test_year_fills_match_pandas():
+    """
+    Vectorized interpolation and limited carry-forward must match
+    pandas applied series by series.
+    """
+
+    rng = np.random.default_rng(0)
+    cube = rng.normal(size=(3, 20, 30))
+    cube[rng.random(cube.shape) < 0.4] = np.nan
+
+    series = pd.DataFrame(cube.reshape(-1, 30).T)
+    interpolated = series.interpolate(limit_area="inside").to_numpy().T
+    carried = series.ffill(limit=2).to_numpy().T
+
+    assert np.allclose(interpolate_years(cube), interpolated.reshape(cube.shape), equal_nan=True)
+    assert np.allclose(carry_forward(cube, 2), carried.reshape(cube.shape), equal_nan=True)
+
+
+def test_panel_imputer_uses_country_and_year():
+    """
+    A gap inside a country's series is interpolated from that country,
+    not filled with the panel-wide mean.
+    """
+
+    keys = pd.DataFrame({
+        "iso3": ["AUT"] * 5 + ["BEL"] * 5,
+        "year": list(range(2015, 2020)) * 2,
+    })
+    X = pd.DataFrame({"gdp": [10.0, 11.0, np.nan, 13.0, 14.0, 50, 51, 52, 53, 54]})
+
+    filled = PanelImputer(methods=("interpolate",)).fit_transform(X, keys)
+
+    assert filled.loc[2, "gdp"] == 12.0
+    assert filled["gdp"].drop(2).equals(X["gdp"].drop(2))
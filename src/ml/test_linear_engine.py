@@ -0,0 +1,46 @@
+import numpy as np
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.metrics import r2_score
+from sklearn.model_selection import LeaveOneOut, cross_val_predict
+from sklearn.preprocessing import StandardScaler
+
+from src.ml.linear_engine import LinearSufficientStats, kfold_cv, loo_scores
+
+
+def test_sufficient_stats_match_sklearn():
+    """
+    Chunked statistics must reproduce OLS, standardised ridge,
+    k-fold and leave-one-out results of explicit refits.
+    """
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 4)) * [1, 10, 100, 0.1]
+    y = X @ np.array([1.0, 0.2, 0.01, 5.0]) + rng.normal(size=200)
+
+    stats = LinearSufficientStats(4)
+    for start in range(0, 200, 64):
+        stats.partial_fit(X[start:start + 64], y[start:start + 64])
+
+    coef, intercept = stats.solve()
+    ols = LinearRegression().fit(X, y)
+    assert np.allclose(coef, ols.coef_)
+    assert np.isclose(intercept, ols.intercept_)
+
+    scaler = StandardScaler().fit(X)
+    ridge = Ridge(alpha=5.0).fit(scaler.transform(X), y)
+    coef, _ = stats.solve(alpha=5.0, standardize=True)
+    assert np.allclose(coef, ridge.coef_ / scaler.scale_)
+
+    fold_ids = np.arange(200) % 5
+    scores = kfold_cv(X, y, alphas=[0.0], fold_ids=fold_ids)
+    expected = [
+        r2_score(y[fold_ids == k], LinearRegression()
+                 .fit(X[fold_ids != k], y[fold_ids != k])
+                 .predict(X[fold_ids == k]))
+        for k in range(5)
+    ]
+    assert np.allclose(scores["r2"], expected)
+
+    loo_rmse, _ = loo_scores(stats, [(X, y)])
+    loo_pred = cross_val_predict(LinearRegression(), X, y, cv=LeaveOneOut())
+    assert np.isclose(loo_rmse, np.sqrt(np.mean((y - loo_pred) ** 2)))
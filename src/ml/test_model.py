@@ -7,6 +7,7 @@ from src.ml.preprocessing import (
     remove_outliers_iqr,
     preprocess_training_data,
     preprocess_test_data,
+    prepare_arrays,
 )
 
 from src.ml.model import train_model
@@ -45,4 +46,34 @@ def test_full_pipeline():
 
     _, r2, _ = evaluate_model(model, X_test_processed, y_test)
 
-    assert r2 > 0.7
\ No newline at end of file
+    assert r2 > 0.7
+
+
+def test_array_path_matches_dataframe_path():
+    """
+    The copy-free array path must reproduce the DataFrame path,
+    including mean imputation of missing values and dropping rows
+    without a target.
+    """
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(300, 4)), columns=[f"feature_{i}" for i in range(4)])
+    df = df.mask(rng.random(df.shape) < 0.1)
+    df["life_expectancy"] = rng.normal(size=300)
+
+    for data in (df, df.assign(life_expectancy=df["life_expectancy"].mask(df.index % 7 == 0))):
+        X_train, X_test, y_train, y_test = split_data(
+            clean_data(data, target="life_expectancy"), target="life_expectancy"
+        )
+        X_train, y_train = remove_outliers_iqr(X_train, y_train)
+        X_train_processed, imputer, scaler = preprocess_training_data(X_train)
+        X_test_processed = preprocess_test_data(X_test, imputer, scaler)
+
+        A_train, A_test, a_train, a_test, _ = prepare_arrays(data, target="life_expectancy")
+
+        assert len(A_train) == len(X_train_processed) > 0
+        assert np.allclose(A_train, X_train_processed)
+        assert np.allclose(A_test, X_test_processed)
+        assert np.allclose(a_train, y_train)
+        assert np.allclose(a_test, y_test)
+        assert not np.isnan(a_test).any()
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+from sklearn.dummy import DummyRegressor
+from sklearn.linear_model import LinearRegression, Ridge
+
+from src.ml.cross_validation import group_kfold_splits, panel_cross_validate
+from src.ml.model_search import run_model_search
+
+
+def test_search_scores_group_folds_and_abandons_weak_models():
+    """
+    A raw frame is preprocessed inside each GroupKFold fold (same scores
+    as panel_cross_validate), and a configuration far below the best
+    after screening is abandoned without running the remaining folds.
+    """
+
+    rng = np.random.default_rng(0)
+    countries = pd.Series(np.repeat(["AUT", "BEL", "DEU", "FRA", "ITA"], 30))
+    X = pd.DataFrame(rng.normal(size=(150, 3)), columns=["x1", "x2", "x3"])
+    y = 2 * X["x1"] - X["x2"] + rng.normal(0, 0.1, 150)
+    X = X.mask(rng.random(X.shape) < 0.05)
+
+    search_space = {
+        "ols": (LinearRegression(), {}),
+        "ridge": (Ridge(), {"alpha": [0.1, 1.0]}),
+        "mean": (DummyRegressor(), {}),
+    }
+    leaderboard = run_model_search(
+        X, y.to_numpy(), search_space, cv=3, groups=countries, n_jobs=1
+    )
+
+    assert list(leaderboard["rank"]) == [1, 2, 3, 4]
+    assert list(leaderboard["status"]) == ["complete"] * 3 + ["abandoned"]
+    assert leaderboard["cv_mean"].iloc[:3].is_monotonic_decreasing
+
+    mean = leaderboard.set_index("model").loc["mean"]
+    assert mean["folds_evaluated"] == 1
+    assert (leaderboard.loc[leaderboard["status"] == "complete", "folds_evaluated"] == 3).all()
+
+    expected = panel_cross_validate(
+        LinearRegression(), X, y, group_kfold_splits(countries, n_splits=3), n_jobs=1
+    )
+    ols = leaderboard.set_index("model").loc["ols"]
+    assert np.isclose(ols["cv_mean"], expected.mean())
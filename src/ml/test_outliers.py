@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from src.ml.outliers import detect_outliers
+
+
+def test_outliers_need_panel_and_country_agreement():
+    """
+    A data-entry spike inside one country's series is dropped with its
+    reasons; a country that is consistently far from the rest is kept.
+    """
+
+    rng = np.random.default_rng(0)
+    groups = np.repeat(["AUT", "BEL", "LUX", "NLD", "POL"], 30)
+    X = pd.DataFrame({
+        "gdp_per_capita": rng.normal(40_000, 2_000, 150),
+        "fertility_rate": rng.normal(1.6, 0.1, 150),
+    })
+    X.loc[groups == "LUX", "gdp_per_capita"] += 80_000
+    X.loc[10, "fertility_rate"] = 9.0
+    y = pd.Series(rng.normal(80.0, 1.0, 150), name="life_expectancy")
+
+    report = detect_outliers(X, y, groups)
+
+    assert np.flatnonzero(~report.keep).tolist() == [10]
+    assert report.reasons.loc[10, "reasons"] == "iqr:fertility_rate; country_z:fertility_rate"
+    assert report.reasons.loc[10, "dropped"]
+    assert report.keep[groups == "LUX"].all()
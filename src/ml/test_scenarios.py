@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+from src.ml.scenarios import (
+    Scenario,
+    leave_one_country_out,
+    load_scenario_frame,
+    run_scenarios,
+    share_master,
+)
+
+
+def _panel():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "iso3": np.repeat(["AUT", "BEL", "DEU"], 4),
+        "year": np.tile(range(2000, 2004), 3),
+        "life_expectancy": rng.normal(20, 1, 12),
+        "gdp_per_capita": rng.normal(size=12),
+        "fertility_rate": rng.normal(size=12),
+    })
+    df.loc[3, "gdp_per_capita"] = np.nan
+    return df
+
+
+def _row_count(df, offset=0):
+    return {"n_train": len(df) + offset}
+
+
+def test_scenario_frames_and_resume(tmp_path):
+    """
+    Scenario frames equal plain pandas filtering of the master, and
+    a rerun with the same checkpoint only runs what is missing.
+    """
+
+    df = _panel()
+    shared = share_master(df, tmp_path / "shared")
+
+    frame = load_scenario_frame(
+        shared, Scenario("x", exclude=("BEL",), features=("gdp_per_capita",))
+    )
+    expected = df[df["iso3"] != "BEL"].drop(columns="fertility_rate")
+    pd.testing.assert_frame_equal(frame, expected.reset_index(drop=True), check_dtype=False)
+
+    scenarios = leave_one_country_out(df)
+    checkpoint = tmp_path / "loco.jsonl"
+
+    first = run_scenarios(df, scenarios[:2], _row_count, checkpoint, n_jobs=1)
+    assert list(first["n_train"]) == [8, 8]
+
+    # Already checkpointed scenarios keep their recorded result
+    resumed = run_scenarios(df, scenarios, _row_count, checkpoint, n_jobs=1)
+    assert list(resumed["scenario"]) == ["without_AUT", "without_BEL", "without_DEU"]
+    assert list(resumed["n_train"]) == [8, 8, 8]
+    assert list(resumed["seconds"][:2]) == list(first["seconds"])
+
+    # Other pipeline arguments or another dataset run everything again
+    changed = run_scenarios(df, scenarios, _row_count, checkpoint, n_jobs=1, offset=100)
+    assert list(changed["n_train"]) == [108, 108, 108]
+
+    other = df.assign(fertility_rate=df["fertility_rate"] + 1)
+    rerun = run_scenarios(other, scenarios, _row_count, checkpoint, n_jobs=1, offset=100)
+    assert not (rerun["seconds"] == changed["seconds"]).any()
@@ -0,0 +1,160 @@
+import asyncio
+import json
+
+import numpy as np
+import pandas as pd
+
+from src.ml.preprocessing import preprocess_training_data
+from src.ml.model import train_model
+from src.ml.artifact import (
+    save_pipeline_artifact,
+    load_pipeline_artifact,
+    load_sklearn_pipeline,
+)
+from src.ml.serving import MAX_BODY_BYTES, InferenceServer, MicroBatcher, ServerMetrics
+
+
+async def _request(reader, writer, method, path, payload=None, head=None):
+    body = b"" if payload is None else json.dumps(payload).encode()
+    if head is None:
+        head = f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n"
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+
+    status_line = await reader.readline()
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    response = await reader.readexactly(int(headers["content-length"]))
+    return int(status_line.split()[1]), headers, json.loads(response)
+
+
+def test_server_batches_concurrent_requests(tmp_path):
+    """
+    Concurrent POST /predict requests are scored in shared batches and
+    match the scikit-learn pipeline; connections are kept alive, and an
+    oversized or malformed request gets an error reply and is closed.
+    """
+
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(200, 3)), columns=["a", "b", "c"])
+    y = X.to_numpy() @ np.array([1.0, -2.0, 0.5]) + rng.normal(size=200)
+    X.iloc[::9, 2] = np.nan
+
+    X_processed, imputer, scaler = preprocess_training_data(X)
+    path = save_pipeline_artifact(
+        tmp_path / "model.npz", imputer, scaler, train_model(X_processed, y),
+        feature_names=list(X.columns), fingerprint="test",
+    )
+    _, imputer, scaler, model = load_sklearn_pipeline(path)
+    expected = model.predict(scaler.transform(imputer.transform(X)))
+
+    rows = X.to_numpy()
+    chunks = np.array_split(np.arange(len(rows)), 20)
+
+    async def scenario():
+        server = InferenceServer(
+            load_pipeline_artifact(path), port=0, batch_window_ms=50.0
+        )
+        await server.start()
+        try:
+            async def predict_payload(payload):
+                reader, writer = await asyncio.open_connection(server.host, server.port)
+                try:
+                    return await _request(reader, writer, "POST", "/predict", payload)
+                finally:
+                    writer.close()
+
+            def as_rows(values):
+                return [[None if np.isnan(v) else v for v in row] for row in values]
+
+            async def predict(idx):
+                return await predict_payload({"rows": as_rows(rows[idx])})
+
+            responses = await asyncio.gather(*(predict(idx) for idx in chunks))
+            for idx, (status, _, body) in zip(chunks, responses):
+                assert status == 200
+                assert np.allclose(body["predictions"], expected[idx])
+
+            # Keep-alive: several requests on one connection
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            instances = X.iloc[:2].astype(object).where(X.iloc[:2].notna(), None)
+            for _ in range(2):
+                status, headers, body = await _request(
+                    reader, writer, "POST", "/predict",
+                    {"instances": instances.to_dict("records")},
+                )
+                assert status == 200 and headers["connection"] == "keep-alive"
+                assert np.allclose(body["predictions"], expected[:2])
+            status, _, metrics = await _request(reader, writer, "GET", "/metrics")
+            writer.close()
+
+            assert metrics["requests"] == len(chunks) + 2
+            assert metrics["batches"] < len(chunks)
+
+            # Malformed rows (0-d, 3-D, ragged) sent next to a good
+            # request get a 400; the good one and later ones still work
+            good = {"rows": as_rows(rows[:3])}
+            bad = [{"rows": 5}, {"rows": [as_rows(rows[:3])]}, {"rows": [[1.0, 2.0, 3.0], [1.0]]}]
+            responses = await asyncio.gather(
+                *(predict_payload(payload) for payload in [good, *bad, good])
+            )
+            assert [status for status, _, _ in responses] == [200, 400, 400, 400, 200]
+            status, _, body = await predict_payload(good)
+            assert status == 200 and np.allclose(body["predictions"], expected[:3])
+
+            for head, code in [
+                (f"POST /predict HTTP/1.1\r\nContent-Length: {MAX_BODY_BYTES + 1}\r\n\r\n", 413),
+                ("garbage\r\n\r\n", 400),
+                ("POST /predict HTTP/1.1\r\nContent-Length: x\r\n\r\n", 400),
+            ]:
+                reader, writer = await asyncio.open_connection(server.host, server.port)
+                status, headers, _ = await _request(reader, writer, None, None, head=head)
+                assert status == code and headers["connection"] == "close"
+                assert await reader.read() == b""
+                writer.close()
+        finally:
+            await server.stop()
+
+    asyncio.run(scenario())
+
+
+class _FussyArtifact:
+    """
+    Scores the row sum, but fails on any row containing a negative value.
+    """
+    feature_names = ["a", "b"]
+
+    def predict(self, X):
+        if (X < 0).any():
+            raise ValueError("negative input")
+        return X.sum(axis=1)
+
+
+def test_failed_batch_only_fails_the_bad_request():
+    """
+    When scoring a coalesced batch fails, every request is rescored on
+    its own: valid requests get their predictions, only the failing one
+    gets the error, and the batcher keeps serving.
+    """
+
+    async def scenario():
+        batcher = MicroBatcher(_FussyArtifact(), ServerMetrics(), batch_window_ms=50.0)
+        batcher.start()
+        try:
+            results = await asyncio.gather(
+                batcher.predict(np.array([[1.0, 2.0]])),
+                batcher.predict(np.array([[-1.0, 2.0]])),
+                batcher.predict(np.array([[3.0, 4.0], [5.0, 6.0]])),
+                return_exceptions=True,
+            )
+            assert np.allclose(results[0], [3.0])
+            assert isinstance(results[1], ValueError)
+            assert np.allclose(results[2], [7.0, 11.0])
+
+            assert np.allclose(await batcher.predict(np.array([[1.0, 1.0]])), [2.0])
+        finally:
+            await batcher.stop()
+
+    asyncio.run(scenario())
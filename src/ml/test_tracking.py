@@ -0,0 +1,64 @@
+import numpy as np
+
+from src.ml.tracking import RunStore
+
+
+def test_run_store_roundtrip(tmp_path):
+    """
+    Logged runs stay buffered until flush_every is reached (every run
+    is written at once by default), queries see buffered runs, and
+    best_runs / compare_runs / get_run read back what was logged,
+    whatever the metric is called.
+    """
+
+    path = tmp_path / "runs.sqlite"
+    store = RunStore(path, flush_every=3)
+
+    def stored_runs():
+        return store._conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    run_ids = [
+        store.log_run(
+            {"test_r2": r2, "test rmse; DROP TABLE runs": 1.0 - r2},
+            dataset_fingerprint="abc",
+            features=["a", "b"],
+            model="LinearRegression",
+            coefficients={"a": r2, "b": -r2},
+            timings={"fit": 0.1},
+            name=f"run{i}",
+        )
+        for i, r2 in enumerate([0.5, 0.9])
+    ]
+    assert stored_runs() == 0
+
+    store.log_run({"test_r2": 0.7}, dataset_fingerprint="other")
+    assert stored_runs() == 3
+    assert store._buffer == []
+
+    late = store.log_run({"test_r2": 0.95}, dataset_fingerprint="abc")
+    assert stored_runs() == 3
+
+    best = store.best_runs("test_r2", n=2, dataset_fingerprint="abc")
+    assert stored_runs() == 4
+    assert list(best["run_id"]) == [late, run_ids[1]]
+    assert np.allclose(best["test_r2"], [0.95, 0.9])
+
+    lowest = store.best_runs("test rmse; DROP TABLE runs", n=1, higher_is_better=False)
+    assert list(lowest["run_id"]) == [run_ids[1]]
+    assert np.isclose(lowest["test rmse; DROP TABLE runs"].iloc[0], 0.1)
+
+    coefficients = store.compare_runs(run_ids, table="coefficients")
+    assert list(coefficients.columns) == run_ids
+    assert np.allclose(coefficients.loc["b"], [-0.5, -0.9])
+
+    store.close()
+
+    with RunStore(path) as reopened:
+        run = reopened.get_run(run_ids[0])
+        assert run["features"] == ["a", "b"]
+        assert run["timings"] == {"fit": 0.1}
+        assert len(reopened.list_runs(limit=10)) == 4
+
+        # Default store: each run is on disk as soon as it is logged
+        reopened.log_run({"test_r2": 0.1})
+        assert reopened._conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 5
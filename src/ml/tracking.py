@@ -0,0 +1,282 @@
+# src/ml/tracking.py
+
+import atexit
+import json
+import sqlite3
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+
+DEFAULT_TRACKING_PATH = Path("data/models/runs.sqlite")
+
+# Buffered runs are written in one transaction once this many are
+# queued; 1 commits every run as it is logged
+DEFAULT_FLUSH_EVERY = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    name TEXT,
+    dataset_fingerprint TEXT,
+    model TEXT,
+    features TEXT,
+    params TEXT
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (run_id, name)
+);
+CREATE TABLE IF NOT EXISTS coefficients (
+    run_id TEXT NOT NULL,
+    feature TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (run_id, feature)
+);
+CREATE TABLE IF NOT EXISTS timings (
+    run_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    seconds REAL,
+    PRIMARY KEY (run_id, stage)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_fingerprint ON runs (dataset_fingerprint);
+CREATE INDEX IF NOT EXISTS idx_runs_created ON runs (created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_model ON runs (model);
+CREATE INDEX IF NOT EXISTS idx_metrics_name_value ON metrics (name, value);
+"""
+
+
+class RunStore:
+    """
+    SQLite-backed store of ML pipeline runs.
+
+    log_run() appends to an in-memory buffer; buffered runs are
+    written with executemany in a single transaction when the buffer
+    is full, on flush() / close(), or at interpreter exit. Queries
+    flush first, so they always see every logged run.
+
+    By default every run is committed as it is logged. A larger
+    flush_every batches the writes (useful for sweeps logging many
+    runs per second), at the cost of losing up to flush_every - 1
+    runs if the process is killed or crashes hard before exit.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_TRACKING_PATH,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_every = flush_every
+
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        self._buffer: List[Dict[str, Any]] = []
+        atexit.register(self.close)
+
+    # -----------------------------
+    # Writing
+    # -----------------------------
+
+    def log_run(
+        self,
+        metrics: Dict[str, float],
+        dataset_fingerprint: Optional[str] = None,
+        features: Optional[Sequence[str]] = None,
+        model: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        coefficients: Optional[Dict[str, float]] = None,
+        timings: Optional[Dict[str, float]] = None,
+        name: Optional[str] = None,
+    ) -> str:
+        """
+        Queue one run for writing and return its run_id.
+        """
+        run_id = uuid.uuid4().hex[:12]
+
+        self._buffer.append({
+            "run_id": run_id,
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="microseconds"),
+            "name": name,
+            "dataset_fingerprint": dataset_fingerprint,
+            "model": model,
+            "features": json.dumps(list(features or [])),
+            "params": json.dumps(params or {}, default=str),
+            "metrics": dict(metrics),
+            "coefficients": dict(coefficients or {}),
+            "timings": dict(timings or {}),
+        })
+
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+        return run_id
+
+    def flush(self) -> None:
+        """
+        Write all buffered runs in one transaction.
+        """
+        if not self._buffer or self._conn is None:
+            return
+
+        runs, metrics, coefficients, timings = [], [], [], []
+        for run in self._buffer:
+            run_id = run["run_id"]
+            runs.append((
+                run_id, run["created_at"], run["name"],
+                run["dataset_fingerprint"], run["model"],
+                run["features"], run["params"],
+            ))
+            metrics += [(run_id, k, float(v)) for k, v in run["metrics"].items()]
+            coefficients += [(run_id, k, float(v)) for k, v in run["coefficients"].items()]
+            timings += [(run_id, k, float(v)) for k, v in run["timings"].items()]
+
+        with self._conn:
+            self._conn.executemany("INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)", runs)
+            self._conn.executemany("INSERT INTO metrics VALUES (?, ?, ?)", metrics)
+            self._conn.executemany("INSERT INTO coefficients VALUES (?, ?, ?)", coefficients)
+            self._conn.executemany("INSERT INTO timings VALUES (?, ?, ?)", timings)
+
+        self._buffer.clear()
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+        self.flush()
+        self._conn.close()
+        self._conn = None
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> "RunStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -----------------------------
+    # Querying
+    # -----------------------------
+
+    def _query(self, sql: str, params: Sequence[Any] = ()) -> pd.DataFrame:
+        self.flush()
+        return pd.read_sql_query(sql, self._conn, params=list(params))
+
+    def list_runs(
+        self,
+        dataset_fingerprint: Optional[str] = None,
+        model: Optional[str] = None,
+        since: Optional[str] = None,
+        limit: int = 50,
+    ) -> pd.DataFrame:
+        """
+        Most recent runs, optionally filtered by fingerprint, model
+        and ISO creation time (all filters use indexes).
+        """
+        clauses, params = [], []
+        if dataset_fingerprint is not None:
+            clauses.append("dataset_fingerprint = ?")
+            params.append(dataset_fingerprint)
+        if model is not None:
+            clauses.append("model = ?")
+            params.append(model)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._query(
+            f"SELECT run_id, created_at, name, dataset_fingerprint, model "
+            f"FROM runs {where} ORDER BY created_at DESC LIMIT ?",
+            params + [limit],
+        )
+
+    def best_runs(
+        self,
+        metric: str = "test_r2",
+        n: int = 10,
+        higher_is_better: bool = True,
+        dataset_fingerprint: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Top runs by one metric (uses the (name, value) index).
+        """
+        order = "DESC" if higher_is_better else "ASC"
+        clause, params = "", [metric]
+        if dataset_fingerprint is not None:
+            clause = "AND r.dataset_fingerprint = ?"
+            params.append(dataset_fingerprint)
+
+        # The metric name is only ever a bound parameter; the value
+        # column is renamed after the query
+        best = self._query(
+            f"SELECT r.run_id, r.created_at, r.name, r.dataset_fingerprint, "
+            f"r.model, m.value AS value "
+            f"FROM metrics m JOIN runs r ON r.run_id = m.run_id "
+            f"WHERE m.name = ? {clause} "
+            f"ORDER BY m.value {order} LIMIT ?",
+            params + [n],
+        )
+        return best.rename(columns={"value": metric})
+
+    def get_run(self, run_id: str) -> Dict[str, Any]:
+        """
+        Everything recorded for one run.
+        """
+        runs = self._query("SELECT * FROM runs WHERE run_id = ?", [run_id])
+        if runs.empty:
+            raise KeyError(f"Unknown run_id: '{run_id}'")
+
+        run = runs.iloc[0].to_dict()
+        run["features"] = json.loads(run["features"])
+        run["params"] = json.loads(run["params"])
+
+        for table, key in [("metrics", "name"), ("coefficients", "feature"), ("timings", "stage")]:
+            rows = self._query(f"SELECT * FROM {table} WHERE run_id = ?", [run_id])
+            value_col = "seconds" if table == "timings" else "value"
+            run[table] = dict(zip(rows[key], rows[value_col]))
+
+        return run
+
+    def compare_runs(self, run_ids: Sequence[str], table: str = "metrics") -> pd.DataFrame:
+        """
+        Side-by-side view of metrics, coefficients or timings:
+        one row per name, one column per run.
+        """
+        key, value = {
+            "metrics": ("name", "value"),
+            "coefficients": ("feature", "value"),
+            "timings": ("stage", "seconds"),
+        }[table]
+
+        placeholders = ", ".join("?" for _ in run_ids)
+        rows = self._query(
+            f"SELECT run_id, {key}, {value} FROM {table} "
+            f"WHERE run_id IN ({placeholders})",
+            list(run_ids),
+        )
+        wide = rows.pivot(index=key, columns="run_id", values=value)
+        return wide[[run_id for run_id in run_ids if run_id in wide.columns]]
+
+
+_DEFAULT_STORE: Optional[RunStore] = None
+
+
+def get_default_store() -> RunStore:
+    """
+    Process-wide store at DEFAULT_TRACKING_PATH, so consecutive runs
+    in one process share the write buffer.
+    """
+    global _DEFAULT_STORE
+    if _DEFAULT_STORE is None or _DEFAULT_STORE._conn is None:
+        _DEFAULT_STORE = RunStore(DEFAULT_TRACKING_PATH)
+    return _DEFAULT_STORE
@@ -0,0 +1,348 @@
+"""
+Dense Panel Cube
+----------------
+
+Country × year × indicator representation of the master dataset:
+
+• values  : float64 array (country, year, indicator), NaN = missing
+• present : bool array (country, year), True where the source frame
+            had a row (so to_frame() round-trips exactly)
+• countries / years / indicators : __slots__ index objects mapping
+  labels to integer positions
+
+Cell lookups are O(1) (dict / arithmetic position plus array
+indexing), and slicing along any axis is plain NumPy indexing: views
+for single labels and contiguous year ranges, copies for label lists.
+
+Consumers that need structure (feature engineering, imputation,
+per-country plots) build the cube once instead of grouping or
+filtering the long frame by iso3 strings; panel_cube() caches it by
+dataset fingerprint.
+"""
+
+# =============================
+# Imports
+# =============================
+
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.data_loader import BoundedCache, dataset_fingerprint
+
+
+KEY_COLUMNS = ["iso3", "year"]
+
+# Cubes keyed by (fingerprint, indicators), most recent CACHE_SIZE kept
+CACHE_SIZE = 8
+_CACHE: Dict[Tuple, "PanelCube"] = BoundedCache(CACHE_SIZE)
+
+
+# =============================
+# Index Objects
+# =============================
+
+class LabelIndex:
+    """
+    Ordered labels (iso3 codes, indicator names) with O(1) lookup.
+    """
+
+    __slots__ = ("labels", "_positions", "_index")
+
+    def __init__(self, labels: Iterable[str]):
+        self.labels = tuple(labels)
+        self._positions = {label: i for i, label in enumerate(self.labels)}
+        if len(self._positions) != len(self.labels):
+            raise ValueError("Index labels must be unique")
+        self._index = pd.Index(self.labels, dtype=object)
+
+    def position(self, label: str) -> int:
+        try:
+            return self._positions[label]
+        except KeyError:
+            raise KeyError(f"'{label}' not in index") from None
+
+    def positions(self, labels: Iterable[str]) -> np.ndarray:
+        """
+        Positions of many labels (-1 for unknown ones).
+        """
+        return self._index.get_indexer(pd.Index(labels, dtype=object))
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.labels)
+
+    def __contains__(self, label) -> bool:
+        return label in self._positions
+
+    def __repr__(self) -> str:
+        return f"LabelIndex({len(self)} labels)"
+
+
+class YearIndex:
+    """
+    Consecutive calendar years; positions are offsets from the first.
+    """
+
+    __slots__ = ("start", "stop")
+
+    def __init__(self, start: int, stop: int):
+        self.start = int(start)
+        self.stop = int(stop)  # exclusive
+
+    @property
+    def labels(self) -> np.ndarray:
+        return np.arange(self.start, self.stop)
+
+    def position(self, year: int) -> int:
+        offset = int(year) - self.start
+        if not 0 <= offset < len(self):
+            raise KeyError(f"Year {year} outside {self.start}-{self.stop - 1}")
+        return offset
+
+    def positions(self, years) -> np.ndarray:
+        """
+        Offsets of many years (-1 outside the range).
+        """
+        offsets = np.asarray(years, dtype=np.int64) - self.start
+        return np.where((offsets >= 0) & (offsets < len(self)), offsets, -1)
+
+    def slice(self, first: Optional[int] = None, last: Optional[int] = None) -> slice:
+        """
+        Positions of the inclusive year range [first, last], clipped.
+        """
+        lo = 0 if first is None else min(max(int(first) - self.start, 0), len(self))
+        hi = len(self) if last is None else min(max(int(last) - self.start + 1, 0), len(self))
+        return slice(lo, max(lo, hi))
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self.start, self.stop))
+
+    def __contains__(self, year) -> bool:
+        return self.start <= year < self.stop
+
+    def __repr__(self) -> str:
+        return f"YearIndex({self.start}-{self.stop - 1})"
+
+
+# =============================
+# Panel Cube
+# =============================
+
+YearSelection = Union[int, Tuple[Optional[int], Optional[int]], Sequence[int], None]
+
+
+class PanelCube:
+    """
+    Dense (country, year, indicator) panel; see the module docstring.
+    """
+
+    __slots__ = ("values", "present", "countries", "years", "indicators")
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        present: np.ndarray,
+        countries: LabelIndex,
+        years: YearIndex,
+        indicators: LabelIndex,
+    ):
+        expected = (len(countries), len(years), len(indicators))
+        if values.shape != expected or present.shape != expected[:2]:
+            raise ValueError(
+                f"Cube shape {values.shape} / {present.shape} does not match "
+                f"index sizes {expected}"
+            )
+        self.values = values
+        self.present = present
+        self.countries = countries
+        self.years = years
+        self.indicators = indicators
+
+    # -------- Conversion --------
+
+    @classmethod
+    def from_frame(
+        cls, df: pd.DataFrame, indicators: Optional[Sequence[str]] = None
+    ) -> "PanelCube":
+        """
+        Scatter a long (iso3, year, indicators...) frame into a cube.
+
+        Args:
+            df: One row per (iso3, year).
+            indicators: Numeric columns to include (default: all
+                        numeric columns except year).
+
+        Raises:
+            KeyError: If an indicator or key column is missing.
+            ValueError: On duplicate (iso3, year) rows.
+        """
+        if indicators is None:
+            indicators = [
+                col for col in df.select_dtypes(include=[np.number]).columns
+                if col not in KEY_COLUMNS
+            ]
+        missing = [col for col in KEY_COLUMNS + list(indicators) if col not in df.columns]
+        if missing:
+            raise KeyError(f"Columns not in data: {missing}")
+
+        codes, countries = pd.factorize(df["iso3"], sort=True)
+        if (codes < 0).any():
+            raise ValueError("iso3 must not be missing")
+
+        years = df["year"].to_numpy(dtype=np.int64)
+        first = int(years.min()) if len(years) else 0
+        n_years = int(years.max()) - first + 1 if len(years) else 0
+        offsets = years - first
+
+        present = np.zeros((len(countries), n_years), dtype=bool)
+        present[codes, offsets] = True
+        if present.sum() != len(df):
+            raise ValueError("PanelCube needs one row per (iso3, year).")
+
+        values = np.full((len(countries), n_years, len(indicators)), np.nan)
+        values[codes, offsets] = df[list(indicators)].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+
+        return cls(
+            values, present, LabelIndex(countries),
+            YearIndex(first, first + n_years), LabelIndex(indicators),
+        )
+
+    def to_frame(self, include_absent: bool = False) -> pd.DataFrame:
+        """
+        Long frame sorted by (iso3, year): the rows of the source frame,
+        or every (country, year) cell if include_absent.
+        """
+        rows = np.ones_like(self.present) if include_absent else self.present
+        country_idx, year_idx = np.nonzero(rows)
+
+        df = pd.DataFrame(
+            self.values[country_idx, year_idx], columns=list(self.indicators)
+        )
+        df.insert(0, "iso3", np.asarray(self.countries.labels, dtype=object)[country_idx])
+        df.insert(1, "year", year_idx + self.years.start)
+        return df
+
+    # -------- Lookup and Slicing --------
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        return self.values.shape
+
+    @property
+    def mask(self) -> np.ndarray:
+        """
+        True where a value is observed.
+        """
+        return ~np.isnan(self.values)
+
+    def get(self, iso3: str, year: int, indicator: str) -> float:
+        return float(self.values[
+            self.countries.position(iso3),
+            self.years.position(year),
+            self.indicators.position(indicator),
+        ])
+
+    def locate(self, iso3: Sequence[str], years: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (country, year) positions of many rows (-1 when not in the cube).
+        """
+        return self.countries.positions(iso3), self.years.positions(years)
+
+    def series(self, iso3: str, indicator: str) -> np.ndarray:
+        """
+        One country's indicator over all years (a view).
+        """
+        return self.values[self.countries.position(iso3), :, self.indicators.position(indicator)]
+
+    def country(self, iso3: str) -> np.ndarray:
+        """
+        (year, indicator) view of one country.
+        """
+        return self.values[self.countries.position(iso3)]
+
+    def indicator(self, name: str) -> np.ndarray:
+        """
+        (country, year) view of one indicator.
+        """
+        return self.values[:, :, self.indicators.position(name)]
+
+    def year(self, year: int) -> np.ndarray:
+        """
+        (country, indicator) view of one year.
+        """
+        return self.values[:, self.years.position(year)]
+
+    def sel(
+        self,
+        countries: Optional[Sequence[str]] = None,
+        years: YearSelection = None,
+        indicators: Optional[Sequence[str]] = None,
+    ) -> "PanelCube":
+        """
+        Sub-cube by country list, year (or inclusive (first, last)
+        range) and indicator list. A year range alone gives a view.
+        """
+        c_idx = slice(None)
+        country_index = self.countries
+        if countries is not None:
+            c_idx = np.array([self.countries.position(c) for c in countries], dtype=np.intp)
+            country_index = LabelIndex(countries)
+
+        if years is None:
+            y_idx = slice(None)
+        elif isinstance(years, tuple):
+            y_idx = self.years.slice(*years)
+        else:
+            year_list = [years] if np.isscalar(years) else list(years)
+            offsets = [self.years.position(y) for y in year_list]
+            if offsets != list(range(offsets[0], offsets[0] + len(offsets))):
+                raise ValueError("Years must be consecutive; select ranges as (first, last)")
+            y_idx = slice(offsets[0], offsets[0] + len(offsets))
+        start = self.years.start + (y_idx.start or 0)
+        stop = self.years.start + (len(self.years) if y_idx.stop is None else y_idx.stop)
+
+        i_idx = slice(None)
+        indicator_index = self.indicators
+        if indicators is not None:
+            i_idx = np.array([self.indicators.position(i) for i in indicators], dtype=np.intp)
+            indicator_index = LabelIndex(indicators)
+
+        # Index one axis at a time so basic slices stay views
+        values = self.values[c_idx][:, y_idx][:, :, i_idx]
+        present = self.present[c_idx][:, y_idx]
+
+        return PanelCube(values, present, country_index, YearIndex(start, stop), indicator_index)
+
+    def __repr__(self) -> str:
+        return (
+            f"PanelCube({len(self.countries)} countries x {self.years!r} x "
+            f"{len(self.indicators)} indicators, "
+            f"{int(self.mask.sum())} observed values)"
+        )
+
+
+def panel_cube(df: pd.DataFrame, indicators: Optional[Sequence[str]] = None) -> PanelCube:
+    """
+    PanelCube.from_frame, reused from the cache for the same data.
+    Cached arrays are read-only since every caller shares them.
+    """
+    key = (dataset_fingerprint(df), None if indicators is None else tuple(indicators))
+    if key not in _CACHE:
+        cube = PanelCube.from_frame(df, indicators)
+        cube.values.flags.writeable = False
+        cube.present.flags.writeable = False
+        _CACHE[key] = cube
+    return _CACHE[key]
+
+
+def clear_cache() -> None:
+    _CACHE.clear()
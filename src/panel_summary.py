@@ -0,0 +1,223 @@
+"""
+Panel Summary Module
+--------------------
+
+This module is responsible for:
+
+• Per-country, per-indicator summaries of the master dataset
+  (first/last year, observations, missing years, trend slope,
+  CAGR and volatility)
+• Computing them for every country and indicator at once with
+  grouped array operations instead of loops over iso3
+• Caching results by dataset fingerprint
+
+Output is a tidy table with one row per (iso3, indicator), ready to be
+filtered by country or region for dashboards.
+"""
+
+# =============================
+# Imports
+# =============================
+
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.data_loader import EU_REGIONS, BoundedCache, dataset_fingerprint
+
+
+# Columns that identify a row rather than measure something
+KEY_COLUMNS = ["iso3", "year"]
+
+# Column order of the summary table
+SUMMARY_COLUMNS = [
+    "iso3", "region", "indicator",
+    "first_year", "last_year", "n_obs", "missing_years",
+    "first_value", "last_value", "mean",
+    "trend_slope", "cagr", "volatility",
+]
+
+# In-memory cache keyed by fingerprint of the summarised columns
+# (most recent CACHE_SIZE summaries)
+CACHE_SIZE = 16
+_CACHE: Dict[str, pd.DataFrame] = BoundedCache(CACHE_SIZE)
+
+
+def clear_cache() -> None:
+    """
+    Drop all cached panel summaries.
+    """
+    _CACHE.clear()
+
+
+# =============================
+# Core Computation
+# =============================
+
+def _to_long(df: pd.DataFrame, indicators: Sequence[str]) -> pd.DataFrame:
+    """
+    Stack indicator columns into (iso3, indicator, year, value) rows,
+    dropping missing values and sorting by group then year.
+    """
+    long = df.melt(
+        id_vars=KEY_COLUMNS,
+        value_vars=list(indicators),
+        var_name="indicator",
+        value_name="value",
+    ).dropna(subset=["value"])
+
+    return long.sort_values(
+        ["iso3", "indicator", "year"], kind="stable"
+    ).reset_index(drop=True)
+
+
+def compute_panel_summary(
+    df: pd.DataFrame, indicators: Sequence[str]
+) -> pd.DataFrame:
+    """
+    Summarise every (iso3, indicator) series in grouped vectorised passes.
+
+    Metrics:
+    - first_year / last_year: first and last year with a value
+    - n_obs: number of observed years
+    - missing_years: years without a value between first and last year
+    - trend_slope: OLS slope of value on year (units per year)
+    - cagr: compound annual growth rate between first and last value
+      (NaN unless both are positive)
+    - volatility: standard deviation of year-over-year growth rates,
+      using consecutive years only
+    """
+    long = _to_long(df, indicators)
+
+    group_keys = [long["iso3"], long["indicator"]]
+    year = long["year"].to_numpy(dtype=np.float64)
+    value = long["value"].to_numpy(dtype=np.float64)
+
+    # Centre years per group before forming the slope sums
+    grouped_year = long.groupby(group_keys, sort=False)["year"]
+    t = year - grouped_year.transform("mean").to_numpy()
+
+    # Year-over-year growth where the previous row is the previous year
+    # of the same series (first row of a group has no predecessor)
+    same_group = np.r_[
+        False,
+        (long["iso3"].to_numpy()[1:] == long["iso3"].to_numpy()[:-1])
+        & (long["indicator"].to_numpy()[1:] == long["indicator"].to_numpy()[:-1]),
+    ]
+    consecutive = same_group & (np.r_[np.nan, np.diff(year)] == 1)
+    prev_value = np.r_[np.nan, value[:-1]]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth = np.where(consecutive, value / prev_value - 1.0, np.nan)
+
+    work = pd.DataFrame({
+        "iso3": long["iso3"],
+        "indicator": long["indicator"],
+        "year": long["year"],
+        "value": value,
+        "tt": t * t,
+        "tv": t * value,
+        "growth": growth,
+    })
+
+    summary = work.groupby(["iso3", "indicator"], sort=True).agg(
+        first_year=("year", "first"),
+        last_year=("year", "last"),
+        n_obs=("value", "size"),
+        first_value=("value", "first"),
+        last_value=("value", "last"),
+        mean=("value", "mean"),
+        sum_tt=("tt", "sum"),
+        sum_tv=("tv", "sum"),
+        volatility=("growth", "std"),
+    ).reset_index()
+
+    span = summary["last_year"] - summary["first_year"]
+    summary["missing_years"] = span + 1 - summary["n_obs"]
+
+    # With centred years, slope = sum(t * v) / sum(t^2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = summary["sum_tv"].to_numpy() / summary["sum_tt"].to_numpy()
+    summary["trend_slope"] = np.where(summary["sum_tt"] > 0, slope, np.nan)
+
+    first = summary["first_value"].to_numpy()
+    last = summary["last_value"].to_numpy()
+    valid = (first > 0) & (last > 0) & (span.to_numpy() > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cagr = (last / first) ** (1.0 / span.to_numpy()) - 1.0
+    summary["cagr"] = np.where(valid, cagr, np.nan)
+
+    summary["region"] = summary["iso3"].map(EU_REGIONS)
+
+    return summary[SUMMARY_COLUMNS]
+
+
+# =============================
+# Public API
+# =============================
+
+def panel_summary(
+    df: pd.DataFrame,
+    indicators: Optional[Sequence[str]] = None,
+    cache_dir: Optional[Path] = None,
+) -> pd.DataFrame:
+    """
+    Per-country panel summary of the master dataset, cached by fingerprint.
+
+    Args:
+        df: Master dataset with iso3, year and indicator columns.
+        indicators: Columns to summarise (default: all numeric indicators).
+        cache_dir: Optional folder for an on-disk CSV cache shared
+                   across processes.
+
+    Returns:
+        Tidy DataFrame with one row per (iso3, indicator); a copy, so
+        callers may modify it without touching the cache.
+    """
+    if indicators is None:
+        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        indicators = [col for col in numeric_cols if col not in KEY_COLUMNS]
+    indicators = list(indicators)
+
+    # Fingerprint only the columns that feed the summary
+    fingerprint = dataset_fingerprint(df[KEY_COLUMNS + indicators])
+
+    if fingerprint in _CACHE:
+        return _CACHE[fingerprint].copy()
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = Path(cache_dir) / f"panel_summary_{fingerprint}.csv"
+
+    if cache_path is not None and cache_path.exists():
+        summary = pd.read_csv(cache_path)
+    else:
+        summary = compute_panel_summary(df, indicators)
+
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            summary.to_csv(cache_path, index=False)
+
+    _CACHE[fingerprint] = summary
+    return summary.copy()
+
+
+def country_dashboard(summary: pd.DataFrame, iso3: str) -> pd.DataFrame:
+    """
+    Indicator-by-metric view of one country from a panel summary.
+    """
+    rows = summary[summary["iso3"] == iso3]
+    return rows.drop(columns=["iso3", "region"]).set_index("indicator")
+
+
+def region_dashboards(summary: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Split a panel summary into one table per region.
+    """
+    return {
+        region: rows.reset_index(drop=True)
+        for region, rows in summary.groupby("region", sort=True)
+    }
+
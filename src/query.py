@@ -0,0 +1,214 @@
+"""
+Indexed Queries over the Master Dataset
+---------------------------------------
+
+Lookups by country set, year range and column projection without
+scanning the whole table:
+
+• Rows are kept sorted by (iso3, year), so each country is one
+  contiguous block whose bounds are found in O(1), and a year range
+  inside it with a binary search (searchsorted): O(log n + k) per
+  query instead of a boolean mask over every row.
+• A single-country (or unfiltered) query is a positional slice of
+  the sorted frame, which pandas returns without copying the data;
+  several countries are gathered with one take().
+• from_file() pushes the column projection down to the reader:
+  usecols for CSV, columns= for Parquet / Feather (pyarrow).
+
+    index = load_master_index()
+    index.query(["AUT", "BEL"], years=(2010, 2019), columns=["gdp_per_capita"])
+    index.row("DEU", 2015)["life_expectancy"]
+"""
+
+# =============================
+# Imports
+# =============================
+
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.data_loader import BoundedCache
+
+
+DEFAULT_MASTER_PATH = Path("data/processed/master_dataset.csv")
+
+KEY_COLUMNS = ["iso3", "year"]
+
+Countries = Union[str, Sequence[str], None]
+Years = Union[int, Tuple[Optional[int], Optional[int]], None]
+
+# Indexes loaded from disk, keyed by (path, mtime, columns); a
+# rewritten file gets a new key, so only the CACHE_SIZE most recent
+# are kept
+CACHE_SIZE = 4
+_CACHE: Dict[Tuple, "MasterIndex"] = BoundedCache(CACHE_SIZE)
+
+
+# =============================
+# Index
+# =============================
+
+class MasterIndex:
+    """
+    Sorted (iso3, year) index over a master-dataset-like frame.
+
+    Args:
+        df: Frame with iso3 and year columns (one or more rows per
+            country-year; queries return all of them).
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        missing = [col for col in KEY_COLUMNS if col not in df.columns]
+        if missing:
+            raise KeyError(f"Key columns not in data: {missing}")
+
+        keys = df[KEY_COLUMNS]
+        is_sorted = (
+            keys["iso3"].is_monotonic_increasing
+            and not (
+                (keys["iso3"].to_numpy()[1:] == keys["iso3"].to_numpy()[:-1])
+                & (np.diff(keys["year"].to_numpy()) < 0)
+            ).any()
+        )
+        if not is_sorted:
+            df = df.sort_values(KEY_COLUMNS, kind="stable")
+        self.frame = df.reset_index(drop=True)
+
+        codes, countries = pd.factorize(self.frame["iso3"], sort=True)
+        self.countries = pd.Index(countries)
+        # Row bounds of country i: [bounds[i], bounds[i + 1])
+        self._bounds = np.searchsorted(codes, np.arange(len(countries) + 1))
+        self._years = self.frame["year"].to_numpy(dtype=np.int64)
+
+    @classmethod
+    def from_file(
+        cls, path: Path, columns: Optional[Sequence[str]] = None
+    ) -> "MasterIndex":
+        """
+        Read only the key columns plus `columns` (all if None).
+        """
+        path = Path(path)
+        usecols = None if columns is None else list(dict.fromkeys(KEY_COLUMNS + list(columns)))
+        suffix = path.suffix.lower()
+
+        if suffix == ".csv":
+            df = pd.read_csv(path, usecols=usecols)
+        elif suffix == ".parquet":
+            df = pd.read_parquet(path, columns=usecols)
+        elif suffix == ".feather":
+            df = pd.read_feather(path, columns=usecols)
+        else:
+            raise ValueError(f"Unsupported file type: {suffix}")
+
+        return cls(df)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    # -------- Positions --------
+
+    def country_bounds(self, iso3: str) -> Tuple[int, int]:
+        """
+        [start, stop) rows of one country (empty if unknown).
+        """
+        try:
+            i = self.countries.get_loc(iso3)
+        except KeyError:
+            return 0, 0
+        return int(self._bounds[i]), int(self._bounds[i + 1])
+
+    def _year_bounds(self, start: int, stop: int, years: Years) -> Tuple[int, int]:
+        if years is None:
+            return start, stop
+        first, last = (years, years) if np.isscalar(years) else years
+        block = self._years[start:stop]
+        lo = 0 if first is None else np.searchsorted(block, first, side="left")
+        hi = len(block) if last is None else np.searchsorted(block, last, side="right")
+        return start + int(lo), start + int(hi)
+
+    def ranges(self, countries: Countries = None, years: Years = None) -> List[Tuple[int, int]]:
+        """
+        Non-empty [start, stop) row ranges matching the filters, in
+        (iso3, year) order.
+        """
+        if countries is None:
+            blocks = zip(self._bounds[:-1], self._bounds[1:])
+        else:
+            if isinstance(countries, str):
+                countries = [countries]
+            blocks = sorted(self.country_bounds(c) for c in dict.fromkeys(countries))
+
+        ranges = [self._year_bounds(int(a), int(b), years) for a, b in blocks]
+        return [(a, b) for a, b in ranges if b > a]
+
+    # -------- Queries --------
+
+    def query(
+        self,
+        countries: Countries = None,
+        years: Years = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Rows of the given countries and inclusive year range (int or
+        (first, last), None = open), projected onto columns (key
+        columns are always included).
+        """
+        frame = self.frame
+        if columns is not None:
+            frame = frame[list(dict.fromkeys(KEY_COLUMNS + list(columns)))]
+
+        if countries is None and years is None:
+            return frame
+
+        ranges = self.ranges(countries, years)
+        if len(ranges) == 1:
+            start, stop = ranges[0]
+            return frame.iloc[start:stop]
+        if not ranges:
+            return frame.iloc[0:0]
+
+        positions = np.concatenate([np.arange(a, b) for a, b in ranges])
+        return frame.take(positions)
+
+    def row(self, iso3: str, year: int) -> pd.Series:
+        """
+        The (first) row of one country-year.
+
+        Raises:
+            KeyError: If the country-year is not in the data.
+        """
+        ranges = self.ranges(iso3, year)
+        if not ranges:
+            raise KeyError(f"No row for ({iso3}, {year})")
+        return self.frame.iloc[ranges[0][0]]
+
+    def country_blocks(self, columns: Optional[Sequence[str]] = None):
+        """
+        Yield (iso3, rows) for every country, rows being a slice of
+        the sorted frame.
+        """
+        frame = self.frame if columns is None else self.frame[list(columns)]
+        for i, iso3 in enumerate(self.countries):
+            yield iso3, frame.iloc[self._bounds[i]:self._bounds[i + 1]]
+
+
+def load_master_index(
+    path: Path = DEFAULT_MASTER_PATH, columns: Optional[Sequence[str]] = None
+) -> MasterIndex:
+    """
+    MasterIndex.from_file, reused while the file is unchanged.
+    """
+    path = Path(path)
+    key = (str(path.resolve()), path.stat().st_mtime_ns,
+           None if columns is None else tuple(columns))
+    if key not in _CACHE:
+        _CACHE[key] = MasterIndex.from_file(path, columns)
+    return _CACHE[key]
+
+
+def clear_cache() -> None:
+    _CACHE.clear()
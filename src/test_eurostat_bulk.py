@@ -0,0 +1,160 @@
+import gzip
+import itertools
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+import requests
+
+from src import eurostat_data_fetcher
+from src.eurostat_data_fetcher import (
+    fetch_eurostat_bulk,
+    read_eurostat_sdmx_csv,
+    read_eurostat_tsv,
+    sdmx_to_dataframe,
+)
+from src.fetch_scheduler import FetchScheduler, HostConfig, set_scheduler
+
+
+DIMENSIONS = {
+    "freq": ["A"],
+    "unit": ["YR"],
+    "sex": ["F", "M", "T"],
+    "age": ["Y65", "Y_LT1"],
+    "geo": ["AT", "BE", "DE"],
+}
+YEARS = ["2019", "2020", "2021"]
+
+
+def _observations():
+    """
+    Every (dimension codes..., year) cell with a value, a flag and
+    some missing cells.
+    """
+    rng = np.random.default_rng(0)
+    cells = []
+    for key in itertools.product(*DIMENSIONS.values()):
+        for year in YEARS:
+            value = None if rng.random() < 0.2 else round(float(rng.uniform(15, 85)), 1)
+            flag = "p" if rng.random() < 0.3 else ""
+            cells.append((key, year, value, flag))
+    return cells
+
+
+def _write_fixtures(tmp_path):
+    cells = _observations()
+    dims = list(DIMENSIONS)
+
+    sdmx_csv = tmp_path / "demo_r_mlifexp.sdmx.csv.gz"
+    with gzip.open(sdmx_csv, "wt") as f:
+        f.write("DATAFLOW,LAST UPDATE," + ",".join(dims) + ",TIME_PERIOD,OBS_VALUE,OBS_FLAG\n")
+        for key, year, value, flag in cells:
+            obs = "" if value is None else value
+            f.write(f"ESTAT:DEMO_R_MLIFEXP(1.0),01/01/24 23:00:00,{','.join(key)},{year},{obs},{flag}\n")
+
+    tsv = tmp_path / "demo_r_mlifexp.tsv.gz"
+    with gzip.open(tsv, "wt") as f:
+        f.write(",".join(dims) + "\\TIME_PERIOD\t" + "\t".join(f"{y} " for y in YEARS) + "\n")
+        for key, group in itertools.groupby(cells, key=lambda c: c[0]):
+            values = [
+                ": " if value is None else f"{value} {flag}"
+                for _, _, value, flag in group
+            ]
+            f.write(",".join(key) + "\t" + "\t".join(values) + "\n")
+
+    # Equivalent SDMX-JSON (flattened index over dimensions + time)
+    sizes = [len(codes) for codes in DIMENSIONS.values()] + [len(YEARS)]
+    json_values = {}
+    for key, year, value, _ in cells:
+        positions = [DIMENSIONS[d].index(c) for d, c in zip(dims, key)] + [YEARS.index(year)]
+        if value is not None:
+            json_values[str(int(np.ravel_multi_index(positions, sizes)))] = value
+    payload = {
+        "dimension": {
+            dim: {"category": {"index": {code: i for i, code in enumerate(codes)}}}
+            for dim, codes in {**DIMENSIONS, "time": YEARS}.items()
+        },
+        "value": json_values,
+    }
+    return sdmx_csv, tsv, payload
+
+
+def test_bulk_readers_match_json_parser(tmp_path):
+    """
+    Filtered SDMX-CSV and TSV bulk files give the same tidy table as
+    the SDMX-JSON parser on the same data.
+    """
+
+    sdmx_csv, tsv, payload = _write_fixtures(tmp_path)
+
+    # Whole table, with the dimensions that vary kept as columns
+    keep = ["sex", "age"]
+    expected = sdmx_to_dataframe(payload, keep)
+    pd.testing.assert_frame_equal(read_eurostat_sdmx_csv(sdmx_csv, {}, keep), expected)
+    pd.testing.assert_frame_equal(read_eurostat_tsv(tsv, {}, keep), expected)
+
+    # Filters applied while reading (as passed to the JSON API)
+    filters = {"sex": "T", "age": ["Y65"], "time": "2020+2021"}
+    selected = expected[
+        (expected["sex"] == "T") & (expected["age"] == "Y65") & (expected["year"] >= 2020)
+    ]
+    expected = selected[["country", "year", "value"]].reset_index(drop=True)
+    pd.testing.assert_frame_equal(
+        read_eurostat_sdmx_csv(sdmx_csv, filters, chunksize=7), expected
+    )
+    pd.testing.assert_frame_equal(read_eurostat_tsv(tsv, filters), expected)
+
+    # Uncompressed input works too
+    plain = tmp_path / "plain.tsv"
+    plain.write_bytes(gzip.decompress(tsv.read_bytes()))
+    pd.testing.assert_frame_equal(read_eurostat_tsv(plain, filters), expected)
+
+
+def test_bulk_download_is_streamed(tmp_path, monkeypatch):
+    """
+    fetch_eurostat_bulk parses the response body as a stream (the
+    whole body is never loaded); the scheduler counts its bytes from
+    Content-Length.
+    """
+
+    sdmx_csv, _, _ = _write_fixtures(tmp_path)
+    body = sdmx_csv.read_bytes()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(
+        eurostat_data_fetcher, "EUROSTAT_BULK_URL",
+        f"http://127.0.0.1:{server.server_address[1]}/bulk",
+    )
+    monkeypatch.chdir(tmp_path)
+
+    def no_content(response):
+        raise AssertionError("streamed body loaded into memory")
+    monkeypatch.setattr(requests.Response, "content", property(no_content))
+
+    scheduler = FetchScheduler(n_workers=1, default_config=HostConfig(rate=100.0, burst=100.0))
+    set_scheduler(scheduler)
+    try:
+        filters = {"sex": "T", "age": "Y65"}
+        df = fetch_eurostat_bulk("demo_r_mlifexp", filters, "life_bulk")
+
+        pd.testing.assert_frame_equal(df, read_eurostat_sdmx_csv(sdmx_csv, filters))
+        assert (tmp_path / "data" / "raw" / "life_bulk.csv").exists()
+        assert scheduler.stats()["bytes"].iloc[0] == len(body)
+    finally:
+        set_scheduler(None)
+        scheduler.close()
+        server.shutdown()
+        server.server_close()
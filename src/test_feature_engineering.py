@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from src.feature_engineering import engineer_features, feature_names
+
+
+def test_features_match_reindexed_pandas():
+    """
+    Lags, growth and rolling windows must match a per-country pandas
+    reference on a full year grid, including across missing years.
+    """
+
+    rng = np.random.default_rng(0)
+    panel = pd.DataFrame({
+        "iso3": np.repeat(["AUT", "BEL", "CZE"], 15),
+        "year": np.tile(np.arange(2000, 2015), 3),
+        "x": rng.normal(10.0, 2.0, 45),
+    })
+    panel = panel.drop(index=[4, 5, 20]).sample(frac=1.0, random_state=0)
+
+    config = {"x": {"lags": [1, 2], "growth": True, "windows": [3]}}
+    out = engineer_features(panel, config)
+    assert list(out.columns[-5:]) == feature_names(config)
+
+    for iso3, group in out.groupby("iso3"):
+        grid = group.set_index("year")["x"].reindex(range(2000, 2015))
+        expected = pd.DataFrame({
+            "x_lag1": grid.shift(1),
+            "x_lag2": grid.shift(2),
+            "x_growth": grid / grid.shift(1) - 1,
+            "x_roll3_mean": grid.rolling(3).mean(),
+            "x_roll3_std": grid.rolling(3).std(),
+        }).loc[group["year"]]
+
+        assert np.allclose(
+            group[expected.columns].to_numpy(), expected.to_numpy(), equal_nan=True
+        )
@@ -0,0 +1,134 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from src.fetch_scheduler import FetchScheduler, HostConfig
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.log.append(self.path)
+            hits = server.log.count(self.path)
+
+        if self.path == "/slow":
+            time.sleep(0.2)
+        if self.path == "/limited" and hits == 1:
+            self.send_response(429)
+            self.send_header("Retry-After", "0.3")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.lock = threading.Lock()
+    server.log = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_scheduler_priority_and_retry_after():
+    """
+    Queued requests to a busy host run in priority order, and a 429
+    is retried after Retry-After with the host's limits cut.
+    """
+
+    server, url = _start_server()
+
+    scheduler = FetchScheduler(
+        n_workers=2,
+        default_config=HostConfig(rate=100.0, burst=100.0, max_concurrency=1),
+    )
+    try:
+        # One request in flight blocks the host; the others queue up
+        slow = scheduler.submit(f"{url}/slow", priority=5)
+        time.sleep(0.05)
+        low = scheduler.submit(f"{url}/low", priority=9)
+        high = scheduler.submit(f"{url}/high", priority=0)
+        for future in (slow, low, high):
+            assert future.result(timeout=10).status_code == 200
+        assert server.log == ["/slow", "/high", "/low"]
+
+        start = time.monotonic()
+        response = scheduler.get(f"{url}/limited", timeout=5)
+        assert response.status_code == 200
+        assert time.monotonic() - start >= 0.3
+
+        stats = scheduler.stats().set_index("host").iloc[0]
+        assert stats["requests"] == 5
+        assert stats["rate_limited"] == 1
+        assert stats["retries"] == 1
+        assert stats["rate_limit"] < 100.0
+    finally:
+        scheduler.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_unexpected_errors_reach_the_caller():
+    """
+    A non-network exception fails only its own request: the future
+    raises it, the host slot is released and the worker keeps going.
+    """
+
+    server, url = _start_server()
+    scheduler = FetchScheduler(
+        n_workers=1,
+        default_config=HostConfig(rate=100.0, burst=100.0, max_concurrency=1),
+    )
+    try:
+        with pytest.raises(TypeError):
+            scheduler.submit(f"{url}/high", bogus=1).result(timeout=5)
+
+        assert scheduler.get(f"{url}/low", timeout=5).status_code == 200
+        assert all(worker.is_alive() for worker in scheduler._workers)
+        assert scheduler._hosts[url.split("//")[1]].in_flight == 0
+    finally:
+        scheduler.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_retried_responses_are_closed(monkeypatch):
+    """
+    A streamed 429 that is retried is closed, so its pooled connection
+    is released; the response handed to the caller stays open.
+    """
+
+    closed = []
+    close = requests.Response.close
+
+    def record_close(response):
+        closed.append(response.status_code)
+        close(response)
+
+    monkeypatch.setattr(requests.Response, "close", record_close)
+
+    server, url = _start_server()
+    scheduler = FetchScheduler(
+        n_workers=1,
+        default_config=HostConfig(rate=100.0, burst=100.0, max_concurrency=1),
+    )
+    try:
+        response = scheduler.get(f"{url}/limited", timeout=5, stream=True)
+        assert response.status_code == 200 and closed == [429]
+        assert response.raw.read() == b"ok"
+    finally:
+        scheduler.close()
+        server.shutdown()
+        server.server_close()
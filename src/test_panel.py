@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.panel import PanelCube
+
+
+def _frame():
+    return pd.DataFrame({
+        "iso3": ["BEL", "AUT", "AUT", "BEL", "AUT"],
+        "year": [2001, 2000, 2001, 2003, 2003],
+        "gdp": [5.0, 1.0, 2.0, np.nan, 3.0],
+        "fertility": [1.5, 1.4, 1.3, 1.6, np.nan],
+    })
+
+
+def test_cube_round_trip_lookup_and_slices():
+    """
+    from_frame / to_frame round-trip the rows, lookups address the
+    right cell, and label or range selections slice every axis.
+    """
+
+    df = _frame()
+    cube = PanelCube.from_frame(df)
+
+    assert cube.shape == (2, 4, 2)
+    expected = df.sort_values(["iso3", "year"]).reset_index(drop=True)
+    pd.testing.assert_frame_equal(cube.to_frame(), expected)
+
+    assert cube.get("BEL", 2001, "gdp") == 5.0
+    assert np.isnan(cube.get("AUT", 2002, "gdp"))
+    assert np.array_equal(cube.series("AUT", "gdp"), [1.0, 2.0, np.nan, 3.0], equal_nan=True)
+
+    window = cube.sel(years=(2001, 2002))
+    assert np.shares_memory(window.values, cube.values)
+    assert list(window.years) == [2001, 2002]
+
+    sub = cube.sel(countries=["BEL"], indicators=["fertility"])
+    assert sub.shape == (1, 4, 1)
+    assert sub.get("BEL", 2003, "fertility") == 1.6
+
+    rows, offsets = cube.locate(["BEL", "XXX"], [2003, 2003])
+    assert list(rows) == [1, -1] and list(offsets) == [3, 3]
+
+    with pytest.raises(ValueError):
+        PanelCube.from_frame(pd.concat([df, df.iloc[:1]]))
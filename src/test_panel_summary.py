@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+from src import panel_summary as ps
+from src.data_loader import BoundedCache
+
+
+def _reference(df, indicators):
+    """
+    Plain per-series groupby loop over the same metrics.
+    """
+    rows = []
+    for (iso3, indicator), series in (
+        df.melt(id_vars=["iso3", "year"], value_vars=indicators, var_name="indicator")
+        .dropna(subset=["value"])
+        .sort_values("year")
+        .groupby(["iso3", "indicator"])
+    ):
+        years = series["year"].to_numpy()
+        values = series["value"].to_numpy()
+        span = years[-1] - years[0]
+        consecutive = np.diff(years) == 1
+        growth = (values[1:] / values[:-1] - 1.0)[consecutive]
+        rows.append({
+            "iso3": iso3,
+            "indicator": indicator,
+            "first_year": years[0],
+            "last_year": years[-1],
+            "n_obs": len(years),
+            "missing_years": span + 1 - len(years),
+            "trend_slope": np.polyfit(years, values, 1)[0] if span > 0 else np.nan,
+            "cagr": (values[-1] / values[0]) ** (1.0 / span) - 1.0
+                    if span > 0 and values[0] > 0 and values[-1] > 0 else np.nan,
+            "volatility": pd.Series(growth).std(),
+        })
+    return pd.DataFrame(rows)
+
+
+def test_panel_summary_matches_groupby_and_cache_is_isolated():
+    """
+    The vectorised summary matches a per-series loop, and callers
+    cannot modify the cached table through the returned frame.
+    """
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "iso3": np.repeat(["AUT", "BEL", "DEU"], 12),
+        "year": np.tile(np.arange(2000, 2012), 3),
+        "gdp": rng.lognormal(10, 0.2, 36),
+        "rate": rng.normal(0, 1, 36),
+    })
+    df.loc[[3, 4, 15, 30], "gdp"] = np.nan
+    df.loc[12:22, "rate"] = np.nan
+
+    ps.clear_cache()
+    summary = ps.panel_summary(df)
+    expected = _reference(df, ["gdp", "rate"])
+
+    merged = summary.merge(expected, on=["iso3", "indicator"], suffixes=("", "_ref"))
+    assert len(merged) == len(summary) == 6
+    for column in ["first_year", "last_year", "n_obs", "missing_years",
+                   "trend_slope", "cagr", "volatility"]:
+        assert np.allclose(merged[column], merged[f"{column}_ref"], equal_nan=True), column
+
+    summary.loc[:, "mean"] = -1.0
+    again = ps.panel_summary(df)
+    assert (again["mean"] != -1.0).all()
+    assert len(ps._CACHE) == 1
+
+
+def test_bounded_cache_drops_least_recently_used():
+    """
+    The fingerprint caches keep only their most recently used entries.
+    """
+
+    cache = BoundedCache(2)
+    cache["a"], cache["b"] = 1, 2
+    assert cache["a"] == 1
+    cache["c"] = 3
+    assert list(cache) == ["a", "c"]
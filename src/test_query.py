@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from src.query import MasterIndex
+
+
+def test_indexed_queries_match_boolean_masks():
+    """
+    Country / year-range / column queries return the same rows as
+    boolean masks over the unsorted frame; single blocks share memory.
+    """
+
+    rng = np.random.default_rng(0)
+    countries = ["AUT", "BEL", "DEU", "FRA", "ITA"]
+    df = pd.DataFrame({
+        "iso3": np.repeat(countries, 10),
+        "year": np.tile(np.arange(2000, 2010), 5),
+        "gdp": rng.normal(size=50),
+        "fertility": rng.normal(size=50),
+    }).sample(frac=0.8, random_state=0)
+
+    index = MasterIndex(df)
+
+    def expected(isos, first, last, columns):
+        mask = df["iso3"].isin(isos) & df["year"].between(first, last)
+        return (
+            df.loc[mask, ["iso3", "year"] + columns]
+            .sort_values(["iso3", "year"]).reset_index(drop=True)
+        )
+
+    for isos, (first, last) in [
+        (["DEU"], (2003, 2007)),
+        (["FRA", "AUT", "XXX"], (2000, 2009)),
+        (countries, (2005, 2005)),
+        (["ITA"], (2020, 2030)),
+    ]:
+        result = index.query(isos, (first, last), columns=["gdp"])
+        pd.testing.assert_frame_equal(
+            result.reset_index(drop=True), expected(isos, first, last, ["gdp"])
+        )
+
+    block = index.query("BEL")
+    assert np.shares_memory(block["gdp"].to_numpy(), index.frame["gdp"].to_numpy())
+
+    row = index.row("AUT", int(index.query("AUT")["year"].iloc[0]))
+    assert row["iso3"] == "AUT"
@@ -0,0 +1,47 @@
+import json
+
+import pandas as pd
+
+from src import tracing
+from src.tracing import span, traced
+
+
+@traced("standardize/{name}", rows=len)
+def _standardize(df, name):
+    with span("inner", rows=len(df)):
+        return df.rename(columns={"value": name})
+
+
+def test_spans_record_nesting_rows_and_outputs(tmp_path):
+    """
+    Nested spans are recorded innermost first with their parent, row
+    counts and formatted names, in both JSON lines and Chrome format.
+    """
+
+    df = pd.DataFrame({"value": range(5)})
+
+    _standardize(df, "gdp")
+    assert not tracing.is_enabled()
+
+    jsonl, chrome = tmp_path / "trace.jsonl", tmp_path / "trace.json"
+    with tracing.tracing(jsonl, chrome, memory=True):
+        with span("outer"):
+            _standardize(df, "gdp")
+
+    names = [r["name"] for r in tracing.records()]
+    assert names == ["inner", "standardize/gdp", "outer"]
+
+    inner, middle, outer = tracing.records()
+    assert inner["parent"] == "standardize/gdp" and inner["depth"] == 2
+    assert middle["rows"] == 5 and middle["alloc_peak_mb"] >= 0
+    assert outer["wall_s"] >= middle["wall_s"] >= inner["wall_s"]
+
+    lines = [json.loads(line) for line in jsonl.read_text().splitlines()]
+    assert [r["name"] for r in lines] == names
+
+    events = json.loads(chrome.read_text())["traceEvents"]
+    assert [e["ph"] for e in events] == ["X"] * 3
+
+    # Disabled again: nothing new is recorded
+    _standardize(df, "gdp")
+    assert len(tracing.records()) == 3
@@ -0,0 +1,387 @@
+"""
+Pipeline Tracing
+----------------
+
+Structured per-stage timing and memory records for the pipeline.
+
+    with span("integrate/merge", rows=len(df)) as s:
+        ...
+        s.set(rows_out=len(merged))
+
+    @traced("standardize/{indicator_name}", rows=len)
+    def standardize_eurostat(df, indicator_name): ...
+
+Every finished span records:
+
+• wall_s / cpu_s   : wall-clock and process CPU time
+• max_rss_mb       : process peak resident set size so far
+• alloc_peak_mb    : peak Python allocation inside the span
+                     (only with memory=True; tracemalloc is slow)
+• rows and any other attributes passed to span() / set()
+
+Records are appended to a JSON lines file as spans finish and can
+also be written in Chrome trace format (chrome://tracing, Perfetto).
+
+Tracing is off by default. When disabled, span() returns a shared
+no-op object and @traced functions are called directly, so the
+instrumentation costs one attribute check per call.
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# =============================
+# Span Objects
+# =============================
+
+class _NullSpan:
+    """
+    Returned by span() while tracing is disabled.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def set(self, **attrs) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _max_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    scale = 1024 * 1024 if os.uname().sysname == "Darwin" else 1024
+    return rss / scale
+
+
+class Span:
+    """
+    One timed region; use through span() or @traced.
+    """
+
+    __slots__ = (
+        "tracer", "name", "category", "attrs",
+        "parent", "depth", "start", "start_cpu", "alloc_start", "alloc_peak",
+    )
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, attrs: Dict):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.attrs = attrs
+        self.alloc_peak = 0
+
+    def set(self, **attrs) -> None:
+        """
+        Attach attributes (e.g. rows=len(df)) to the record.
+        """
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        stack = self.tracer._stack()
+        self.parent = stack[-1] if stack else None
+        self.depth = len(stack)
+
+        if self.tracer.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # The parent keeps the peak reached before this child starts
+            if self.parent is not None:
+                self.parent.alloc_peak = max(self.parent.alloc_peak, peak)
+            tracemalloc.reset_peak()
+            self.alloc_start = current
+
+        stack.append(self)
+        self.start_cpu = time.process_time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        end = time.perf_counter()
+        end_cpu = time.process_time()
+        self.tracer._stack().pop()
+
+        record = {
+            "name": self.name,
+            "category": self.category,
+            "parent": self.parent.name if self.parent else None,
+            "depth": self.depth,
+            "start_s": self.start - self.tracer.origin,
+            "wall_s": end - self.start,
+            "cpu_s": end_cpu - self.start_cpu,
+            "max_rss_mb": _max_rss_mb(),
+        }
+
+        if self.tracer.memory:
+            peak = max(self.alloc_peak, tracemalloc.get_traced_memory()[1])
+            record["alloc_peak_mb"] = (peak - self.alloc_start) / 2**20
+            # Not reset: the parent's peak must still include this span
+
+        if exc_type is not None:
+            record["error"] = exc_type.__name__
+
+        record["pid"] = os.getpid()
+        record["tid"] = threading.get_ident()
+        record.update(self.attrs)
+
+        self.tracer._emit(record)
+
+
+# =============================
+# Tracer
+# =============================
+
+class Tracer:
+    """
+    Collects span records and writes them out.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.memory = False
+        self.origin = time.perf_counter()
+        self.records: List[Dict[str, Any]] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._jsonl = None
+        self._chrome_path: Optional[Path] = None
+        self._started_tracemalloc = False
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _emit(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self.records.append(record)
+            if self._jsonl is not None:
+                self._jsonl.write(json.dumps(record, default=str) + "\n")
+                self._jsonl.flush()
+
+    def enable(
+        self,
+        path: Optional[Path] = None,
+        chrome_path: Optional[Path] = None,
+        memory: bool = False,
+    ) -> None:
+        self.disable()
+
+        self.records = []
+        self.origin = time.perf_counter()
+        self.memory = memory
+        self._chrome_path = Path(chrome_path) if chrome_path else None
+
+        if path is not None:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._jsonl = open(path, "w")
+
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+        self.enabled = True
+
+    def disable(self) -> None:
+        if not self.enabled:
+            return
+        self.enabled = False
+
+        if self._jsonl is not None:
+            self._jsonl.close()
+            self._jsonl = None
+        if self._chrome_path is not None:
+            write_chrome_trace(self._chrome_path, self.records)
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+
+_TRACER = Tracer()
+
+
+# =============================
+# Public API
+# =============================
+
+def enable(
+    path: Optional[Path] = None,
+    chrome_path: Optional[Path] = None,
+    memory: bool = False,
+) -> None:
+    """
+    Start tracing.
+
+    Args:
+        path: JSON lines file, one record per finished span.
+        chrome_path: Chrome trace file, written on disable().
+        memory: Also record peak Python allocation per span
+                (tracemalloc; slows allocation-heavy code).
+    """
+    _TRACER.enable(path, chrome_path, memory)
+
+
+def disable() -> None:
+    """
+    Stop tracing and flush the outputs.
+    """
+    _TRACER.disable()
+
+
+def is_enabled() -> bool:
+    return _TRACER.enabled
+
+
+def records() -> List[Dict[str, Any]]:
+    """
+    Records of the current (or last) tracing session.
+    """
+    return list(_TRACER.records)
+
+
+def span(name: str, category: str = "stage", **attrs):
+    """
+    Context manager timing the enclosed block.
+    """
+    if not _TRACER.enabled:
+        return _NULL_SPAN
+    return Span(_TRACER, name, category, attrs)
+
+
+def traced(
+    name: Optional[str] = None,
+    category: str = "stage",
+    rows: Union[str, Callable[[Any], int], None] = None,
+) -> Callable:
+    """
+    Decorator form of span().
+
+    Args:
+        name: Span name; may reference the call's arguments,
+              e.g. "standardize/{indicator_name}". Defaults to the
+              function's qualified name.
+        rows: Row count to record: the name of an argument (its
+              len() is taken) or a callable applied to the return
+              value (e.g. len).
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+        needs_arguments = "{" in span_name or isinstance(rows, str)
+        signature = inspect.signature(func) if needs_arguments else None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _TRACER.enabled:
+                return func(*args, **kwargs)
+
+            label, attrs = span_name, {}
+            if signature is not None:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                label = span_name.format(**bound.arguments)
+                if isinstance(rows, str):
+                    attrs["rows"] = len(bound.arguments[rows])
+
+            with Span(_TRACER, label, category, attrs) as s:
+                result = func(*args, **kwargs)
+                if callable(rows):
+                    s.set(rows=rows(result))
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def tracing(
+    path: Optional[Path] = None,
+    chrome_path: Optional[Path] = None,
+    memory: bool = False,
+):
+    """
+    enable() for the duration of a block.
+    """
+    enable(path, chrome_path, memory)
+    try:
+        yield _TRACER
+    finally:
+        disable()
+
+
+# =============================
+# Output
+# =============================
+
+def write_chrome_trace(path: Path, trace_records: List[Dict[str, Any]]) -> None:
+    """
+    Write records as Chrome trace "complete" events (microseconds).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    skip = {"name", "category", "start_s", "wall_s", "pid", "tid"}
+    events = [
+        {
+            "name": record["name"],
+            "cat": record["category"],
+            "ph": "X",
+            "ts": record["start_s"] * 1e6,
+            "dur": record["wall_s"] * 1e6,
+            "pid": record["pid"],
+            "tid": record["tid"],
+            "args": {k: v for k, v in record.items() if k not in skip},
+        }
+        for record in trace_records
+    ]
+
+    path.write_text(json.dumps({"traceEvents": events}, default=str))
+
+
+def summarize(trace_records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Total wall / CPU time and calls per span name, slowest first.
+    """
+    df = pd.DataFrame(trace_records)
+    if df.empty:
+        return df
+
+    aggregations = {"calls": ("wall_s", "size"), "wall_s": ("wall_s", "sum"),
+                    "cpu_s": ("cpu_s", "sum"), "max_rss_mb": ("max_rss_mb", "max")}
+    if "alloc_peak_mb" in df.columns:
+        aggregations["alloc_peak_mb"] = ("alloc_peak_mb", "max")
+    if "rows" in df.columns:
+        aggregations["rows"] = ("rows", lambda rows: rows.sum(min_count=1))
+
+    return (
+        df.groupby(["depth", "name"], sort=False).agg(**aggregations)
+        .reset_index().sort_values("wall_s", ascending=False)
+        .reset_index(drop=True)
+    )
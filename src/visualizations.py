@@ -9,6 +9,7 @@ Design Principles:
 - Controls DPI for stability
 - Samples large datasets safely
 - Closes figures after saving (prevents memory leaks)
+- Reuses one figure for small multiples (no per-panel figure/savefig)
 """
 
 # ---------------------------------------------------------------------
@@ -21,8 +22,16 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+from matplotlib.backends.backend_pdf import PdfPages
 from scipy.stats import gaussian_kde
 
+from src.correlation import compute_correlations
+from src.data_loader import EU_REGIONS
+from src.panel import panel_cube
+from src.query import MasterIndex
+from src.tracing import span
+
 
 # ---------------------------------------------------------------------
 # Global Plot Configuration
@@ -30,6 +39,10 @@ from scipy.stats import gaussian_kde
 plt.rcParams["figure.dpi"] = 100
 plt.rcParams["font.size"] = 10
 
+# Country report grid: widest row of panels and rows per page
+MAX_REPORT_COLUMNS = 5
+REPORT_ROWS = 4
+
 
 # ---------------------------------------------------------------------
 # Safe Save Function
@@ -57,8 +70,8 @@ def save_figure(fig, output_path: Path) -> None:
 # ---------------------------------------------------------------------
 def plot_correlation(df: pd.DataFrame, figures_dir: Path) -> None:
 
-    numeric_df = df.select_dtypes(include=[np.number]).drop(columns=["year"], errors="ignore")
-    corr = numeric_df.corr()
+    # Cached pairwise-complete matrix shared with the correlation reports
+    corr = compute_correlations(df, method="pearson").to_frame()
 
     fig, ax = plt.subplots(figsize=(10, 8))
     cax = ax.imshow(corr, cmap="coolwarm", aspect="auto")
@@ -82,11 +95,15 @@ def plot_trends(df: pd.DataFrame, figures_dir: Path) -> None:
 
     fig, ax = plt.subplots(figsize=(10, 6))
 
-    for iso in df["iso3"].unique():
-        country_data = df[df["iso3"] == iso].sort_values("year")
+    # One (year,) view per country from the dense panel instead of
+    # filtering the frame by iso3 for every line
+    cube = panel_cube(df, ["life_expectancy"])
+    years = cube.years.labels
+    for c in range(len(cube.countries)):
+        rows = cube.present[c]
         ax.plot(
-            country_data["year"],
-            country_data["life_expectancy"],
+            years[rows],
+            cube.values[c, rows, 0],
             linewidth=1,
             alpha=0.7
         )
@@ -186,6 +203,219 @@ def plot_distribution(df: pd.DataFrame, figures_dir: Path) -> None:
     save_figure(fig, figures_dir / "life_expectancy_distribution")
 
 
+# ---------------------------------------------------------------------
+# 6. Small Multiples (Batched Country Reports)
+# ---------------------------------------------------------------------
+# A panel is (title, x values, y values)
+Panel = Tuple[str, np.ndarray, np.ndarray]
+
+
+def build_country_panels(
+    df: pd.DataFrame,
+    indicators: Optional[Sequence[str]] = None
+) -> List[Panel]:
+    """
+    Build one trend panel per (country, indicator).
+
+    Countries are ordered by region then ISO3 so that consecutive
+    pages cover one region at a time. Series are sliced from the
+    country blocks of one MasterIndex instead of filtering the
+    DataFrame per country.
+    """
+
+    if indicators is None:
+        indicators = [
+            col for col in df.select_dtypes(include=[np.number]).columns
+            if col != "year"
+        ]
+
+    # Contiguous (iso3, year)-sorted row block per country
+    index = MasterIndex(df)
+    years = index.frame["year"].to_numpy(dtype=np.float64)
+    values = index.frame[list(indicators)].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    countries = sorted(index.countries, key=lambda iso: (EU_REGIONS.get(iso, "Other"), iso))
+
+    panels = []
+    for iso in countries:
+        start, end = index.country_bounds(iso)
+        for j, indicator in enumerate(indicators):
+            panels.append((
+                f"{iso} - {indicator}",
+                years[start:end],
+                values[start:end, j],
+            ))
+
+    return panels
+
+
+def render_small_multiples(
+    panels: Sequence[Optional[Panel]],
+    output_path: Path,
+    nrows: int = 4,
+    ncols: int = 4,
+    fmt: str = "pdf",
+    page_title: str = "Country Trends",
+) -> int:
+    """
+    Render panels onto pages of an nrows x ncols grid.
+
+    One figure, one line and one title per axes are created up front;
+    every page only swaps line data and title text in place. Each panel
+    is rescaled to [0, 1] on a fixed y-axis (its range is printed in the
+    title), so tick layout never changes between pages. For PNG output
+    the static background is rendered once and restored per page, and
+    only the lines and titles are redrawn.
+
+    Args:
+        panels: Sequence of (title, x, y) panels; None leaves a slot
+                empty (e.g. to start each country on a new row).
+        output_path: Target file. With fmt='pdf' all pages go into one
+                     multi-page PDF; with fmt='png' pages are written as
+                     <stem>_page_001.png, <stem>_page_002.png, ...
+        nrows, ncols: Grid size per page.
+        fmt: 'pdf' or 'png'.
+        page_title: Title prefix shown on each page.
+
+    Returns:
+        Number of pages written.
+    """
+
+    if fmt not in ("pdf", "png"):
+        raise ValueError(f"Unsupported format: '{fmt}'")
+
+    per_page = nrows * ncols
+    n_pages = int(np.ceil(len(panels) / per_page))
+    if n_pages == 0:
+        return 0
+
+    # Shared x-range across all panels
+    x_all = np.concatenate([panel[1] for panel in panels if panel is not None])
+    x_min, x_max = np.nanmin(x_all), np.nanmax(x_all)
+
+    fig, axes = plt.subplots(
+        nrows, ncols,
+        figsize=(2.6 * ncols, 1.9 * nrows),
+        sharex=True,
+        squeeze=False
+    )
+    axes = axes.ravel()
+    fig.subplots_adjust(
+        left=0.03, right=0.99, bottom=0.06, top=0.90,
+        hspace=0.45, wspace=0.08
+    )
+
+    lines, titles = [], []
+    for ax in axes:
+        ax.set_xlim(x_min, x_max)
+        ax.set_ylim(-0.05, 1.05)
+        ax.set_yticks([])
+        ax.tick_params(labelsize=7)
+        ax.xaxis.set_major_locator(plt.MaxNLocator(3, integer=True))
+
+        lines.append(ax.plot([], [], linewidth=1.2, animated=fmt == "png")[0])
+        titles.append(ax.text(
+            0.5, 1.03, "", transform=ax.transAxes, fontsize=7,
+            ha="center", va="bottom", animated=fmt == "png"
+        ))
+
+    suptitle = fig.suptitle("", animated=fmt == "png")
+
+    output_path = Path(output_path)
+    pdf = PdfPages(output_path.with_suffix(".pdf")) if fmt == "pdf" else None
+    canvas = fig.canvas
+    background = None
+
+    try:
+        for page in range(n_pages):
+            page_panels = panels[page * per_page:(page + 1) * per_page]
+
+            for line, text, panel in zip(lines, titles, page_panels):
+                if panel is None:
+                    continue
+                title, x, y = panel
+
+                finite = y[np.isfinite(y)]
+                low, high = (finite.min(), finite.max()) if finite.size else (0.0, 1.0)
+                extent = high - low if high > low else 1.0
+
+                line.set_data(x, (y - low) / extent)
+                text.set_text(f"{title}\n[{low:.4g} – {high:.4g}]")
+
+            suptitle.set_text(f"{page_title} ({page + 1}/{n_pages})")
+
+            # Hide empty slots and unused slots on a short last page
+            visible = [i < len(page_panels) and page_panels[i] is not None
+                       for i in range(per_page)]
+            short_page = not all(visible)
+            for ax, shown in zip(axes, visible):
+                ax.set_visible(shown)
+
+            if pdf is not None:
+                pdf.savefig(fig, facecolor="white")
+                continue
+
+            page_path = output_path.with_name(
+                f"{output_path.stem}_page_{page + 1:03d}.png"
+            )
+
+            if background is None or short_page:
+                canvas.draw()
+                if not short_page:
+                    background = canvas.copy_from_bbox(fig.bbox)
+            else:
+                canvas.restore_region(background)
+
+            for ax, line, text in zip(axes, lines, titles):
+                if ax.get_visible():
+                    ax.draw_artist(line)
+                    ax.draw_artist(text)
+            fig.draw_artist(suptitle)
+
+            plt.imsave(page_path, np.asarray(canvas.buffer_rgba()))
+    finally:
+        if pdf is not None:
+            pdf.close()
+        plt.close(fig)
+
+    return n_pages
+
+
+def plot_country_reports(df: pd.DataFrame, figures_dir: Path) -> None:
+    """
+    Write one multi-page PDF with a trend panel per country and indicator.
+
+    Every country starts on a new row and fills whole rows of at most
+    MAX_REPORT_COLUMNS panels, so pages stay readable however many
+    indicators there are.
+    """
+
+    panels = build_country_panels(df)
+    indicators_per_country = max(len(panels) // max(df["iso3"].nunique(), 1), 1)
+
+    # Spread each country evenly over as few rows as the cap allows
+    rows_per_country = int(np.ceil(indicators_per_country / MAX_REPORT_COLUMNS))
+    ncols = int(np.ceil(indicators_per_country / rows_per_country))
+    nrows = rows_per_country * max(REPORT_ROWS // rows_per_country, 1)
+
+    # Pad every country to whole rows
+    slots = rows_per_country * ncols
+    padded = []
+    for start in range(0, len(panels), indicators_per_country):
+        country = panels[start:start + indicators_per_country]
+        padded += country + [None] * (slots - len(country))
+
+    output_path = figures_dir / "country_trends.pdf"
+    n_pages = render_small_multiples(
+        padded,
+        output_path,
+        nrows=nrows,
+        ncols=ncols,
+    )
+
+    print(f"✓ Saved: {output_path} ({n_pages} pages, {len(panels)} panels)")
+
+
 # ---------------------------------------------------------------------
 # Main Visualisation Runner
 # ---------------------------------------------------------------------
@@ -198,11 +428,16 @@ def run_visualisations(df: pd.DataFrame) -> None:
     figures_dir = Path(__file__).parent.parent / "data" / "figures"
     figures_dir.mkdir(parents=True, exist_ok=True)
 
-    plot_correlation(df, figures_dir)
-    plot_trends(df, figures_dir)
-    plot_gdp_relationship(df, figures_dir)
-    plot_fertility_relationship(df, figures_dir)
-    plot_distribution(df, figures_dir)
+    for plot in (
+        plot_correlation,
+        plot_trends,
+        plot_gdp_relationship,
+        plot_fertility_relationship,
+        plot_distribution,
+        plot_country_reports,
+    ):
+        with span(f"figure/{plot.__name__}", rows=len(df)):
+            plot(df, figures_dir)
 
     plt.close("all")
 
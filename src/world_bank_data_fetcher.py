@@ -2,6 +2,7 @@
 Module for fetching indicator data from the World Bank API.
 """
 
+import os
 from pathlib import Path
 from typing import Dict, Any, List
 
@@ -9,6 +10,13 @@ import requests
 import pandas as pd
 from pathlib import Path
 
+from src.fetch_scheduler import scheduled_get
+from src.tracing import span
+
+# Base URL of the API; override with the WORLD_BANK_API_URL environment
+# variable (or this attribute) to use a local stand-in
+WORLD_BANK_API_URL = os.environ.get("WORLD_BANK_API_URL", "https://api.worldbank.org/v2")
+
 # List of EU ISO3 country codes
 # These codes will be joined using ";" in the API request
 EU_ISO3 = [
@@ -42,11 +50,11 @@ def fetch_worldbank_indicator(indicator_code: str, filename: str) -> pd.DataFram
     countries = ";".join(EU_ISO3)
 
     # Construct API URL
-    url = f"https://api.worldbank.org/v2/country/{countries}/indicator/{indicator_code}"
+    url = f"{WORLD_BANK_API_URL.rstrip('/')}/country/{countries}/indicator/{indicator_code}"
 
     # Request parameters:
     # - format=json → return JSON format
-    # - per_page=20000 → retrieve all results in one request
+    # - per_page=20000 → usually all results in one request
     params = {
         "format": "json",
         "per_page": 20000
@@ -60,29 +68,38 @@ def fetch_worldbank_indicator(indicator_code: str, filename: str) -> pd.DataFram
     #print(f"Requesting indicator: {indicator_code}")
     #print("URL:", url)
 
-    # Make API request
-    # Timeout set to 120 seconds because API response is slow
-    response = requests.get(
-        url,
-        params=params,
-        headers=headers,
-        timeout=120
-    )
-
-    # Raise exception if HTTP request failed (e.g., 500, 502 errors)
-    response.raise_for_status()
-
-    # Parse JSON response
-    # World Bank returns:
-    # data[0] → metadata
-    # data[1] → actual records
-    data = response.json()
-
-    # Ensure response format is valid
-    if len(data) < 2:
-        raise ValueError("Unexpected API response format")
-
-    records = data[1]
+    # Make API requests through the shared scheduler (rate limit and
+    # retries per host), following pages when the result does not fit
+    # in one (data[0]["pages"] > 1)
+    records = []
+    page, pages = 1, 1
+    while page <= pages:
+        # Timeout set to 120 seconds because API response is slow
+        with span("http/worldbank", category="io", indicator=indicator_code, page=page) as s:
+            response = scheduled_get(
+                url,
+                params={**params, "page": page},
+                headers=headers,
+                timeout=120
+            )
+            s.set(bytes=len(response.content), status=response.status_code)
+
+        # Raise exception if HTTP request failed (e.g., 500, 502 errors)
+        response.raise_for_status()
+
+        # Parse JSON response
+        # World Bank returns:
+        # data[0] → metadata (page, pages, per_page, total)
+        # data[1] → actual records
+        data = response.json()
+
+        # Ensure response format is valid
+        if len(data) < 2:
+            raise ValueError("Unexpected API response format")
+
+        records.extend(data[1] or [])
+        pages = int(data[0].get("pages", 1))
+        page += 1
 
     # Convert JSON records to pandas DataFrame
     df = pd.DataFrame(records)